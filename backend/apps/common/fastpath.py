@@ -0,0 +1,318 @@
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Prefetch
+from rest_framework import relations, serializers
+from rest_framework.fields import SkipField, empty
+
+PARENT_KEY = "fastpath_parent"
+
+
+class NotCompilable(Exception):
+    """The serializer uses a feature the fast path cannot reproduce exactly."""
+
+
+@dataclass
+class ComputedSource:
+    """Model attribute derived from columns, e.g. User.full_name."""
+
+    columns: tuple
+    compute: callable
+
+
+@dataclass
+class ValuePlan:
+    name: str
+    key: str
+    represent: callable
+    null_key: str | None = None
+    field: serializers.Field | None = None
+    compute: callable = None
+    compute_keys: tuple = ()
+
+    def missing(self):
+        """What DRF renders when a dotted source hits a NULL relation."""
+        if self.field.default is not empty:
+            return self._render(self.field.get_default())
+        if self.field.allow_null:
+            return None
+        raise SkipField()
+
+    def _render(self, value):
+        return None if value is None else self.represent(value)
+
+    def render(self, row):
+        if self.null_key and row[self.null_key] is None:
+            return self.missing()
+        if self.compute:
+            return self._render(self.compute(*(row[key] for key in self.compute_keys)))
+        return self._render(row[self.key])
+
+
+@dataclass
+class RelationPlan:
+    name: str
+    lookup: str
+    plan: "SerializerPlan"
+
+
+@dataclass
+class SerializerPlan:
+    model: type
+    entries: list = field(default_factory=list)
+    columns: set = field(default_factory=set)
+
+    @property
+    def pk_key(self) -> str:
+        return self.model._meta.pk.attname
+
+
+class CompiledSerializer:
+    """
+    Read-only rendering of a ModelSerializer tree from `.values()` rows.
+
+    The plan reuses each DRF field's `to_representation`, so values are
+    formatted exactly as the serializer would, but skips model instances,
+    nested serializer calls and per-attribute lookups. Nested relations are
+    fetched with one `.values()` query per level, reusing the Prefetch
+    querysets (filters, ordering, annotations) of the queryset passed in.
+    """
+
+    def __init__(self, plan: SerializerPlan):
+        self.plan = plan
+
+    def values(self, queryset, *extra_columns):
+        """The `.values()` queryset holding every column the plan reads."""
+        return self._values(self.plan, queryset, extra_columns)
+
+    def render(self, queryset) -> list:
+        return self.render_rows(self.values(queryset), queryset)
+
+    def render_one(self, queryset):
+        rows = self.render(queryset)
+        return rows[0] if rows else None
+
+    def render_rows(self, rows, queryset) -> list:
+        """
+        Render rows from `values()` (e.g. a paginated page); `queryset` is
+        the model queryset they came from, which supplies nested Prefetches.
+        """
+        return self._build(self.plan, list(rows), queryset)
+
+    def _values(self, plan, queryset, extra_columns=()):
+        columns = sorted(plan.columns | {plan.pk_key} | set(extra_columns))
+        return queryset.prefetch_related(None).values(*columns)
+
+    def _build(self, plan, rows, queryset) -> list:
+        nested = {}
+        ids = [row[plan.pk_key] for row in rows]
+        for entry in plan.entries:
+            if isinstance(entry, RelationPlan) and ids:
+                nested[entry.name] = self._children(plan, entry, queryset, ids)
+
+        output = []
+        for row in rows:
+            data = {}
+            for entry in plan.entries:
+                if isinstance(entry, RelationPlan):
+                    data[entry.name] = nested[entry.name].get(row[plan.pk_key], [])
+                    continue
+                try:
+                    data[entry.name] = entry.render(row)
+                except SkipField:
+                    continue
+            output.append(data)
+        return output
+
+    def _children(self, plan, entry, queryset, ids) -> dict:
+        relation = plan.model._meta.get_field(entry.lookup)
+        children = self._base_queryset(queryset, entry)
+        if relation.many_to_many:
+            query_name = relation.related_query_name()
+        else:
+            query_name = relation.field.name
+        children = children.filter(**{f"{query_name}__in": ids}).annotate(
+            **{PARENT_KEY: F(query_name)}
+        )
+
+        rows = list(self._values(entry.plan, children, [PARENT_KEY]))
+        grouped = defaultdict(list)
+        for row, child in zip(rows, self._build(entry.plan, rows, children)):
+            grouped[row[PARENT_KEY]].append(child)
+        return grouped
+
+    def _base_queryset(self, queryset, entry):
+        """The queryset DRF would iterate: the Prefetch one, else the manager."""
+        for lookup in queryset._prefetch_related_lookups:
+            if isinstance(lookup, Prefetch) and lookup.prefetch_through == entry.lookup:
+                if lookup.queryset is not None:
+                    return lookup.queryset
+        return entry.plan.model._default_manager.all()
+
+
+class SerializerCompiler:
+    """
+    Builds and caches CompiledSerializer plans per serializer and field set.
+
+    Field sets come from the query string, so they are keyed by the fields
+    the serializer actually has (unknown names drop out) and only the
+    `max_plans` most recently used plans are kept.
+    """
+
+    def __init__(self, max_plans: int = 256):
+        self._computed = {}
+        self._plans = OrderedDict()
+        self._shapes = {}
+        self._lock = threading.Lock()
+        self.max_plans = max_plans
+
+    def register_computed(self, model, attr: str, columns, compute) -> None:
+        self._computed[(model, attr)] = ComputedSource(tuple(columns), compute)
+
+    def compile(self, serializer_class, context=None) -> CompiledSerializer:
+        context = context or {}
+        selection = context.get("field_selection")
+        cache_key = (serializer_class, self.selection_key(serializer_class, selection))
+        with self._lock:
+            plan = self._plans.get(cache_key)
+            if plan is not None:
+                self._plans.move_to_end(cache_key)
+        if plan is None:
+            serializer = serializer_class(context=context)
+            try:
+                plan = self._plan(serializer, serializer.Meta.model)
+            except NotCompilable as exc:
+                plan = exc
+            with self._lock:
+                self._plans[cache_key] = plan
+                while len(self._plans) > self.max_plans:
+                    self._plans.popitem(last=False)
+        if isinstance(plan, NotCompilable):
+            raise plan
+        return CompiledSerializer(plan)
+
+    def selection_key(self, serializer_class, selection) -> str:
+        """
+        Canonical form of `selection` for `serializer_class`: equal for
+        selections that render the same fields, whatever their spelling.
+        """
+        if not selection:
+            return "*"
+        return selection.shape_key(self._shape(serializer_class))
+
+    def _shape(self, serializer_class) -> dict:
+        """{field name: nested shape, or None for a value} of the full serializer."""
+        shape = self._shapes.get(serializer_class)
+        if shape is None:
+            shape = self._shapes[serializer_class] = self._fields_shape(
+                serializer_class(context={})
+            )
+        return shape
+
+    def _fields_shape(self, serializer) -> dict:
+        shape = {}
+        for drf_field in serializer._readable_fields:
+            nested = getattr(drf_field, "child", drf_field)
+            shape[drf_field.field_name] = (
+                self._fields_shape(nested)
+                if isinstance(nested, serializers.BaseSerializer)
+                else None
+            )
+        return shape
+
+    # ==================== Planning ====================
+
+    def _plan(self, serializer, model) -> SerializerPlan:
+        plan = SerializerPlan(model=model)
+        for drf_field in serializer._readable_fields:
+            nested = getattr(drf_field, "child", drf_field)
+            if isinstance(nested, serializers.BaseSerializer):
+                plan.entries.append(self._relation(drf_field, nested, model))
+            else:
+                value = self._value(drf_field, model)
+                plan.entries.append(value)
+                plan.columns.update(key for key in (value.key, value.null_key) if key)
+                plan.columns.update(value.compute_keys)
+        return plan
+
+    def _relation(self, drf_field, nested, model) -> RelationPlan:
+        if not isinstance(drf_field, serializers.ListSerializer) or not isinstance(
+            nested, serializers.ModelSerializer
+        ):
+            raise NotCompilable(f"{drf_field.field_name}: only many=True nesting")
+        relation = model._meta.get_field(drf_field.source)
+        if not (relation.one_to_many or (relation.many_to_many and relation.concrete)):
+            raise NotCompilable(f"{drf_field.field_name}: unsupported relation")
+        return RelationPlan(
+            name=drf_field.field_name,
+            lookup=drf_field.source,
+            plan=self._plan(nested, nested.Meta.model),
+        )
+
+    def _value(self, drf_field, model) -> ValuePlan:
+        if isinstance(
+            drf_field,
+            (
+                relations.RelatedField,
+                relations.ManyRelatedField,
+                serializers.SerializerMethodField,
+            ),
+        ):
+            raise NotCompilable(f"{drf_field.field_name}: needs model instances")
+
+        attrs = drf_field.source_attrs
+        plan = ValuePlan(
+            name=drf_field.field_name,
+            key="__".join(attrs),
+            represent=drf_field.to_representation,
+            field=drf_field,
+        )
+        if len(attrs) == 1:
+            return self._local_value(plan, model, attrs[0])
+        if len(attrs) == 2:
+            return self._related_value(plan, model, *attrs)
+        raise NotCompilable(f"{drf_field.field_name}: source too deep")
+
+    def _local_value(self, plan, model, attr) -> ValuePlan:
+        model_field = self._model_field(model, attr)
+        if model_field is None:
+            if hasattr(model, attr):
+                raise NotCompilable(f"{plan.name}: {attr} is not a column")
+            return plan  # A queryset annotation.
+        if model_field.is_relation:
+            raise NotCompilable(f"{plan.name}: renders a related object")
+        plan.key = model_field.attname
+        return plan
+
+    def _related_value(self, plan, model, relation_name, attr) -> ValuePlan:
+        relation = self._model_field(model, relation_name)
+        if relation is None or not (relation.many_to_one or relation.one_to_one):
+            raise NotCompilable(f"{plan.name}: unsupported relation")
+        if not relation.concrete:
+            raise NotCompilable(f"{plan.name}: reverse one-to-one")
+        plan.null_key = relation.attname
+
+        related = relation.related_model
+        computed = self._computed.get((related, attr))
+        if computed:
+            plan.key = None
+            plan.compute = computed.compute
+            plan.compute_keys = tuple(
+                f"{relation_name}__{column}" for column in computed.columns
+            )
+            return plan
+        model_field = self._model_field(related, attr)
+        if model_field is None or model_field.is_relation:
+            raise NotCompilable(f"{plan.name}: {attr} is not a column")
+        return plan
+
+    def _model_field(self, model, name):
+        try:
+            return model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+
+
+serializer_compiler = SerializerCompiler()
@@ -0,0 +1,160 @@
+import json
+import operator
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from functools import reduce
+from types import SimpleNamespace
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Forward-only keyset (seek) pagination.
+
+    Rows are ordered by `ordering` plus the primary key as a tie-breaker, and
+    the cursor carries the ordering values of the last row served. The next
+    page is selected with a WHERE clause on those values instead of OFFSET,
+    so deep pages cost the same as the first one.
+    """
+
+    ordering = ("-created_at",)
+    page_size = api_settings.PAGE_SIZE or 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        queryset = self.order_queryset(queryset)
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self._after(position))
+
+        rows = list(queryset[: self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict([("next", self.get_next_link()), ("results", data)])
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            requested = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if requested <= 0:
+            return self.page_size
+        return min(requested, self.max_page_size)
+
+    def order_queryset(self, queryset):
+        """Apply the pagination order, primary key tie-breaker included."""
+        self.keys = self.get_keys(queryset.model)
+        return queryset.order_by(*self._order_by())
+
+    def get_key_columns(self, model) -> list:
+        """Attribute names a page row must carry to build the next cursor."""
+        return [field.attname for field, _ in self.get_keys(model)]
+
+    def get_keys(self, model) -> list:
+        """Return (field, descending) for each ordering column plus the pk."""
+        keys = []
+        for name in self.ordering:
+            descending = name.startswith("-")
+            field = model._meta.get_field(name.lstrip("-"))
+            keys.append((field, descending))
+        keys.append((model._meta.pk, keys[-1][1] if keys else False))
+        return keys
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        if isinstance(last, dict):
+            # `.values()` rows, e.g. from the compiled serializer fast path.
+            last = SimpleNamespace(**last)
+        position = []
+        for field, _ in self.keys:
+            value = getattr(last, field.attname)
+            position.append(None if value is None else field.value_to_string(last))
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(position)
+        )
+
+    # ==================== Cursor encoding ====================
+
+    def encode_cursor(self, position: list) -> str:
+        raw = json.dumps(position, separators=(",", ":")).encode()
+        return urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            position = json.loads(urlsafe_b64decode(padded.encode()))
+            if not isinstance(position, list) or len(position) != len(self.keys):
+                raise ValueError
+            return [
+                None if value is None else field.to_python(value)
+                for (field, _), value in zip(self.keys, position)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    # ==================== Query building ====================
+
+    def _order_by(self) -> list:
+        order_by = []
+        for field, descending in self.keys:
+            # Only nullable columns need NULLS LAST; keep plain ordering
+            # elsewhere so the database can walk the column's index.
+            nulls_last = True if field.null else None
+            expression = F(field.name)
+            if descending:
+                expression = expression.desc(nulls_last=nulls_last)
+            else:
+                expression = expression.asc(nulls_last=nulls_last)
+            order_by.append(expression)
+        return order_by
+
+    def _after(self, position: list) -> Q:
+        """Rows strictly after `position` in (ordering..., pk) order, NULLs last."""
+        branches = []
+        prefix = Q()
+        for (field, descending), value in zip(self.keys, position):
+            name = field.name
+            if value is None:
+                # Nothing sorts after NULL except ties on later keys.
+                prefix &= Q(**{f"{name}__isnull": True})
+                continue
+            lookup = "lt" if descending else "gt"
+            beyond = Q(**{f"{name}__{lookup}": value})
+            if field.null:
+                beyond |= Q(**{f"{name}__isnull": True})
+            branches.append(prefix & beyond)
+            prefix &= Q(**{name: value})
+        return reduce(operator.or_, branches)
@@ -0,0 +1,91 @@
+import os
+import re
+
+from django.http import FileResponse, HttpResponse
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+class FileRange:
+    """
+    Bytes `start`..`end` inclusive of an open file, for FileResponse. Reads
+    stop at `end`; `fileno`, with the file positioned at `start`, lets a WSGI
+    server's file_wrapper sendfile the range (bounded by Content-Length)
+    without copying it through Python.
+    """
+
+    def __init__(self, file, start: int, end: int):
+        self.file = file
+        self.file.seek(start)
+        self.remaining = end - start + 1
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def parse_byte_range(header: str, size: int) -> tuple | None:
+    """
+    (start, end) inclusive for a single-range `Range` header, or None when
+    the whole file should be sent (no header, or one this does not handle,
+    such as multiple ranges, which RFC 9110 allows a server to ignore).
+    """
+    match = RANGE_PATTERN.match((header or "").strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        # Suffix range: the final `last` bytes.
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise RangeNotSatisfiable
+    return start, end
+
+
+def ranged_file_response(request, path, content_type: str, etag=None):
+    """
+    Serve `path` through FileResponse, so the WSGI server can use sendfile:
+    whole, or for a single satisfiable range as a 206 of just those bytes.
+    """
+    size = os.path.getsize(path)
+    header = request.META.get("HTTP_RANGE", "")
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if if_range and if_range != etag:
+        header = ""
+    try:
+        byte_range = parse_byte_range(header, size)
+    except RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response.headers["Content-Range"] = f"bytes */{size}"
+    else:
+        if byte_range is None:
+            response = FileResponse(open(path, "rb"), content_type=content_type)
+        else:
+            start, end = byte_range
+            response = FileResponse(
+                FileRange(open(path, "rb"), start, end),
+                status=206,
+                content_type=content_type,
+            )
+            response.headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            response.headers["Content-Length"] = str(end - start + 1)
+    response.headers["Accept-Ranges"] = "bytes"
+    return response
@@ -1,24 +1,55 @@
-from rest_framework import viewsets, filters
+from abc import ABC, abstractmethod
+from functools import partial
+from itertools import islice
+
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date
+from rest_framework import filters, status, viewsets
+from rest_framework.generics import get_object_or_404
+from rest_framework.views import APIView
 from rest_framework.decorators import action
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from rest_framework.exceptions import PermissionDenied
-
+from rest_framework.exceptions import NotFound, PermissionDenied
+
+from apps.common.fastpath import NotCompilable, serializer_compiler
+from apps.common.negotiation import IgnoreClientContentNegotiation
+from apps.common.ranges import ranged_file_response
+from apps.content.pagination import (
+    CoursePagination,
+    NamePagination,
+    OrderedContentPagination,
+)
 from apps.content.permissions import IsInstructor, IsOwner
+from apps.content.services.fieldsets import FieldSelection
+from apps.content.storage.base import StorageRegistry
 from apps.content.serializers import (
+    CatalogFilterSerializer,
     CategorySerializer,
     TopicSerializer,
     CourseListSerializer,
     CourseDetailSerializer,
     CourseInstructorListSerializer,
     CourseInstructorDetailSerializer,
+    CourseCloneJobSerializer,
+    CourseCloneSerializer,
+    CourseImportSerializer,
+    CoursePackageSerializer,
+    CoursePrerequisiteSerializer,
     CourseWriteSerializer,
     ModuleInstructorSerializer,
+    ModuleReorderSerializer,
     ModuleWriteSerializer,
     ModuleUpdateSerializer,
     LessonListSerializer,
     LessonDetailSerializer,
+    LessonReorderSerializer,
     LessonWriteSerializer,
+    SearchQuerySerializer,
+    SearchResultSerializer,
 )
 
 
@@ -48,6 +79,167 @@ class PublishableViewSetMixin:
         return Response(serializer.data)
 
 
+class ReorderViewSetMixin(ABC):
+    """`POST reorder/` sets the display order of all siblings in one request."""
+
+    @action(detail=False, methods=["post"])
+    def reorder(self, request):
+        params = self.get_serializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        result = self.apply_reorder(request.user, params.validated_data)
+        if not result.success:
+            error_status = (
+                status.HTTP_403_FORBIDDEN
+                if result.forbidden
+                else status.HTTP_400_BAD_REQUEST
+            )
+            return Response({"error": result.error}, status=error_status)
+        return Response({"updated": result.updated})
+
+    @abstractmethod
+    def apply_reorder(self, user, data):
+        """Reorder through the facade; returns its ReorderResult."""
+
+
+class ConditionalGetMixin:
+    """
+    Answer If-None-Match / If-Modified-Since with 304 before the response is
+    built. `validators` is an (etag, last_modified) pair, or None to skip.
+
+    HTTP dates only have whole seconds, so a Last-Modified in the current
+    second is withheld: a second change within that second could not move it.
+    """
+
+    def conditional_response(self, request, validators, build_response):
+        if validators is None:
+            return build_response()
+
+        etag, last_modified = validators
+        if last_modified and int(last_modified.timestamp()) >= int(
+            timezone.now().timestamp()
+        ):
+            last_modified = None
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = build_response()
+        response.headers["ETag"] = etag
+        if last_modified:
+            response.headers["Last-Modified"] = http_date(timestamp)
+        return response
+
+
+class FieldSelectionMixin:
+    """Parse `?fields=` / `?expand=` once per request for `selection_actions`."""
+
+    selection_actions = ["list", "retrieve"]
+
+    def get_field_selection(self):
+        if self.action not in self.selection_actions:
+            return None
+        if not hasattr(self, "_field_selection"):
+            selection = FieldSelection.from_query_params(self.request.query_params)
+            self._field_selection = None if selection.is_default else selection
+        return self._field_selection
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["field_selection"] = self.get_field_selection()
+        return context
+
+
+class CompiledReadMixin:
+    """
+    Render `list` and `retrieve` with the compiled serializer fast path,
+    falling back to the DRF serializer when it cannot be compiled.
+    """
+
+    def get_compiled_serializer(self):
+        try:
+            return serializer_compiler.compile(
+                self.get_serializer_class(), self.get_serializer_context()
+            )
+        except NotCompilable:
+            return None
+
+    def list(self, request, *args, **kwargs):
+        compiled = self.get_compiled_serializer()
+        if compiled is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        key_columns = getattr(self.paginator, "get_key_columns", lambda model: [])
+        rows = compiled.values(queryset, *key_columns(queryset.model))
+        page = self.paginate_queryset(rows)
+        if page is None:
+            return Response(compiled.render_rows(rows, queryset))
+        return self.get_paginated_response(compiled.render_rows(page, queryset))
+
+    def retrieve(self, request, *args, **kwargs):
+        return Response(self.get_retrieve_data())
+
+    def get_retrieve_data(self) -> dict:
+        compiled = self.get_compiled_serializer()
+        if compiled is None:
+            return self.get_serializer(self.get_object()).data
+
+        # Look the object up without its prefetches, for permission checks.
+        queryset = self.filter_queryset(self.get_queryset())
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        instance = get_object_or_404(
+            queryset.prefetch_related(None),
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]},
+        )
+        self.check_object_permissions(self.request, instance)
+        return compiled.render_one(queryset.filter(pk=instance.pk))
+
+
+class StreamingListMixin:
+    """
+    `?stream=true` returns every row instead of one page. Rows are read in
+    chunks and written out as JSON incrementally, so memory stays bounded by
+    the chunk size rather than the result size. The body keeps the paginated
+    shape, with `next` always null.
+    """
+
+    stream_query_param = "stream"
+    stream_chunk_size = 500
+
+    def list(self, request, *args, **kwargs):
+        flag = request.query_params.get(self.stream_query_param, "")
+        if flag.lower() not in ("1", "true", "yes"):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        if hasattr(self.paginator, "order_queryset"):
+            queryset = self.paginator.order_queryset(queryset)
+        return StreamingHttpResponse(
+            self.stream_json(queryset), content_type="application/json"
+        )
+
+    def stream_json(self, queryset):
+        renderer = JSONRenderer()
+        yield b'{"next":null,"results":['
+        separator = b""
+        for chunk in self.iter_chunks(queryset):
+            yield separator + b",".join(renderer.render(item) for item in chunk)
+            separator = b","
+        yield b"]}"
+
+    def iter_chunks(self, queryset):
+        size = self.stream_chunk_size
+        compiled = self.get_compiled_serializer()
+        if compiled is not None:
+            rows = compiled.values(queryset).iterator(chunk_size=size)
+            while chunk := list(islice(rows, size)):
+                yield compiled.render_rows(chunk, queryset)
+            return
+
+        objects = queryset.iterator(chunk_size=size)
+        while chunk := list(islice(objects, size)):
+            yield self.get_serializer(chunk, many=True).data
+
+
 class InstructorContentViewSet(PublishableViewSetMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated, IsInstructor]
 
@@ -71,6 +263,7 @@ class InstructorContentViewSet(PublishableViewSetMixin, viewsets.ModelViewSet):
 
 class CategoryViewSet(viewsets.ModelViewSet):
     serializer_class = CategorySerializer
+    pagination_class = NamePagination
 
     def get_queryset(self):
         return get_content_facade().get_all_categories()
@@ -83,6 +276,7 @@ class CategoryViewSet(viewsets.ModelViewSet):
 
 class TopicViewSet(viewsets.ModelViewSet):
     serializer_class = TopicSerializer
+    pagination_class = NamePagination
     filter_backends = [filters.SearchFilter]
     search_fields = ["name", "slug", "description"]
 
@@ -95,44 +289,266 @@ class TopicViewSet(viewsets.ModelViewSet):
         return [IsAuthenticated(), IsInstructor()]
 
 
-class CoursePublicViewSet(viewsets.ReadOnlyModelViewSet):
+class CoursePublicViewSet(
+    FieldSelectionMixin,
+    ConditionalGetMixin,
+    CompiledReadMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """
     Public course listing and detail.
     Always returns full course detail - enrollment check done separately via /enrollments/{course_id}/status/
     """
 
     permission_classes = [AllowAny]
+    pagination_class = CoursePagination
 
     def get_queryset(self):
-        return get_content_facade().get_published_courses_with_content()
+        if self.action == "list":
+            return get_content_facade().get_published_course_catalog(
+                self.get_catalog_filters(), self.get_field_selection()
+            )
+        if self.action == "prerequisites":
+            return get_content_facade().get_published_course_catalog()
+        return get_content_facade().get_published_courses_with_content(
+            self.get_field_selection()
+        )
+
+    def get_catalog_filters(self) -> dict:
+        if not hasattr(self, "_catalog_filters"):
+            params = CatalogFilterSerializer(data=self.request.query_params)
+            params.is_valid(raise_exception=True)
+            self._catalog_filters = params.validated_data
+        return self._catalog_filters
 
     def get_serializer_class(self):
         if self.action == "list":
             return CourseListSerializer
+        if self.action == "prerequisites":
+            return CoursePrerequisiteSerializer
         return CourseDetailSerializer
 
+    def list(self, request, *args, **kwargs):
+        self.get_catalog_filters()
+        validators = get_content_facade().get_catalog_validators(
+            request.get_full_path()
+        )
+        return self.conditional_response(
+            request,
+            validators,
+            partial(self.list_with_facets, request, *args, **kwargs),
+        )
+
+    def list_with_facets(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        response.data["facets"] = get_content_facade().get_catalog_facets()
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        course_id = kwargs["pk"]
+
+        def build():
+            return self.get_retrieve_data()
+
+        # Keyed on the fields actually rendered, so reordered, repeated or
+        # unknown names in the query string share one cache entry.
+        selection = self.get_field_selection()
+        variant = (
+            serializer_compiler.selection_key(self.get_serializer_class(), selection)
+            if selection
+            else ""
+        )
+
+        def build_response():
+            return Response(
+                get_content_facade().get_course_detail(course_id, build, variant)
+            )
+
+        validators = get_content_facade().get_course_validators(course_id)
+        return self.conditional_response(request, validators, build_response)
+
+    @action(detail=True, methods=["get"])
+    def prerequisites(self, request, pk=None):
+        """Full prerequisite chain of a course, furthest first."""
+        course = self.get_object()
+        prerequisites = get_content_facade().get_course_prerequisites(course.pk)
+        return Response(self.get_serializer(prerequisites, many=True).data)
+
+
+class ContentSearchView(APIView):
+    """Ranked full-text search over published courses, lessons and topics."""
+
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        params = SearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        hits = get_content_facade().search(
+            params.validated_data["q"],
+            kinds=params.validated_data.get("type"),
+            limit=params.validated_data["limit"],
+        )
+        return Response(
+            {
+                "query": params.validated_data["q"],
+                "results": SearchResultSerializer(hits, many=True).data,
+            }
+        )
+
+
+# ==================== FILE DELIVERY ====================
+
+
+class ContentFileView(APIView):
+    """
+    Locally stored lesson files, sent through FileResponse (sendfile where
+    the server supports it); a Range request is answered with a 206 of just
+    that byte range, sent the same way.
+    """
+
+    permission_classes = [AllowAny]
+    content_negotiation_class = IgnoreClientContentNegotiation
+    storage_type = "local"
+
+    def get(self, request, digest):
+        metadata = get_content_facade().get_stored_file(
+            request.user, self.storage_type, digest
+        )
+        path = StorageRegistry.get_handler(self.storage_type).path(digest)
+        if metadata is None or not path.is_file():
+            raise NotFound()
+
+        etag = f'"{digest}"'
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = ranged_file_response(
+                request,
+                path,
+                metadata.get("content_type") or "application/octet-stream",
+                etag=etag,
+            )
+            if metadata.get("filename"):
+                response.headers["Content-Disposition"] = content_disposition_header(
+                    False, metadata["filename"]
+                )
+        response.headers["ETag"] = etag
+        # The bytes behind a digest never change; only access can.
+        response.headers["Cache-Control"] = "private, max-age=31536000, immutable"
+        return response
+
 
 # ==================== INSTRUCTOR VIEWSETS ====================
 
 
-class CourseInstructorViewSet(InstructorContentViewSet):
+class CourseInstructorViewSet(
+    StreamingListMixin, CompiledReadMixin, InstructorContentViewSet
+):
+    pagination_class = CoursePagination
+
     def get_queryset(self):
-        return get_content_facade().get_instructor_courses_with_details(
+        courses = get_content_facade().get_instructor_courses_with_details(
             self.request.user
         )
+        if self.action == "clone":
+            # Only the course row is needed; the service reads the tree itself.
+            return courses.prefetch_related(None)
+        return courses
 
     def get_serializer_class(self):
         if self.action == "list":
             return CourseInstructorListSerializer
         if self.action in ["retrieve", "publish", "unpublish"]:
             return CourseInstructorDetailSerializer
+        if self.action == "import_package":
+            return CoursePackageSerializer
+        if self.action == "clone":
+            return CourseCloneSerializer
+        if self.action == "clone_job":
+            return CourseCloneJobSerializer
         return CourseWriteSerializer
 
     def perform_create(self, serializer):
         serializer.save(instructor=self.request.user)
 
+    @action(detail=True, methods=["post"])
+    def clone(self, request, pk=None):
+        """
+        Copy the course for a new cohort or version. Large courses (or
+        `background: true`) are queued and answered with 202 and a job.
+        """
+        params = self.get_serializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        course = self.get_object()
+        facade = get_content_facade()
+        title = params.validated_data.get("title")
+
+        if params.validated_data["background"] or facade.should_defer_clone(course.pk):
+            job = facade.enqueue_course_clone(course, request.user, title)
+            return Response(
+                CourseCloneJobSerializer(job).data, status=status.HTTP_202_ACCEPTED
+            )
+
+        clone = facade.clone_course(course, request.user, title)
+        data = CourseInstructorDetailSerializer(
+            facade.get_instructor_courses_with_details(request.user).get(pk=clone.pk)
+        ).data
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, url_path=r"clone-jobs/(?P<job_id>\d+)")
+    def clone_job(self, request, job_id=None):
+        job = get_content_facade().get_clone_job(request.user, job_id)
+        if job is None:
+            raise NotFound()
+        return Response(self.get_serializer(job).data)
+
+    @action(detail=False, methods=["post"], url_path="import")
+    def import_package(self, request):
+        """
+        Create the courses of a package (see data/fixtures/courses.json).
+        Each course is validated on its own; invalid ones are reported by
+        index and the rest are still imported.
+        """
+        package = CoursePackageSerializer(data=request.data)
+        package.is_valid(raise_exception=True)
+
+        valid, errors = [], []
+        for index, item in enumerate(package.validated_data["data"]):
+            course = CourseImportSerializer(data=item)
+            if course.is_valid():
+                valid.append((index, course.validated_data))
+            else:
+                errors.append({"index": index, "errors": course.errors})
+
+        result = get_content_facade().import_courses(request.user, valid)
+        errors = sorted(errors + result.errors, key=lambda error: error["index"])
+        return Response(
+            {
+                "created": {
+                    "courses": len(result.course_ids),
+                    "modules": result.modules,
+                    "lessons": result.lessons,
+                },
+                "course_ids": result.course_ids,
+                "errors": errors,
+            },
+            status=(
+                status.HTTP_201_CREATED
+                if result.course_ids
+                else status.HTTP_400_BAD_REQUEST
+            ),
+        )
+
+
+class ModuleInstructorViewSet(
+    ReorderViewSetMixin,
+    StreamingListMixin,
+    CompiledReadMixin,
+    InstructorContentViewSet,
+):
+    pagination_class = OrderedContentPagination
+    owner_actions = [*InstructorContentViewSet.owner_actions, "content"]
 
-class ModuleInstructorViewSet(InstructorContentViewSet):
     def get_queryset(self):
         return get_content_facade().get_instructor_modules_with_lessons(
             self.request.user
@@ -143,22 +559,59 @@ class ModuleInstructorViewSet(InstructorContentViewSet):
             return ModuleWriteSerializer
         if self.action in ["update", "partial_update"]:
             return ModuleUpdateSerializer
+        if self.action == "reorder":
+            return ModuleReorderSerializer
         return ModuleInstructorSerializer
 
     def perform_create(self, serializer):
         # Validate ownership of the course before creating module
-        course_id = self.request.data.get("course_id")
-        if course_id and not get_content_facade().is_course_owner(
-            self.request.user, course_id
-        ):
+        ownership = get_content_facade().get_ownership_resolver(self.request)
+        if not ownership.owns(serializer.validated_data["course"]):
             raise PermissionDenied("You don't own this course")
         serializer.save()
 
+    def apply_reorder(self, user, data):
+        return get_content_facade().reorder_modules(
+            user, data["course_id"], data["ids"]
+        )
+
+    @action(detail=True)
+    def content(self, request, pk=None):
+        """
+        Content of every lesson in the module, in order, resolved as one
+        batch across storage backends. A lesson whose content could not be
+        fetched carries the `error` instead.
+        """
+        lessons = list(self.get_object().lessons.all())
+        results = get_content_facade().get_lessons_content(lessons)
+        return Response(
+            [
+                {
+                    "id": lesson.pk,
+                    "content": results[lesson.pk].content,
+                    "error": results[lesson.pk].error,
+                }
+                for lesson in lessons
+            ]
+        )
+
+
+class LessonInstructorViewSet(
+    ReorderViewSetMixin,
+    FieldSelectionMixin,
+    StreamingListMixin,
+    CompiledReadMixin,
+    InstructorContentViewSet,
+):
+    pagination_class = OrderedContentPagination
+    # Detail views render LessonDetailSerializer, which has no sparse fields.
+    selection_actions = ["list"]
 
-class LessonInstructorViewSet(InstructorContentViewSet):
     def get_queryset(self):
         return get_content_facade().get_instructor_lessons_with_topics(
-            self.request.user
+            self.request.user,
+            self.get_field_selection(),
+            outline=self.action == "list",
         )
 
     def get_serializer_class(self):
@@ -166,13 +619,18 @@ class LessonInstructorViewSet(InstructorContentViewSet):
             return LessonWriteSerializer
         if self.action in ["retrieve", "publish", "unpublish"]:
             return LessonDetailSerializer
+        if self.action == "reorder":
+            return LessonReorderSerializer
         return LessonListSerializer
 
     def perform_create(self, serializer):
         # Validate ownership of the module before creating lesson
-        module_id = self.request.data.get("module_id")
-        if module_id and not get_content_facade().is_module_owner(
-            self.request.user, module_id
-        ):
+        ownership = get_content_facade().get_ownership_resolver(self.request)
+        if not ownership.owns(serializer.validated_data["module"]):
             raise PermissionDenied("You don't own this module")
         serializer.save()
+
+    def apply_reorder(self, user, data):
+        return get_content_facade().reorder_lessons(
+            user, data["module_id"], data["ids"]
+        )
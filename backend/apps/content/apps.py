@@ -1,6 +1,17 @@
+import atexit
+
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class ContentConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.content"
+
+    def ready(self):
+        from apps.content import signals  # noqa: F401
+        from apps.content.storage import StorageRegistry
+
+        if settings.CONTENT_STORAGE_WARM_UP:
+            StorageRegistry.warm_up()
+        atexit.register(StorageRegistry.shutdown)
@@ -0,0 +1,66 @@
+import base64
+import zlib
+
+from django.conf import settings
+
+# content_data keys whose text may be stored compressed.
+COMPRESSIBLE_KEYS = ("transcript",)
+ENCODING = "zlib+base64"
+
+
+def threshold() -> int:
+    """Bytes from which lesson text is compressed; 0 turns compression off."""
+    return settings.LESSON_COMPRESSION_THRESHOLD
+
+
+def compress_text(text, limit=None) -> bytes | None:
+    """
+    zlib-compressed UTF-8 of `text` when it is at least `limit` bytes (the
+    LESSON_COMPRESSION_THRESHOLD by default) and shrinks, otherwise None.
+    """
+    limit = threshold() if limit is None else limit
+    if not limit or not isinstance(text, str):
+        return None
+    raw = text.encode()
+    if len(raw) < limit:
+        return None
+    compressed = zlib.compress(raw, settings.LESSON_COMPRESSION_LEVEL)
+    return compressed if len(compressed) < len(raw) else None
+
+
+def decompress_text(data) -> str:
+    return zlib.decompress(bytes(data)).decode()
+
+
+def is_packed(value) -> bool:
+    return isinstance(value, dict) and value.get("encoding") == ENCODING
+
+
+def pack_content_data(content_data, limit=None):
+    """content_data with its long COMPRESSIBLE_KEYS values compressed."""
+    if not isinstance(content_data, dict):
+        return content_data
+    packed = content_data
+    for key in COMPRESSIBLE_KEYS:
+        compressed = compress_text(content_data.get(key), limit)
+        if compressed is None:
+            continue
+        encoded = base64.b64encode(compressed).decode("ascii")
+        if len(encoded) < len(content_data[key].encode()):
+            packed = {**packed, key: {"encoding": ENCODING, "data": encoded}}
+    return packed
+
+
+def unpack_content_data(content_data):
+    """content_data as it was written, with packed values decompressed."""
+    if not isinstance(content_data, dict):
+        return content_data
+    unpacked = content_data
+    for key in COMPRESSIBLE_KEYS:
+        value = content_data.get(key)
+        if is_packed(value):
+            unpacked = {
+                **unpacked,
+                key: decompress_text(base64.b64decode(value["data"])),
+            }
+    return unpacked
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.content.compression import threshold
+from apps.content.services.compression import lesson_compression_service
+
+
+class Command(BaseCommand):
+    help = "Compress stored lesson bodies and transcripts over the size threshold"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threshold",
+            type=int,
+            help="Minimum size in bytes (default: LESSON_COMPRESSION_THRESHOLD)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=lesson_compression_service.CHUNK_SIZE,
+            help="Rows read and written per transaction",
+        )
+
+    def handle(self, *args, **options):
+        limit = (
+            options["threshold"] if options["threshold"] is not None else threshold()
+        )
+        if limit <= 0:
+            raise CommandError(
+                "Compression is off: set LESSON_COMPRESSION_THRESHOLD or pass --threshold."
+            )
+
+        self.stdout.write(f"Compressing lesson content of {limit} bytes or more...")
+        report = lesson_compression_service.compress_existing(
+            limit, options["chunk_size"]
+        )
+        percent = (
+            100 * report.bytes_saved / report.bytes_before if report.bytes_before else 0
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Done! Compressed {report.blobs} bodies and {report.transcripts} "
+                f"transcripts: {report.bytes_before} -> {report.bytes_after} bytes, "
+                f"saved {report.bytes_saved} ({percent:.1f}%)."
+            )
+        )
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from apps.content.services.blobs import content_blob_service
+
+
+class Command(BaseCommand):
+    help = "Recount content blob references and delete blobs no lesson uses"
+
+    def handle(self, *args, **options):
+        self.stdout.write("Recounting content blob references...")
+        blobs = content_blob_service.rebuild()
+        removed = content_blob_service.collect_garbage()
+        self.stdout.write(
+            self.style.SUCCESS(f"Done! Removed {removed} of {blobs} blobs.")
+        )
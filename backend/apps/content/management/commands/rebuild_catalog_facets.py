@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.content.services.facets import catalog_facet_service
+
+
+class Command(BaseCommand):
+    help = "Recompute catalog facet counts from published courses"
+
+    def handle(self, *args, **options):
+        self.stdout.write("Rebuilding catalog facets...")
+        total = catalog_facet_service.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Done! Stored {total} facet buckets."))
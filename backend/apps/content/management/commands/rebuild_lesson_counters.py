@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from apps.content.services.counters import lesson_counter_service
+
+
+class Command(BaseCommand):
+    help = "Recompute published lesson counters on modules and courses"
+
+    def handle(self, *args, **options):
+        self.stdout.write("Recomputing lesson counters...")
+        modules, courses = lesson_counter_service.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Done! Updated {modules} modules and {courses} courses."
+            )
+        )
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.content.services.prerequisites import prerequisite_service
+
+
+class Command(BaseCommand):
+    help = "Recompute the transitive prerequisite closure of all courses"
+
+    def handle(self, *args, **options):
+        self.stdout.write("Rebuilding prerequisite paths...")
+        paths = prerequisite_service.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Done! Stored {paths} paths."))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.content.services.search import search_index_service
+
+
+class Command(BaseCommand):
+    help = "Rebuild the content search index from courses, lessons and topics"
+
+    def handle(self, *args, **options):
+        self.stdout.write("Rebuilding search index...")
+        total = search_index_service.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Done! Indexed {total} documents."))
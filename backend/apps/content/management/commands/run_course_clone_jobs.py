@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.content.services.cloning import course_clone_service
+
+
+class Command(BaseCommand):
+    help = "Clone the courses queued by the instructor clone endpoint"
+
+    def handle(self, *args, **options):
+        finished = course_clone_service.run_pending()
+        self.stdout.write(self.style.SUCCESS(f"Done! Processed {finished} jobs."))
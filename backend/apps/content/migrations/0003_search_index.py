@@ -0,0 +1,93 @@
+# Generated by Django 5.2 on 2026-10-17 03:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("content", "0002_alter_lesson_options_alter_module_options_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("course", "Course"),
+                            ("lesson", "Lesson"),
+                            ("topic", "Topic"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("object_id", models.CharField(max_length=36)),
+                ("title", models.CharField(max_length=255)),
+                ("is_public", models.BooleanField(default=False)),
+                (
+                    "course",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_documents",
+                        to="content.course",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="SearchPosting",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("term", models.CharField(max_length=64)),
+                ("weight", models.FloatField()),
+                (
+                    "document",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="postings",
+                        to="content.searchdocument",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="searchdocument",
+            constraint=models.UniqueConstraint(
+                fields=("kind", "object_id"), name="unique_search_document"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="searchposting",
+            index=models.Index(
+                fields=["term", "-weight"], name="search_posting_impact"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="searchposting",
+            constraint=models.UniqueConstraint(
+                fields=("document", "term"), name="unique_search_posting"
+            ),
+        ),
+    ]
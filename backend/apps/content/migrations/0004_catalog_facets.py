@@ -0,0 +1,78 @@
+# Generated by Django 5.2 on 2026-10-17 03:56
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_catalog_facets(apps, schema_editor):
+    Course = apps.get_model("content", "Course")
+    CatalogFacet = apps.get_model("content", "CatalogFacet")
+    labels = dict(Course._meta.get_field("difficulty_level").choices)
+    published = Course.objects.filter(is_published=True).order_by()
+
+    rows = [
+        CatalogFacet(
+            facet="category",
+            value=str(row["category_id"]),
+            label=row["category__name"],
+            count=row["count"],
+        )
+        for row in published.filter(category__isnull=False)
+        .values("category_id", "category__name")
+        .annotate(count=Count("id"))
+    ]
+    rows += [
+        CatalogFacet(
+            facet="difficulty",
+            value=row["difficulty_level"],
+            label=labels.get(row["difficulty_level"], row["difficulty_level"]),
+            count=row["count"],
+        )
+        for row in published.values("difficulty_level").annotate(count=Count("id"))
+    ]
+    CatalogFacet.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("content", "0003_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CatalogFacet",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "facet",
+                    models.CharField(
+                        choices=[
+                            ("category", "Category"),
+                            ("difficulty", "Difficulty"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("value", models.CharField(max_length=100)),
+                ("label", models.CharField(max_length=100)),
+                ("count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ["facet", "label"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("facet", "value"), name="unique_catalog_facet"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_catalog_facets, migrations.RunPython.noop),
+    ]
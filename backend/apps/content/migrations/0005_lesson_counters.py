@@ -0,0 +1,61 @@
+# Generated by Django 5.2 on 2026-10-17 04:00
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _count(lessons, group_by):
+    return Coalesce(
+        Subquery(
+            lessons.order_by()
+            .values(group_by)
+            .annotate(count=Count("id"))
+            .values("count"),
+            output_field=models.IntegerField(),
+        ),
+        0,
+    )
+
+
+def backfill_lesson_counters(apps, schema_editor):
+    Course = apps.get_model("content", "Course")
+    Module = apps.get_model("content", "Module")
+    Lesson = apps.get_model("content", "Lesson")
+
+    Module.objects.update(
+        published_lesson_count=_count(
+            Lesson.objects.filter(module=OuterRef("pk"), is_published=True),
+            "module",
+        )
+    )
+    Course.objects.update(
+        published_lesson_count=_count(
+            Lesson.objects.filter(
+                module__course=OuterRef("pk"),
+                module__is_published=True,
+                is_published=True,
+            ),
+            "module__course",
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("content", "0004_catalog_facets"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="published_lesson_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="module",
+            name="published_lesson_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_lesson_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 5.2 on 2026-10-17 04:24
+
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_prerequisite_paths(apps, schema_editor):
+    Course = apps.get_model("content", "Course")
+    PrerequisitePath = apps.get_model("content", "PrerequisitePath")
+
+    direct = defaultdict(set)
+    for course_id, prerequisite_id in Course.prerequisites.through.objects.values_list(
+        "from_course_id", "to_course_id"
+    ):
+        direct[course_id].add(prerequisite_id)
+
+    paths = []
+    for course_id in direct:
+        # Breadth-first, so each ancestor is first reached at its shortest depth.
+        depths, frontier, depth = {}, direct[course_id], 1
+        while frontier:
+            frontier = {c for c in frontier if c not in depths and c != course_id}
+            depths.update((ancestor_id, depth) for ancestor_id in frontier)
+            frontier = set().union(*(direct.get(c, ()) for c in frontier))
+            depth += 1
+        paths.extend(
+            PrerequisitePath(ancestor_id=ancestor_id, descendant_id=course_id, depth=d)
+            for ancestor_id, d in depths.items()
+        )
+    PrerequisitePath.objects.bulk_create(paths, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("content", "0005_lesson_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PrerequisitePath",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("depth", models.PositiveSmallIntegerField()),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="content.course",
+                    ),
+                ),
+                (
+                    "descendant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="content.course",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["ancestor", "depth"],
+                        name="content_pre_ancesto_58a9f0_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("descendant", "ancestor"),
+                        name="unique_prerequisite_path",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_prerequisite_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,114 @@
+# Generated by Django 5.2 on 2026-10-17 05:04
+
+import hashlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+BATCH_SIZE = 500
+
+
+def batches(queryset):
+    """`queryset` in lists of BATCH_SIZE, streamed rather than loaded at once."""
+    batch = []
+    for obj in queryset.iterator(chunk_size=BATCH_SIZE):
+        batch.append(obj)
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def move_bodies_to_blobs(apps, schema_editor):
+    ContentBlob = apps.get_model("content", "ContentBlob")
+    Lesson = apps.get_model("content", "Lesson")
+
+    lessons = Lesson.objects.exclude(content="").only("id", "content").order_by("pk")
+    for batch in batches(lessons):
+        blobs = {}
+        for lesson in batch:
+            digest = hashlib.sha256(lesson.content.encode()).hexdigest()
+            blobs[digest] = ContentBlob(
+                digest=digest, data=lesson.content, size=len(lesson.content.encode())
+            )
+            lesson.content_blob_id = digest
+        ContentBlob.objects.bulk_create(blobs.values(), ignore_conflicts=True)
+        Lesson.objects.bulk_update(batch, ["content_blob"])
+
+    ContentBlob.objects.update(
+        ref_count=Coalesce(
+            Subquery(
+                Lesson.objects.filter(content_blob=OuterRef("pk"))
+                .order_by()
+                .values("content_blob")
+                .annotate(count=Count("id"))
+                .values("count"),
+                output_field=models.IntegerField(),
+            ),
+            0,
+        )
+    )
+
+
+def restore_bodies(apps, schema_editor):
+    Lesson = apps.get_model("content", "Lesson")
+
+    lessons = (
+        Lesson.objects.exclude(content_blob=None)
+        .select_related("content_blob")
+        .only("id", "content_blob__data")
+        .order_by("pk")
+    )
+    for batch in batches(lessons):
+        for lesson in batch:
+            lesson.content = lesson.content_blob.data
+        Lesson.objects.bulk_update(batch, ["content"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("content", "0007_course_clone_jobs"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContentBlob",
+            fields=[
+                (
+                    "digest",
+                    models.CharField(max_length=64, primary_key=True, serialize=False),
+                ),
+                ("data", models.TextField()),
+                ("size", models.PositiveIntegerField()),
+                ("ref_count", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["ref_count"], name="content_con_ref_cou_363c1f_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.AddField(
+            model_name="lesson",
+            name="content_blob",
+            field=models.ForeignKey(
+                blank=True,
+                db_column="content_digest",
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="lessons",
+                to="content.contentblob",
+            ),
+        ),
+        migrations.RunPython(move_bodies_to_blobs, restore_bodies),
+        migrations.RemoveField(
+            model_name="lesson",
+            name="content",
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2 on 2026-10-17 05:11
+
+import zlib
+
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+
+def decompress_bodies(apps, schema_editor):
+    ContentBlob = apps.get_model("content", "ContentBlob")
+
+    blobs = ContentBlob.objects.exclude(compressed=None).order_by("pk")
+    batch = []
+    for blob in blobs.iterator(chunk_size=BATCH_SIZE):
+        blob.data = zlib.decompress(bytes(blob.compressed)).decode()
+        blob.compressed = None
+        batch.append(blob)
+        if len(batch) == BATCH_SIZE:
+            ContentBlob.objects.bulk_update(batch, ["data", "compressed"])
+            batch = []
+    ContentBlob.objects.bulk_update(batch, ["data", "compressed"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("content", "0008_content_blobs"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contentblob",
+            name="compressed",
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.RunPython(migrations.RunPython.noop, decompress_bodies),
+        migrations.AlterField(
+            model_name="contentblob",
+            name="data",
+            field=models.TextField(blank=True),
+        ),
+    ]
@@ -3,6 +3,7 @@ from django.conf import settings
 import uuid
 
 from apps.common.models import TimestampMixin
+from apps.content.compression import decompress_text
 
 
 # ==================== MIXINS ====================
@@ -75,6 +76,8 @@ class Course(TimestampMixin, PublishableMixin):
     )
     students_count = models.PositiveIntegerField(default=0)
     rating = models.DecimalField(max_digits=3, decimal_places=2, default=0.00)
+    # Published lessons in published modules; see LessonCounterService.
+    published_lesson_count = models.PositiveIntegerField(default=0, editable=False)
 
     category = models.ForeignKey(
         Category,
@@ -109,6 +112,8 @@ class Module(TimestampMixin, PublishableMixin):
     order = models.PositiveIntegerField(default=0)
     is_published = models.BooleanField(default=True)
     estimated_duration = models.PositiveIntegerField(default=0)
+    # Published lessons in this module; see LessonCounterService.
+    published_lesson_count = models.PositiveIntegerField(default=0, editable=False)
 
     course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="modules")
 
@@ -122,6 +127,53 @@ class Module(TimestampMixin, PublishableMixin):
         return self.course.instructor
 
 
+class ContentBlob(models.Model):
+    """
+    A lesson body stored once, keyed by the SHA-256 of its UTF-8 bytes.
+
+    `ref_count` is the number of lessons using the blob, kept current by
+    ContentBlobService; blobs nobody uses are removed by gc_content_blobs.
+    Bodies over LESSON_COMPRESSION_THRESHOLD are kept zlib-compressed in
+    `compressed` (with `data` empty); read them through `text`.
+    """
+
+    digest = models.CharField(max_length=64, primary_key=True)
+    data = models.TextField(blank=True)
+    compressed = models.BinaryField(null=True, blank=True)
+    size = models.PositiveIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["ref_count"])]
+
+    def __str__(self):
+        return self.digest
+
+    @property
+    def text(self) -> str:
+        return blob_text(self.data, self.compressed)
+
+
+def blob_text(data, compressed) -> str:
+    return decompress_text(compressed) if compressed is not None else data
+
+
+class LessonQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Intern the bodies assigned through `content` before inserting and
+        recount the blobs the new lessons use afterwards, as a save would.
+        """
+        from apps.content.services.blobs import content_blob_service
+
+        objs = list(objs)
+        digests = content_blob_service.attach(objs)
+        created = super().bulk_create(objs, *args, **kwargs)
+        content_blob_service.refresh(digests)
+        return created
+
+
 class Lesson(TimestampMixin, PublishableMixin):
     class ContentType(models.TextChoices):
         VIDEO = "video", "Video"
@@ -136,7 +188,16 @@ class Lesson(TimestampMixin, PublishableMixin):
         default=ContentType.TEXT,
     )
     content_data = models.JSONField(default=dict, blank=True)
-    content = models.TextField(blank=True)
+    # The body lives in ContentBlob so identical bodies are stored once; read
+    # and assign it through `content`.
+    content_blob = models.ForeignKey(
+        ContentBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="lessons",
+        db_column="content_digest",
+    )
     order = models.PositiveIntegerField(default=0)
     estimated_duration = models.PositiveIntegerField(default=0)
     is_published = models.BooleanField(default=True)
@@ -144,11 +205,167 @@ class Lesson(TimestampMixin, PublishableMixin):
     module = models.ForeignKey(Module, on_delete=models.CASCADE, related_name="lessons")
     topics = models.ManyToManyField(Topic, blank=True, related_name="lessons")
 
+    objects = LessonQuerySet.as_manager()
+
     class Meta:
         ordering = ["order", "-created_at"]
 
     def __str__(self):
         return f"{self.module.title} - {self.title}"
 
+    @property
+    def content(self) -> str:
+        pending = self.__dict__.get("_pending_content")
+        if pending is not None:
+            return pending
+        return self.content_blob.text if self.content_blob_id else ""
+
+    @content.setter
+    def content(self, value):
+        # Resolved to a ContentBlob when the lesson is saved or bulk-created.
+        # `content` is not a column: filter and update through content_blob.
+        self._pending_content = value or ""
+
     def get_instructor(self):
         return self.module.course.instructor
+
+
+# ==================== PREREQUISITES ====================
+
+
+class PrerequisitePath(models.Model):
+    """
+    Transitive closure of Course.prerequisites: `ancestor` must be completed
+    (directly or through other courses) before `descendant`. Maintained by
+    PrerequisiteService whenever prerequisite links change.
+    """
+
+    ancestor = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="+")
+    descendant = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="+")
+    # Length of the shortest prerequisite chain between the two; 1 = direct.
+    depth = models.PositiveSmallIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["descendant", "ancestor"], name="unique_prerequisite_path"
+            )
+        ]
+        indexes = [models.Index(fields=["ancestor", "depth"])]
+
+    def __str__(self):
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
+
+
+# ==================== COURSE CLONING ====================
+
+
+class CourseCloneJob(TimestampMixin):
+    """A clone of a large course, queued for run_course_clone_jobs."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    source = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="+")
+    instructor = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+"
+    )
+    title = models.CharField(max_length=255)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    clone = models.ForeignKey(
+        Course, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "created_at"])]
+
+    def __str__(self):
+        return f"Clone of {self.source_id} ({self.status})"
+
+
+# ==================== CATALOG FACETS ====================
+
+
+class CatalogFacet(models.Model):
+    """Number of published courses per facet value, kept current on course writes."""
+
+    class Facet(models.TextChoices):
+        CATEGORY = "category", "Category"
+        DIFFICULTY = "difficulty", "Difficulty"
+
+    facet = models.CharField(max_length=20, choices=Facet.choices)
+    value = models.CharField(max_length=100)
+    label = models.CharField(max_length=100)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["facet", "label"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["facet", "value"], name="unique_catalog_facet"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.facet}={self.label} ({self.count})"
+
+
+# ==================== SEARCH INDEX ====================
+
+
+class SearchDocument(models.Model):
+    """One indexed course, lesson or topic; maintained by the search service."""
+
+    class Kind(models.TextChoices):
+        COURSE = "course", "Course"
+        LESSON = "lesson", "Lesson"
+        TOPIC = "topic", "Topic"
+
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+    object_id = models.CharField(max_length=36)
+    title = models.CharField(max_length=255)
+    course = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="search_documents",
+    )
+    is_public = models.BooleanField(default=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id"], name="unique_search_document"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.kind}: {self.title}"
+
+
+class SearchPosting(models.Model):
+    """Inverted index entry: `term` occurs in `document` with ranking `weight`."""
+
+    term = models.CharField(max_length=64)
+    document = models.ForeignKey(
+        SearchDocument, on_delete=models.CASCADE, related_name="postings"
+    )
+    weight = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["document", "term"], name="unique_search_posting"
+            )
+        ]
+        indexes = [
+            # Impact-ordered: the highest-weighted postings of a term come first.
+            models.Index(fields=["term", "-weight"], name="search_posting_impact")
+        ]
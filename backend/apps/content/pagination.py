@@ -0,0 +1,17 @@
+from apps.common.pagination import KeysetPagination
+
+
+class CoursePagination(KeysetPagination):
+    ordering = ("-created_at",)
+
+
+class OrderedContentPagination(KeysetPagination):
+    """Modules and lessons in their display order."""
+
+    ordering = ("order",)
+
+
+class NamePagination(KeysetPagination):
+    """Lookup tables (categories, topics) sorted alphabetically."""
+
+    ordering = ("name",)
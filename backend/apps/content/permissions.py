@@ -1,5 +1,7 @@
 from rest_framework.permissions import BasePermission
 
+from apps.content.services.authority import OwnershipResolver
+
 
 class IsInstructor(BasePermission):
     """Check if user is an instructor."""
@@ -16,4 +18,4 @@ class IsOwner(BasePermission):
     """Check if user owns the object (for update/delete operations)."""
 
     def has_object_permission(self, request, view, obj):
-        return obj.get_instructor() == request.user
+        return OwnershipResolver.for_request(request).owns(obj)
@@ -1,6 +1,58 @@
+from django.contrib.auth import get_user_model
+from django.db.models import Q
 from rest_framework import serializers
 
-from apps.content.models import Course, Category, Module, Lesson, Topic
+from apps.common.fastpath import serializer_compiler
+
+from apps.content.compression import unpack_content_data
+from apps.content.models import (
+    ContentBlob,
+    Course,
+    CourseCloneJob,
+    Category,
+    Module,
+    Lesson,
+    SearchDocument,
+    Topic,
+    blob_text,
+)
+from apps.content.services.prerequisites import prerequisite_service
+
+
+# ==================== MIXINS ====================
+
+
+class SparseFieldsMixin:
+    """
+    Drops fields not chosen by a FieldSelection. The root serializer reads
+    it from context["field_selection"]; nested serializers receive their
+    branch from the parent, and unexpanded nested serializers are removed.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selection = getattr(self, "_field_selection", None)
+        if selection is None and self._is_root():
+            selection = self.context.get("field_selection")
+        if selection is None or selection.is_default:
+            return fields
+
+        for name, field in list(fields.items()):
+            nested = getattr(field, "child", field)
+            if isinstance(nested, serializers.BaseSerializer):
+                keep = selection.expands(name)
+                nested._field_selection = selection.child(name)
+            else:
+                keep = selection.includes(name)
+            if not keep:
+                del fields[name]
+        return fields
+
+    def _is_root(self) -> bool:
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
 
 
 # ==================== BASE SERIALIZERS ====================
@@ -37,7 +89,7 @@ class LessonMinimalSerializer(serializers.ModelSerializer):
         fields = ["id", "title", "content_type", "order", "estimated_duration"]
 
 
-class LessonListSerializer(serializers.ModelSerializer):
+class LessonListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Lesson for enrolled users - includes topics."""
 
     topics = TopicMinimalSerializer(many=True, read_only=True)
@@ -55,9 +107,26 @@ class LessonListSerializer(serializers.ModelSerializer):
         ]
 
 
+class ContentDataField(serializers.JSONField):
+    """Lesson content_data as written, with compressed transcripts expanded."""
+
+    def to_representation(self, value):
+        return super().to_representation(unpack_content_data(value))
+
+
+# Lets the compiled fast path decompress a lesson body from its blob columns.
+serializer_compiler.register_computed(
+    ContentBlob, "text", ("data", "compressed"), blob_text
+)
+
+
 class LessonDetailSerializer(serializers.ModelSerializer):
     """Full lesson detail with content."""
 
+    content = serializers.CharField(
+        source="content_blob.text", default="", read_only=True
+    )
+    content_data = ContentDataField(required=False)
     topics = TopicMinimalSerializer(many=True, read_only=True)
 
     class Meta:
@@ -91,6 +160,8 @@ class LessonWriteSerializer(serializers.ModelSerializer):
         write_only=True,
         required=False,
     )
+    content = serializers.CharField(required=False, allow_blank=True)
+    content_data = ContentDataField(required=False)
 
     class Meta:
         model = Lesson
@@ -122,6 +193,21 @@ class LessonWriteSerializer(serializers.ModelSerializer):
         return lesson
 
 
+class ReorderSerializer(serializers.Serializer):
+    """New display order: every sibling ID, first to last."""
+
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False)
+
+    def validate_ids(self, ids):
+        if len(set(ids)) != len(ids):
+            raise serializers.ValidationError("IDs must not repeat.")
+        return ids
+
+
+class LessonReorderSerializer(ReorderSerializer):
+    module_id = serializers.UUIDField()
+
+
 # ==================== MODULE SERIALIZERS ====================
 
 
@@ -142,7 +228,7 @@ class ModuleMinimalSerializer(serializers.ModelSerializer):
         ]
 
 
-class ModuleWithLessonsSerializer(serializers.ModelSerializer):
+class ModuleWithLessonsSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Module with nested lessons for enrolled users."""
 
     lessons = LessonListSerializer(many=True, read_only=True)
@@ -214,10 +300,22 @@ class ModuleUpdateSerializer(serializers.ModelSerializer):
         fields = ["title", "description", "order", "estimated_duration", "is_published"]
 
 
+class ModuleReorderSerializer(ReorderSerializer):
+    course_id = serializers.UUIDField()
+
+
 # ==================== COURSE SERIALIZERS ====================
 
+# Lets the compiled fast path render `instructor.full_name` from columns.
+serializer_compiler.register_computed(
+    get_user_model(),
+    "full_name",
+    ("fullname", "username"),
+    lambda fullname, username: fullname or username,
+)
+
 
-class CourseListSerializer(serializers.ModelSerializer):
+class CourseListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Course list for public browsing."""
 
     category = serializers.CharField(source="category.name", read_only=True, default="")
@@ -290,6 +388,21 @@ class CourseInstructorDetailSerializer(CourseInstructorListSerializer):
         fields = CourseInstructorListSerializer.Meta.fields + ["modules"]
 
 
+class PrerequisiteCourseField(serializers.PrimaryKeyRelatedField):
+    """
+    A course that may be required first: any published course, or one of
+    the requesting instructor's own drafts. Other drafts are reported as
+    missing, so their existence is not revealed.
+    """
+
+    def get_queryset(self):
+        request = self.context.get("request")
+        visible = Q(is_published=True)
+        if request is not None and request.user.is_authenticated:
+            visible |= Q(instructor=request.user)
+        return Course.objects.filter(visible)
+
+
 class CourseWriteSerializer(serializers.ModelSerializer):
     """Create/Update course."""
 
@@ -300,6 +413,11 @@ class CourseWriteSerializer(serializers.ModelSerializer):
         required=False,
         allow_null=True,
     )
+    prerequisite_ids = PrerequisiteCourseField(
+        many=True,
+        write_only=True,
+        required=False,
+    )
 
     class Meta:
         model = Course
@@ -312,4 +430,164 @@ class CourseWriteSerializer(serializers.ModelSerializer):
             "difficulty_level",
             "est_duration",
             "is_published",
+            "prerequisite_ids",
+        ]
+
+    def validate_prerequisite_ids(self, prerequisites):
+        if self.instance is not None:
+            prerequisite_service.check_links(
+                [self.instance.pk], [course.pk for course in prerequisites]
+            )
+        return prerequisites
+
+    def create(self, validated_data):
+        prerequisites = validated_data.pop("prerequisite_ids", [])
+        course = super().create(validated_data)
+        if prerequisites:
+            course.prerequisites.set(prerequisites)
+        return course
+
+    def update(self, instance, validated_data):
+        prerequisites = validated_data.pop("prerequisite_ids", None)
+        course = super().update(instance, validated_data)
+        if prerequisites is not None:
+            course.prerequisites.set(prerequisites)
+        return course
+
+
+class CourseCloneSerializer(serializers.Serializer):
+    title = serializers.CharField(max_length=255, required=False)
+    # Queue the copy even when the course is below the size threshold.
+    background = serializers.BooleanField(default=False)
+
+
+class CourseCloneJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CourseCloneJob
+        fields = [
+            "id",
+            "source",
+            "title",
+            "status",
+            "clone",
+            "error",
+            "created_at",
+            "updated_at",
+        ]
+
+
+class CoursePrerequisiteSerializer(CourseListSerializer):
+    """A course in another course's prerequisite chain (1 = direct)."""
+
+    depth = serializers.IntegerField(read_only=True)
+
+    class Meta(CourseListSerializer.Meta):
+        fields = CourseListSerializer.Meta.fields + ["depth"]
+
+
+# ==================== IMPORT SERIALIZERS ====================
+
+
+class LessonImportSerializer(serializers.ModelSerializer):
+    content = serializers.CharField(required=False, allow_blank=True)
+    topic_names = serializers.ListField(
+        child=serializers.CharField(max_length=100), required=False
+    )
+
+    class Meta:
+        model = Lesson
+        fields = [
+            "title",
+            "content_type",
+            "content",
+            "content_data",
+            "order",
+            "estimated_duration",
+            "is_published",
+            "topic_names",
+        ]
+
+
+class ModuleImportSerializer(serializers.ModelSerializer):
+    lessons = LessonImportSerializer(many=True, required=False)
+
+    class Meta:
+        model = Module
+        fields = [
+            "title",
+            "description",
+            "order",
+            "estimated_duration",
+            "is_published",
+            "lessons",
+        ]
+
+
+class CourseImportSerializer(serializers.ModelSerializer):
+    """One course of an import package, with its modules and lessons."""
+
+    category_name = serializers.CharField(
+        max_length=100, required=False, allow_blank=True, allow_null=True
+    )
+    modules = ModuleImportSerializer(many=True, required=False)
+
+    class Meta:
+        model = Course
+        fields = [
+            "title",
+            "description",
+            "cover_image",
+            "difficulty_level",
+            "est_duration",
+            "is_published",
+            "category_name",
+            "modules",
         ]
+
+
+class CoursePackageSerializer(serializers.Serializer):
+    """Import payload, shaped like data/fixtures/courses.json."""
+
+    table = serializers.ChoiceField(choices=["courses"], required=False)
+    data = serializers.ListField(
+        child=serializers.DictField(), allow_empty=False, max_length=100
+    )
+
+
+# ==================== SEARCH SERIALIZERS ====================
+
+
+class CatalogFilterSerializer(serializers.Serializer):
+    category = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False
+    )
+    difficulty = serializers.MultipleChoiceField(
+        choices=Course.DifficultyLevel.choices, required=False
+    )
+    topic = serializers.ListField(child=serializers.SlugField(), required=False)
+    min_duration = serializers.IntegerField(min_value=0, required=False)
+    max_duration = serializers.IntegerField(min_value=0, required=False)
+
+    def validate(self, attrs):
+        low, high = attrs.get("min_duration"), attrs.get("max_duration")
+        if low is not None and high is not None and low > high:
+            raise serializers.ValidationError(
+                {"max_duration": "Must be greater than or equal to min_duration."}
+            )
+        return attrs
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200)
+    type = serializers.MultipleChoiceField(
+        choices=SearchDocument.Kind.choices, required=False
+    )
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=20)
+
+
+class SearchResultSerializer(serializers.Serializer):
+    type = serializers.CharField(source="kind")
+    id = serializers.CharField(source="object_id")
+    title = serializers.CharField()
+    course_id = serializers.UUIDField(allow_null=True)
+    score = serializers.FloatField()
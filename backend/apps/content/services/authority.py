@@ -12,3 +12,65 @@ class InstructorAuthorityService:
         return Lesson.objects.filter(
             id=lesson_id, module__course__instructor=user
         ).exists()
+
+
+class OwnershipResolver:
+    """
+    Answers "does this user own that course, module or lesson" by comparing
+    instructor IDs, memoized for the lifetime of one request.
+
+    The instructor ID is read from relations already loaded on the object
+    when possible (a course row, or a lesson fetched with its module and
+    course); otherwise one `values_list` query resolves it, and the answer
+    is reused for every later check in the same request.
+    """
+
+    OWNER_PATHS = {
+        Course: "instructor_id",
+        Module: "course__instructor_id",
+        Lesson: "module__course__instructor_id",
+    }
+    request_attribute = "_content_ownership"
+
+    def __init__(self, user):
+        self.user = user
+        self._owners = {}
+
+    @classmethod
+    def for_request(cls, request) -> "OwnershipResolver":
+        resolver = getattr(request, cls.request_attribute, None)
+        if resolver is None or resolver.user != request.user:
+            resolver = cls(request.user)
+            setattr(request, cls.request_attribute, resolver)
+        return resolver
+
+    def owns(self, obj) -> bool:
+        key = (type(obj), str(obj.pk))
+        if key not in self._owners:
+            loaded = self._loaded_owner_id(obj)
+            if loaded is not None:
+                self._owners[key] = loaded
+        return self.owns_id(type(obj), obj.pk)
+
+    def owns_id(self, model, pk) -> bool:
+        key = (model, str(pk))
+        if key not in self._owners:
+            self._owners[key] = (
+                model.objects.filter(pk=pk)
+                .values_list(self.OWNER_PATHS[model], flat=True)
+                .first()
+            )
+        owner_id = self._owners[key]
+        return owner_id is not None and owner_id == self.user.pk
+
+    def _loaded_owner_id(self, obj):
+        """The instructor ID if it is reachable without a query, else None."""
+        if isinstance(obj, Lesson):
+            if not Lesson.module.is_cached(obj):
+                return None
+            obj = obj.module
+        if isinstance(obj, Module):
+            if not Module.course.is_cached(obj):
+                return None
+            obj = obj.course
+        return obj.instructor_id
@@ -0,0 +1,117 @@
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Count, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.content.compression import compress_text, pack_content_data
+from apps.content.models import ContentBlob, Lesson
+
+
+class ContentBlobService:
+    """
+    Content-addressed lesson bodies.
+
+    Identical bodies share one ContentBlob row, so cloning or importing the
+    same text again only adds references. Reference counts are recomputed
+    from the lesson rows with a correlated UPDATE, like the lesson counters,
+    so a missed signal can never leave a blob collectable while in use.
+    The digest is always that of the plain text, whether or not the body
+    is stored compressed.
+    """
+
+    BATCH_SIZE = 500
+
+    def digest(self, text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def intern(self, texts) -> dict:
+        """Store each distinct non-empty text once; returns {text: digest}."""
+        digests = {text: self.digest(text) for text in set(texts) if text}
+        ContentBlob.objects.bulk_create(
+            [self.build(text, digest) for text, digest in digests.items()],
+            ignore_conflicts=True,
+            batch_size=self.BATCH_SIZE,
+        )
+        return digests
+
+    def build(self, text: str, digest: str) -> ContentBlob:
+        """An unsaved blob for `text`, compressed if it is long enough."""
+        compressed = compress_text(text)
+        return ContentBlob(
+            digest=digest,
+            data="" if compressed is not None else text,
+            compressed=compressed,
+            size=len(text.encode()),
+        )
+
+    def attach(self, lessons) -> set:
+        """
+        Point unsaved lessons that were given a `content` at their blobs and
+        compress their long transcripts, which the pre_save receivers do for
+        a save; Lesson.objects.bulk_create calls it. Returns the digests
+        the lessons use, to `refresh` once they are stored.
+        """
+        for lesson in lessons:
+            lesson.content_data = pack_content_data(lesson.content_data)
+        pending = [
+            lesson
+            for lesson in lessons
+            if lesson.__dict__.get("_pending_content") is not None
+        ]
+        digests = self.intern(lesson._pending_content for lesson in pending)
+        for lesson in pending:
+            lesson.content_blob_id = digests.get(
+                lesson.__dict__.pop("_pending_content")
+            )
+        return {lesson.content_blob_id for lesson in lessons} - {None}
+
+    def ref_count(self):
+        return Coalesce(
+            Subquery(
+                Lesson.objects.filter(content_blob=OuterRef("pk"))
+                .order_by()
+                .values("content_blob")
+                .annotate(count=Count("id"))
+                .values("count"),
+                output_field=models.IntegerField(),
+            ),
+            0,
+        )
+
+    @transaction.atomic
+    def refresh(self, digests) -> None:
+        digests = {digest for digest in digests if digest}
+        if digests:
+            ContentBlob.objects.filter(pk__in=digests).update(
+                ref_count=self.ref_count()
+            )
+
+    @transaction.atomic
+    def rebuild(self) -> int:
+        """Recount every blob; returns the number of blobs."""
+        return ContentBlob.objects.update(ref_count=self.ref_count())
+
+    @transaction.atomic
+    def collect_garbage(self, grace_period=None) -> int:
+        """
+        Delete blobs no lesson uses; returns how many were removed. Blobs
+        younger than `grace_period` seconds (CONTENT_BLOB_GC_GRACE_PERIOD by
+        default) are kept: one interned by a save that has not committed yet
+        has no lesson pointing at it so far.
+        """
+        if grace_period is None:
+            grace_period = settings.CONTENT_BLOB_GC_GRACE_PERIOD
+        cutoff = timezone.now() - timedelta(seconds=grace_period)
+        deleted, _ = (
+            ContentBlob.objects.filter(ref_count=0, created_at__lt=cutoff)
+            .exclude(Exists(Lesson.objects.filter(content_blob=OuterRef("pk"))))
+            .delete()
+        )
+        return deleted
+
+
+content_blob_service = ContentBlobService()
@@ -0,0 +1,146 @@
+import uuid
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.content.models import Course, CourseCloneJob, Lesson, Module
+from apps.content.services.prerequisites import prerequisite_service
+from apps.content.services.search import search_index_service
+from apps.content.services.versioning import content_version_service
+
+LessonTopic = Lesson.topics.through
+Prerequisite = Course.prerequisites.through
+
+
+class CourseCloneService:
+    """
+    Copies a course with its modules, lessons, lesson topics and prerequisite
+    links, one SELECT and one bulk INSERT per table, so the number of queries
+    does not depend on the size of the course. Lesson bodies are content
+    blobs, so the copies share them rather than storing the text again.
+
+    Clones start unpublished with no students or rating. Courses above
+    COURSE_CLONE_ASYNC_LESSONS are queued as CourseCloneJob rows and copied
+    by the run_course_clone_jobs command instead of inside the request.
+    """
+
+    BATCH_SIZE = 500
+
+    def should_defer(self, course_id) -> bool:
+        lessons = Lesson.objects.filter(module__course_id=course_id)
+        return lessons.count() > settings.COURSE_CLONE_ASYNC_LESSONS
+
+    def default_title(self, course: Course) -> str:
+        return f"{course.title} (copy)"[: Course._meta.get_field("title").max_length]
+
+    def enqueue(self, course: Course, instructor, title=None) -> CourseCloneJob:
+        return CourseCloneJob.objects.create(
+            source=course,
+            instructor=instructor,
+            title=title or self.default_title(course),
+        )
+
+    @transaction.atomic
+    def clone(self, course: Course, instructor, title=None) -> Course:
+        now = timezone.now()
+        clone = self._copy(
+            course,
+            title=title or self.default_title(course),
+            instructor=instructor,
+            is_published=False,
+            students_count=0,
+            rating=0,
+            created_at=now,
+            updated_at=now,
+        )
+        Course.objects.bulk_create([clone])
+
+        module_ids = {}
+        modules = []
+        for module in Module.objects.filter(course=course):
+            copy = self._copy(module, course=clone, created_at=now, updated_at=now)
+            module_ids[module.pk] = copy.pk
+            modules.append(copy)
+        Module.objects.bulk_create(modules, batch_size=self.BATCH_SIZE)
+
+        lesson_ids = {}
+        lessons = []
+        for lesson in Lesson.objects.filter(module__course=course):
+            copy = self._copy(
+                lesson,
+                module_id=module_ids[lesson.module_id],
+                created_at=now,
+                updated_at=now,
+            )
+            lesson_ids[lesson.pk] = copy.pk
+            lessons.append(copy)
+        Lesson.objects.bulk_create(lessons, batch_size=self.BATCH_SIZE)
+
+        LessonTopic.objects.bulk_create(
+            (
+                LessonTopic(lesson_id=lesson_ids[lesson_id], topic_id=topic_id)
+                for lesson_id, topic_id in LessonTopic.objects.filter(
+                    lesson__module__course=course
+                ).values_list("lesson_id", "topic_id")
+            ),
+            batch_size=self.BATCH_SIZE * 2,
+        )
+        Prerequisite.objects.bulk_create(
+            Prerequisite(from_course_id=clone.pk, to_course_id=prerequisite_id)
+            for prerequisite_id in Prerequisite.objects.filter(
+                from_course=course
+            ).values_list("to_course_id", flat=True)
+        )
+
+        # bulk_create skips the save signals that keep these current.
+        prerequisite_service.refresh([clone.pk])
+        search_index_service.index_courses([clone.pk])
+        content_version_service.bump_course_versions([clone.pk])
+        return clone
+
+    def run_pending(self) -> int:
+        """Process queued clone jobs one at a time; returns jobs finished."""
+        finished = 0
+        while job := self._claim_job():
+            try:
+                clone = self.clone(job.source, job.instructor, job.title)
+            except Exception as exc:
+                job.status, job.error = CourseCloneJob.Status.FAILED, str(exc)
+            else:
+                job.status, job.clone = CourseCloneJob.Status.DONE, clone
+            job.save(update_fields=["status", "clone", "error", "updated_at"])
+            finished += 1
+        return finished
+
+    # ==================== Internal ====================
+
+    @transaction.atomic
+    def _claim_job(self) -> CourseCloneJob | None:
+        job = (
+            CourseCloneJob.objects.select_for_update(skip_locked=True, of=("self",))
+            .filter(status=CourseCloneJob.Status.PENDING)
+            .select_related("source", "instructor")
+            .order_by("created_at")
+            .first()
+        )
+        if job is not None:
+            job.status = CourseCloneJob.Status.RUNNING
+            job.save(update_fields=["status", "updated_at"])
+        return job
+
+    def _copy(self, instance, **changes):
+        """An unsaved copy of `instance` with a new primary key."""
+        copy = type(instance)(
+            **{
+                field.attname: getattr(instance, field.attname)
+                for field in instance._meta.concrete_fields
+            }
+        )
+        copy.pk = uuid.uuid4()
+        for name, value in changes.items():
+            setattr(copy, name, value)
+        return copy
+
+
+course_clone_service = CourseCloneService()
@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+
+from django.db import transaction
+
+from apps.content.compression import (
+    COMPRESSIBLE_KEYS,
+    compress_text,
+    pack_content_data,
+    threshold,
+)
+from apps.content.models import ContentBlob, Lesson
+
+
+@dataclass
+class CompressionReport:
+    blobs: int = 0
+    transcripts: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+class LessonCompressionService:
+    """
+    Compresses lesson bodies and transcripts stored before compression was
+    enabled (new ones are compressed as they are saved).
+
+    Rows are walked in primary key order, `chunk_size` at a time. Each
+    chunk is re-read under row locks and written in its own transaction, so
+    an edit saved meanwhile is never overwritten, a long run holds no locks
+    for long, and it can be interrupted and started again. Lessons are
+    saved one by one so the usual receivers keep derived data in step.
+    """
+
+    CHUNK_SIZE = 500
+
+    def compress_existing(self, limit=None, chunk_size=None) -> CompressionReport:
+        limit = threshold() if limit is None else limit
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        report = CompressionReport()
+        if limit:
+            self._compress_blobs(limit, chunk_size, report)
+            self._compress_transcripts(limit, chunk_size, report)
+        return report
+
+    # ==================== Internal ====================
+
+    def _compress_blobs(self, limit, chunk_size, report) -> None:
+        blobs = ContentBlob.objects.filter(compressed=None, size__gte=limit)
+        for page in self._pages(blobs, chunk_size):
+            with transaction.atomic():
+                changed = []
+                chunk = blobs.select_for_update().filter(pk__in=page)
+                for blob in chunk.only("digest", "data", "size"):
+                    compressed = compress_text(blob.data, limit)
+                    if compressed is None:
+                        continue
+                    report.blobs += 1
+                    report.bytes_before += blob.size
+                    report.bytes_after += len(compressed)
+                    blob.data, blob.compressed = "", compressed
+                    changed.append(blob)
+                ContentBlob.objects.bulk_update(changed, ["data", "compressed"])
+
+    def _compress_transcripts(self, limit, chunk_size, report) -> None:
+        lessons = Lesson.objects.filter(content_data__has_any_keys=COMPRESSIBLE_KEYS)
+        for page in self._pages(lessons, chunk_size):
+            with transaction.atomic():
+                for lesson in lessons.select_for_update().filter(pk__in=page):
+                    packed = pack_content_data(lesson.content_data, limit)
+                    if packed is lesson.content_data:
+                        continue
+                    for key in COMPRESSIBLE_KEYS:
+                        if packed.get(key) is not lesson.content_data.get(key):
+                            report.transcripts += 1
+                            report.bytes_before += len(
+                                lesson.content_data[key].encode()
+                            )
+                            report.bytes_after += len(packed[key]["data"])
+                    lesson.content_data = packed
+                    lesson.save(update_fields=["content_data"])
+
+    def _pages(self, queryset, chunk_size):
+        """Primary keys of `queryset` in order, `chunk_size` at a time."""
+        keys = queryset.order_by("pk").values_list("pk", flat=True)
+        page = list(keys[:chunk_size])
+        while page:
+            yield page
+            page = list(keys.filter(pk__gt=page[-1])[:chunk_size])
+
+
+lesson_compression_service = LessonCompressionService()
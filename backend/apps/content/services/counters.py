@@ -0,0 +1,69 @@
+from django.db import models, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.content.models import Course, Lesson, Module
+
+
+class LessonCounterService:
+    """
+    Maintains the denormalized `published_lesson_count` on Module and Course.
+
+    Counters are recomputed from the lesson rows with a correlated UPDATE
+    rather than incremented, so a missed or repeated signal can never leave
+    them permanently off.
+    """
+
+    def _count(self, lessons, group_by):
+        return Coalesce(
+            Subquery(
+                lessons.order_by()
+                .values(group_by)
+                .annotate(count=Count("id"))
+                .values("count"),
+                output_field=models.IntegerField(),
+            ),
+            0,
+        )
+
+    def module_count(self):
+        return self._count(
+            Lesson.objects.filter(module=OuterRef("pk"), is_published=True),
+            "module",
+        )
+
+    def course_count(self):
+        return self._count(
+            Lesson.objects.filter(
+                module__course=OuterRef("pk"),
+                module__is_published=True,
+                is_published=True,
+            ),
+            "module__course",
+        )
+
+    @transaction.atomic
+    def refresh_modules(self, module_ids) -> None:
+        """Recount the given modules and the courses they belong to."""
+        module_ids = {module_id for module_id in module_ids if module_id}
+        if not module_ids:
+            return
+        modules = Module.objects.filter(pk__in=module_ids)
+        modules.update(published_lesson_count=self.module_count())
+        self.refresh_courses(modules.values_list("course_id", flat=True))
+
+    @transaction.atomic
+    def refresh_courses(self, course_ids) -> None:
+        Course.objects.filter(pk__in=course_ids).update(
+            published_lesson_count=self.course_count()
+        )
+
+    @transaction.atomic
+    def rebuild(self) -> tuple:
+        """Recompute every counter; returns (modules, courses) updated."""
+        modules = Module.objects.update(published_lesson_count=self.module_count())
+        courses = Course.objects.update(published_lesson_count=self.course_count())
+        return modules, courses
+
+
+lesson_counter_service = LessonCounterService()
@@ -0,0 +1,34 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.content.services.versioning import content_version_service
+
+
+class CourseDetailCache:
+    """Serialized public course detail, keyed by course ID and content version."""
+
+    key_prefix = "content:course"
+
+    def __init__(self, version_service=None):
+        self._versions = version_service or content_version_service
+
+    def _key(self, course_id, variant: str = "") -> str:
+        version = self._versions.get_course_version(course_id)
+        key = f"{self.key_prefix}:{course_id}:detail:{version}"
+        if not variant:
+            return key
+        return f"{key}:{hashlib.md5(variant.encode()).hexdigest()}"
+
+    def get_or_build(self, course_id, build, variant: str = ""):
+        """
+        `variant` separates differently shaped payloads (e.g. the canonical
+        key of a sparse fieldset).
+        """
+        key = self._key(course_id, variant)
+        data = cache.get(key)
+        if data is None:
+            data = build()
+            cache.set(key, data, timeout=settings.COURSE_DETAIL_CACHE_TIMEOUT)
+        return data
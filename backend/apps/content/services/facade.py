@@ -1,4 +1,11 @@
-from apps.content.models import Course, Lesson
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from apps.content.models import Course, Lesson, Module, PrerequisitePath
+from apps.content.services.structure import CourseStructure, course_structure_cache
+from apps.content.services.versioning import content_version_service
 
 
 class ContentExternalFacade:
@@ -10,6 +17,24 @@ class ContentExternalFacade:
     def published_course_exists(self, course_id) -> bool:
         return Course.objects.filter(id=course_id, is_published=True).exists()
 
+    def has_unmet_prerequisites(self, course_id, completed_course_ids) -> bool:
+        """
+        True if a published course required (transitively) before `course_id`
+        is not in `completed_course_ids`. Pass a values queryset to keep this
+        a single query; it must not contain NULLs.
+        """
+        return (
+            PrerequisitePath.objects.filter(
+                descendant_id=course_id, ancestor__is_published=True
+            )
+            .exclude(ancestor_id__in=completed_course_ids)
+            .exists()
+        )
+
+    def get_course_structure(self, course_id) -> CourseStructure:
+        """Module and lesson IDs of a course, served from a per-process cache."""
+        return course_structure_cache.get(course_id)
+
     def lesson_exists_in_course(self, lesson_id, course_id) -> bool:
         return Lesson.objects.filter(id=lesson_id, module__course_id=course_id).exists()
 
@@ -20,14 +45,20 @@ class ContentExternalFacade:
             return None
 
     def count_published_lessons_in_course(self, course_id) -> int:
-        return Lesson.objects.filter(
-            module__course_id=course_id,
-            module__is_published=True,
-            is_published=True,
-        ).count()
+        return (
+            Course.objects.filter(id=course_id)
+            .values_list("published_lesson_count", flat=True)
+            .first()
+            or 0
+        )
 
     def count_published_lessons_in_module(self, module_id) -> int:
-        return Lesson.objects.filter(module_id=module_id, is_published=True).count()
+        return (
+            Module.objects.filter(id=module_id)
+            .values_list("published_lesson_count", flat=True)
+            .first()
+            or 0
+        )
 
     def get_published_lesson_ids_in_module(self, module_id) -> list:
         return list(
@@ -35,3 +66,92 @@ class ContentExternalFacade:
                 "id", flat=True
             )
         )
+
+    # ==================== Batch lookups ====================
+    # One query each, whatever the number of IDs. Results are keyed by the
+    # database value of each ID, so string and UUID inputs both work.
+
+    def get_module_ids_for_lessons(self, lesson_ids) -> dict:
+        """{lesson_id: module_id}; unknown lessons are left out."""
+        return dict(
+            Lesson.objects.filter(id__in=self._ids(Lesson, lesson_ids)).values_list(
+                "id", "module_id"
+            )
+        )
+
+    def lessons_exist_in_course(self, lesson_ids, course_id) -> dict:
+        """{lesson_id: bool} for every requested lesson."""
+        lesson_ids = self._ids(Lesson, lesson_ids)
+        found = set(
+            Lesson.objects.filter(
+                id__in=lesson_ids, module__course_id=course_id
+            ).values_list("id", flat=True)
+        )
+        return {lesson_id: lesson_id in found for lesson_id in lesson_ids}
+
+    def count_published_lessons_in_courses(self, course_ids) -> dict:
+        """{course_id: published lesson count}; unknown courses count 0."""
+        return self._published_lesson_counts(Course, course_ids)
+
+    def count_published_lessons_in_modules(self, module_ids) -> dict:
+        """{module_id: published lesson count}; unknown modules count 0."""
+        return self._published_lesson_counts(Module, module_ids)
+
+    def get_published_lesson_ids_in_modules(self, module_ids) -> dict:
+        """{module_id: [published lesson IDs]} for every requested module."""
+        module_ids = self._ids(Module, module_ids)
+        lessons = {module_id: [] for module_id in module_ids}
+        for module_id, lesson_id in Lesson.objects.filter(
+            module_id__in=module_ids, is_published=True
+        ).values_list("module_id", "id"):
+            lessons[module_id].append(lesson_id)
+        return lessons
+
+    def apply_students_count_deltas(self, deltas: dict) -> None:
+        """Add `deltas` ({course_id: change}) to Course.students_count."""
+        changed = sorted(
+            (str(course_id), delta) for course_id, delta in deltas.items() if delta
+        )
+        now = timezone.now()
+        with transaction.atomic():
+            # Fixed lock order keeps concurrent flushes from deadlocking.
+            for course_id, delta in changed:
+                Course.objects.filter(id=course_id).update(
+                    students_count=Greatest(F("students_count") + delta, Value(0)),
+                    updated_at=now,
+                )
+        content_version_service.bump_course_versions(
+            [course_id for course_id, _ in changed]
+        )
+
+    def set_students_counts(self, counts: dict) -> int:
+        """Overwrite students_count from `counts`; missing courses become 0."""
+        now = timezone.now()
+        courses = []
+        for course_id, students_count in Course.objects.values_list(
+            "id", "students_count"
+        ):
+            expected = counts.get(course_id, 0)
+            if students_count != expected:
+                courses.append(
+                    Course(id=course_id, students_count=expected, updated_at=now)
+                )
+        Course.objects.bulk_update(
+            courses, ["students_count", "updated_at"], batch_size=500
+        )
+        content_version_service.bump_course_versions([course.id for course in courses])
+        return len(courses)
+
+    # ==================== Internal ====================
+
+    def _ids(self, model, ids) -> list:
+        to_python = model._meta.pk.to_python
+        return list(dict.fromkeys(to_python(pk) for pk in ids))
+
+    def _published_lesson_counts(self, model, ids) -> dict:
+        ids = self._ids(model, ids)
+        counts = dict.fromkeys(ids, 0)
+        counts.update(
+            model.objects.filter(id__in=ids).values_list("id", "published_lesson_count")
+        )
+        return counts
@@ -0,0 +1,90 @@
+from django.db import transaction
+from django.db.models import Count
+
+from apps.content.models import CatalogFacet, Category, Course
+
+
+class CatalogFacetService:
+    """
+    Maintains CatalogFacet rows (published-course counts per category and
+    difficulty). Writes recount only the buckets a course moved in or out
+    of, so reading facets never aggregates the course table.
+    """
+
+    def get_facets(self) -> dict:
+        facets = {choice: [] for choice in CatalogFacet.Facet.values}
+        for row in CatalogFacet.objects.filter(count__gt=0):
+            facets[row.facet].append(
+                {"value": row.value, "label": row.label, "count": row.count}
+            )
+        return facets
+
+    @transaction.atomic
+    def refresh(self, category_ids=(), difficulties=()) -> None:
+        published = Course.objects.filter(is_published=True)
+        categories = Category.objects.in_bulk(
+            [category_id for category_id in category_ids if category_id]
+        )
+        for category_id, category in categories.items():
+            self._set(
+                CatalogFacet.Facet.CATEGORY,
+                category_id,
+                category.name,
+                published.filter(category_id=category_id).count(),
+            )
+
+        labels = dict(Course.DifficultyLevel.choices)
+        for difficulty in {d for d in difficulties if d in labels}:
+            self._set(
+                CatalogFacet.Facet.DIFFICULTY,
+                difficulty,
+                labels[difficulty],
+                published.filter(difficulty_level=difficulty).count(),
+            )
+
+    def rename_category(self, category: Category) -> None:
+        CatalogFacet.objects.filter(
+            facet=CatalogFacet.Facet.CATEGORY, value=str(category.pk)
+        ).update(label=category.name)
+
+    def remove_category(self, category_id) -> None:
+        CatalogFacet.objects.filter(
+            facet=CatalogFacet.Facet.CATEGORY, value=str(category_id)
+        ).delete()
+
+    @transaction.atomic
+    def rebuild(self) -> int:
+        """Recompute every bucket with two grouped queries."""
+        CatalogFacet.objects.all().delete()
+        published = Course.objects.filter(is_published=True).order_by()
+        rows = [
+            CatalogFacet(
+                facet=CatalogFacet.Facet.CATEGORY,
+                value=str(row["category_id"]),
+                label=row["category__name"],
+                count=row["count"],
+            )
+            for row in published.filter(category__isnull=False)
+            .values("category_id", "category__name")
+            .annotate(count=Count("id"))
+        ]
+        labels = dict(Course.DifficultyLevel.choices)
+        rows += [
+            CatalogFacet(
+                facet=CatalogFacet.Facet.DIFFICULTY,
+                value=row["difficulty_level"],
+                label=labels.get(row["difficulty_level"], row["difficulty_level"]),
+                count=row["count"],
+            )
+            for row in published.values("difficulty_level").annotate(count=Count("id"))
+        ]
+        CatalogFacet.objects.bulk_create(rows)
+        return len(rows)
+
+    def _set(self, facet, value, label, count) -> None:
+        CatalogFacet.objects.update_or_create(
+            facet=facet, value=str(value), defaults={"label": label, "count": count}
+        )
+
+
+catalog_facet_service = CatalogFacetService()
@@ -0,0 +1,96 @@
+from dataclasses import dataclass, field
+
+
+def _paths(param: str | None):
+    """Split "a,b.c" into [("a",), ("b", "c")]; None when the param is absent."""
+    if param is None:
+        return None
+    paths = []
+    for item in param.split(","):
+        segments = tuple(segment for segment in item.strip().split(".") if segment)
+        if segments:
+            paths.append(segments)
+    return paths
+
+
+@dataclass
+class FieldSelection:
+    """
+    Requested shape of a serialized object, parsed from `?fields=` and
+    `?expand=`.
+
+    `fields` limits the attributes rendered at this level and `expand` names
+    the nested relations to render; None means "everything", which is also
+    the behaviour when the parameters are absent. An empty `?fields=` is
+    treated as absent too, while an empty `?expand=` expands nothing.
+    Dotted paths address nested levels (`modules.lessons.title`), and
+    naming a nested field in `fields` implies expanding it.
+    """
+
+    fields: frozenset | None = None
+    expand: frozenset | None = None
+    children: dict = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, fields: str | None = None, expand: str | None = None):
+        # An empty field list would render empty objects; treat it as absent.
+        field_paths, expand_paths = _paths(fields) or None, _paths(expand)
+        return cls._build(field_paths, expand_paths)
+
+    @classmethod
+    def from_query_params(cls, query_params):
+        return cls.parse(query_params.get("fields"), query_params.get("expand"))
+
+    @classmethod
+    def _build(cls, field_paths, expand_paths):
+        fields = None
+        if field_paths is not None:
+            fields = frozenset(path[0] for path in field_paths)
+        expand = None
+        if expand_paths is not None:
+            expand = frozenset(path[0] for path in expand_paths)
+            expand |= {path[0] for path in field_paths or () if len(path) > 1}
+
+        children = {}
+        for name in (fields or frozenset()) | (expand or frozenset()):
+            child_fields = None
+            if field_paths is not None:
+                child_fields = [p[1:] for p in field_paths if p[0] == name and p[1:]]
+            child_expand = None
+            if expand_paths is not None:
+                child_expand = [p[1:] for p in expand_paths if p[0] == name and p[1:]]
+            children[name] = cls._build(child_fields or None, child_expand)
+        return cls(fields=fields, expand=expand, children=children)
+
+    @property
+    def is_default(self) -> bool:
+        return self.fields is None and self.expand is None
+
+    def includes(self, name: str) -> bool:
+        return self.fields is None or name in self.fields
+
+    def expands(self, name: str) -> bool:
+        if self.expand is not None:
+            return name in self.expand
+        return self.includes(name)
+
+    def shape_key(self, shape: dict) -> str:
+        """
+        Canonical form of what this selection renders of `shape` ({field
+        name: nested shape, or None for a value}). Names the serializer does
+        not have drop out, so they cannot multiply cached variants.
+        """
+        if self.is_default:
+            return "*"
+        parts = []
+        for name, nested in sorted(shape.items()):
+            if nested is None:
+                if self.includes(name):
+                    parts.append(name)
+            elif self.expands(name):
+                parts.append(f"{name}({self.child(name).shape_key(nested)})")
+        return ",".join(parts)
+
+    def child(self, name: str):
+        default = FieldSelection(expand=None if self.expand is None else frozenset())
+        return self.children.get(name, default)
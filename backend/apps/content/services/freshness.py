@@ -0,0 +1,76 @@
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.http import quote_etag
+
+from apps.content.models import Course
+from apps.content.services.versioning import content_version_service
+
+
+class ContentFreshnessService:
+    """
+    Validators (strong ETag + Last-Modified) for public content responses.
+
+    A course's validators come from one aggregate query over its course,
+    module and lesson timestamps. The catalog's read course rows only: the
+    catalog version token already moves whenever anything inside any course
+    does, so joining every module and lesson on each list request would buy
+    nothing. Row counts are folded in so deletions, which leave no
+    timestamp behind, still change the tag, and so are the cached content
+    version tokens, which also move on topic-link and rename changes.
+    Last-Modified likewise includes the time the version token was issued,
+    so deletes and unpublishing move it forward too.
+    """
+
+    def __init__(self, version_service=None):
+        self._versions = version_service or content_version_service
+
+    def get_course_validators(self, course_id):
+        try:
+            stats = Course.objects.filter(pk=course_id, is_published=True).aggregate(
+                exists=Count("id", distinct=True),
+                **self._aggregates(),
+            )
+        except ValidationError:
+            # Malformed ID: let the regular lookup produce the 404.
+            return None
+        if not stats["exists"]:
+            return None
+        version = self._versions.get_course_version(course_id)
+        return self._validators(stats, [course_id, version], version)
+
+    def get_catalog_validators(self, request_path: str):
+        stats = Course.objects.filter(is_published=True).aggregate(
+            course_count=Count("id"),
+            course_updated=Max("updated_at"),
+        )
+        version = self._versions.get_catalog_version()
+        return self._validators(stats, [request_path, version], version)
+
+    def _aggregates(self) -> dict:
+        return {
+            "course_updated": Max("updated_at"),
+            "module_updated": Max("modules__updated_at"),
+            "lesson_updated": Max("modules__lessons__updated_at"),
+            "category_updated": Max("category__updated_at"),
+            "instructor_updated": Max("instructor__updated_at"),
+            "module_count": Count("modules", distinct=True),
+            "lesson_count": Count("modules__lessons", distinct=True),
+        }
+
+    def _validators(self, stats: dict, extra: list, version: str):
+        timestamps = [
+            stats[key]
+            for key in ("course_updated", "module_updated", "lesson_updated")
+            if stats.get(key) is not None
+        ]
+        changed_at = self._versions.changed_at(version)
+        if changed_at is not None:
+            timestamps.append(changed_at)
+        last_modified = max(timestamps) if timestamps else None
+
+        parts = [str(part) for part in extra]
+        parts += [f"{key}={stats[key]}" for key in sorted(stats)]
+        digest = hashlib.sha256("|".join(parts).encode()).hexdigest()
+        return quote_etag(digest), last_modified
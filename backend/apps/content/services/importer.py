@@ -0,0 +1,145 @@
+from dataclasses import dataclass, field
+
+from django.db import transaction
+
+from apps.content.models import Category, Course, Lesson, Module, Topic
+from apps.content.services.counters import lesson_counter_service
+from apps.content.services.facets import catalog_facet_service
+from apps.content.services.search import search_index_service
+from apps.content.services.versioning import content_version_service
+
+LessonTopic = Lesson.topics.through
+
+
+@dataclass
+class ImportResult:
+    course_ids: list = field(default_factory=list)
+    modules: int = 0
+    lessons: int = 0
+    errors: list = field(default_factory=list)
+
+
+class CoursePackageImporter:
+    """
+    Creates whole course trees (the nested shape of data/fixtures/courses.json)
+    with one bulk_create per table.
+
+    Categories and topics are resolved by name with one query each for the
+    whole package, and lesson bodies are interned as content blobs in one
+    batch. bulk_create skips the save signals, so the lesson counters, blob
+    references, catalog facets, search index and course versions are
+    brought up to date explicitly, once per package.
+    """
+
+    BATCH_SIZE = 500
+
+    @transaction.atomic
+    def import_courses(self, instructor, items) -> ImportResult:
+        """`items` are (index, validated CourseImportSerializer data) pairs."""
+        result = ImportResult()
+        categories = self._resolve(
+            Category, {course.get("category_name") for _, course in items}
+        )
+        topics = self._resolve(
+            Topic,
+            {
+                name
+                for _, course in items
+                for module in course.get("modules", [])
+                for lesson in module.get("lessons", [])
+                for name in lesson.get("topic_names", [])
+            },
+        )
+
+        courses, modules, lessons, links = [], [], [], []
+        for index, data in items:
+            errors = self._unknown_names(data, categories, topics)
+            if errors:
+                result.errors.append({"index": index, "errors": errors})
+                continue
+            course = self._build_course(instructor, data, categories)
+            courses.append(course)
+            for position, module_data in enumerate(data.get("modules", [])):
+                module = self._build(Module, module_data, position, course=course)
+                modules.append(module)
+                for order, lesson_data in enumerate(module_data.get("lessons", [])):
+                    lesson = self._build(Lesson, lesson_data, order, module=module)
+                    lessons.append(lesson)
+                    links += [
+                        LessonTopic(lesson_id=lesson.pk, topic_id=topics[name])
+                        for name in dict.fromkeys(lesson_data.get("topic_names", []))
+                    ]
+
+        if not courses:
+            return result
+        Course.objects.bulk_create(courses, batch_size=self.BATCH_SIZE)
+        Module.objects.bulk_create(modules, batch_size=self.BATCH_SIZE)
+        Lesson.objects.bulk_create(lessons, batch_size=self.BATCH_SIZE)
+        LessonTopic.objects.bulk_create(links, batch_size=self.BATCH_SIZE * 2)
+
+        result.course_ids = [course.pk for course in courses]
+        result.modules, result.lessons = len(modules), len(lessons)
+        self._refresh_derived(courses, modules)
+        return result
+
+    # ==================== Internal ====================
+
+    def _resolve(self, model, names) -> dict:
+        names = {name for name in names if name}
+        if not names:
+            return {}
+        return dict(model.objects.filter(name__in=names).values_list("name", "pk"))
+
+    def _unknown_names(self, data, categories, topics) -> dict:
+        errors = {}
+        category_name = data.get("category_name")
+        if category_name and category_name not in categories:
+            errors["category_name"] = [f"Unknown category: {category_name}"]
+        missing = sorted(
+            {
+                name
+                for module in data.get("modules", [])
+                for lesson in module.get("lessons", [])
+                for name in lesson.get("topic_names", [])
+            }
+            - topics.keys()
+        )
+        if missing:
+            errors["topic_names"] = [f"Unknown topics: {', '.join(missing)}"]
+        return errors
+
+    def _build_course(self, instructor, data, categories) -> Course:
+        fields = {
+            name: value
+            for name, value in data.items()
+            if name not in ("category_name", "modules")
+        }
+        return Course(
+            instructor=instructor,
+            category_id=categories.get(data.get("category_name")),
+            **fields,
+        )
+
+    def _build(self, model, data, position, **parent):
+        fields = {
+            name: value
+            for name, value in data.items()
+            if name not in ("lessons", "topic_names")
+        }
+        fields.setdefault("order", position)
+        return model(**parent, **fields)
+
+    def _refresh_derived(self, courses, modules) -> None:
+        course_ids = [course.pk for course in courses]
+        lesson_counter_service.refresh_modules(module.pk for module in modules)
+        published = [course for course in courses if course.is_published]
+        if published:
+            catalog_facet_service.refresh(
+                category_ids={course.category_id for course in published},
+                difficulties={course.difficulty_level for course in published},
+            )
+        search_index_service.index_courses(course_ids)
+        content_version_service.bump_course_versions(course_ids)
+
+
+course_package_importer = CoursePackageImporter()
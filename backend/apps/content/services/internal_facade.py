@@ -1,6 +1,16 @@
 from apps.content.services.query import ContentQueryService
-from apps.content.services.authority import InstructorAuthorityService
+from apps.content.services.authority import (
+    InstructorAuthorityService,
+    OwnershipResolver,
+)
 from apps.content.services.lesson_content import LessonContentService
+from apps.content.services.course_cache import CourseDetailCache
+from apps.content.services.freshness import ContentFreshnessService
+from apps.content.services.search import search_query_service
+from apps.content.services.facets import catalog_facet_service
+from apps.content.services.cloning import course_clone_service
+from apps.content.services.importer import course_package_importer
+from apps.content.services.ordering import content_ordering_service
 
 
 class ContentInternalFacade:
@@ -11,10 +21,24 @@ class ContentInternalFacade:
         query_service=None,
         authority_service=None,
         lesson_content_service=None,
+        course_detail_cache=None,
+        freshness_service=None,
+        search_service=None,
+        facet_service=None,
+        ordering_service=None,
+        package_importer=None,
+        clone_service=None,
     ):
         self._query = query_service or ContentQueryService()
         self._authority = authority_service or InstructorAuthorityService()
         self._lesson_content = lesson_content_service or LessonContentService()
+        self._course_detail_cache = course_detail_cache or CourseDetailCache()
+        self._freshness = freshness_service or ContentFreshnessService()
+        self._search = search_service or search_query_service
+        self._facets = facet_service or catalog_facet_service
+        self._ordering = ordering_service or content_ordering_service
+        self._importer = package_importer or course_package_importer
+        self._cloning = clone_service or course_clone_service
 
     # === Query operations ===
     def get_all_categories(self):
@@ -29,11 +53,34 @@ class ContentInternalFacade:
     def get_instructor_modules_with_lessons(self, user):
         return self._query.get_instructor_modules_with_lessons(user)
 
-    def get_instructor_lessons_with_topics(self, user):
-        return self._query.get_instructor_lessons_with_topics(user)
+    def get_instructor_lessons_with_topics(self, user, selection=None, outline=False):
+        return self._query.get_instructor_lessons_with_topics(user, selection, outline)
 
-    def get_published_courses_with_content(self):
-        return self._query.get_published_courses_with_content()
+    def get_published_courses_with_content(self, selection=None):
+        return self._query.get_published_courses_with_content(selection)
+
+    def get_published_course_catalog(self, filters=None, selection=None):
+        return self._query.get_published_course_catalog(filters, selection)
+
+    def get_course_prerequisites(self, course_id):
+        return self._query.get_course_prerequisites(course_id)
+
+    def get_catalog_facets(self) -> dict:
+        return self._facets.get_facets()
+
+    # === Cached reads ===
+    def get_course_detail(self, course_id, build, variant: str = "") -> dict:
+        return self._course_detail_cache.get_or_build(course_id, build, variant)
+
+    def get_course_validators(self, course_id):
+        return self._freshness.get_course_validators(course_id)
+
+    def get_catalog_validators(self, request_path: str):
+        return self._freshness.get_catalog_validators(request_path)
+
+    # === Search ===
+    def search(self, query: str, kinds=None, limit: int = 20) -> list:
+        return self._search.search(query, kinds=kinds, limit=limit)
 
     # === Authority operations ===
     def is_course_owner(self, user, course_id) -> bool:
@@ -45,10 +92,43 @@ class ContentInternalFacade:
     def is_lesson_owner(self, user, lesson_id) -> bool:
         return self._authority.is_lesson_owner(user, lesson_id)
 
+    def get_ownership_resolver(self, request) -> OwnershipResolver:
+        return OwnershipResolver.for_request(request)
+
+    # === Ordering operations ===
+    def reorder_modules(self, user, course_id, module_ids):
+        return self._ordering.reorder_modules(user, course_id, module_ids)
+
+    def reorder_lessons(self, user, module_id, lesson_ids):
+        return self._ordering.reorder_lessons(user, module_id, lesson_ids)
+
+    # === Import operations ===
+    def import_courses(self, instructor, items):
+        return self._importer.import_courses(instructor, items)
+
+    # === Cloning operations ===
+    def should_defer_clone(self, course_id) -> bool:
+        return self._cloning.should_defer(course_id)
+
+    def clone_course(self, course, instructor, title=None):
+        return self._cloning.clone(course, instructor, title)
+
+    def enqueue_course_clone(self, course, instructor, title=None):
+        return self._cloning.enqueue(course, instructor, title)
+
+    def get_clone_job(self, instructor, job_id):
+        return self._query.get_clone_job(instructor, job_id)
+
     # === Lesson content operations ===
     def get_lesson_content(self, lesson) -> dict:
         return self._lesson_content.get_lesson_content(lesson)
 
+    def get_lessons_content(self, lessons) -> dict:
+        return self._lesson_content.get_lessons_content(lessons)
+
+    def get_stored_file(self, user, storage_type, digest) -> dict | None:
+        return self._query.get_stored_file(user, storage_type, digest)
+
     def set_lesson_content(self, lesson, content_data: dict, storage_type: str = None):
         return self._lesson_content.set_lesson_content(
             lesson, content_data, storage_type
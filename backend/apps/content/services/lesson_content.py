@@ -1,4 +1,8 @@
-from apps.content.storage import content_storage_service
+from django.db.models import prefetch_related_objects
+
+from apps.content.compression import unpack_content_data
+from apps.content.models import Lesson
+from apps.content.storage import RetrieveResult, content_storage_service
 
 
 class LessonContentService:
@@ -7,11 +11,49 @@ class LessonContentService:
 
     def get_lesson_content(self, lesson) -> dict:
         if lesson.content_data:
-            return self._storage_service.retrieve(lesson.content_data)
+            return self._storage_service.retrieve(
+                unpack_content_data(lesson.content_data)
+            )
         if lesson.content:
             return {"main_content": lesson.content}
         return {}
 
+    def get_lessons_content(self, lessons) -> dict:
+        """
+        {lesson ID: RetrieveResult} for many lessons, with stored content
+        fetched in one batch per storage backend and plain-text bodies in
+        one query. Lessons loaded without content_data (outline querysets)
+        have it read back in one query too.
+        """
+        lessons = list(lessons)
+        self._load_content_data(lessons)
+        prefetch_related_objects(
+            [lesson for lesson in lessons if not lesson.content_data], "content_blob"
+        )
+        results, stored = {}, {}
+        for lesson in lessons:
+            if lesson.content_data:
+                stored[lesson.pk] = unpack_content_data(lesson.content_data)
+            elif lesson.content:
+                results[lesson.pk] = RetrieveResult({"main_content": lesson.content})
+            else:
+                results[lesson.pk] = RetrieveResult({})
+        results.update(self._storage_service.retrieve_many(stored))
+        return results
+
+    def _load_content_data(self, lessons) -> None:
+        deferred = {
+            lesson.pk: lesson
+            for lesson in lessons
+            if "content_data" in lesson.get_deferred_fields()
+        }
+        if not deferred:
+            return
+        for pk, content_data in Lesson.objects.filter(pk__in=deferred).values_list(
+            "pk", "content_data"
+        ):
+            deferred[pk].content_data = content_data
+
     def set_lesson_content(
         self, lesson, content_data: dict, storage_type: str = None
     ) -> None:
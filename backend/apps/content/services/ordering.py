@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.content.models import Lesson, Module
+from apps.content.services.versioning import content_version_service
+
+
+@dataclass
+class ReorderResult:
+    success: bool
+    updated: int = 0
+    error: str | None = None
+    forbidden: bool = False
+
+
+class ContentOrderingService:
+    """
+    Applies a whole new display order to a course's modules or a module's
+    lessons: one locked query reads the siblings together with their owner,
+    and the positions that changed are written with a single bulk_update.
+    """
+
+    def reorder_modules(self, user, course_id, module_ids) -> ReorderResult:
+        return self._reorder(
+            Module.objects.filter(course_id=course_id),
+            user,
+            module_ids,
+            owner="course__instructor_id",
+            course="course_id",
+            not_owner="You don't own this course",
+            mismatch="ids must list every module of the course exactly once",
+        )
+
+    def reorder_lessons(self, user, module_id, lesson_ids) -> ReorderResult:
+        return self._reorder(
+            Lesson.objects.filter(module_id=module_id),
+            user,
+            lesson_ids,
+            owner="module__course__instructor_id",
+            course="module__course_id",
+            not_owner="You don't own this module",
+            mismatch="ids must list every lesson of the module exactly once",
+        )
+
+    @transaction.atomic
+    def _reorder(self, siblings, user, ids, owner, course, not_owner, mismatch):
+        rows = list(
+            siblings.select_for_update(of=("self",))
+            .order_by()
+            .values_list("id", "order", owner, course)
+        )
+        if any(row[2] != user.id for row in rows):
+            return ReorderResult(success=False, error=not_owner, forbidden=True)
+        current = {str(row[0]): row[1] for row in rows}
+        ids = [str(pk) for pk in ids]
+        if len(ids) != len(current) or set(ids) != set(current):
+            return ReorderResult(success=False, error=mismatch)
+
+        now = timezone.now()
+        changed = [
+            siblings.model(id=pk, order=position, updated_at=now)
+            for position, pk in enumerate(ids)
+            if current[pk] != position
+        ]
+        siblings.model.objects.bulk_update(changed, ["order", "updated_at"])
+        if changed:
+            content_version_service.bump_course_versions([rows[0][3]])
+        return ReorderResult(success=True, updated=len(changed))
+
+
+content_ordering_service = ContentOrderingService()
@@ -0,0 +1,123 @@
+from collections import defaultdict
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from apps.content.models import Course, PrerequisitePath
+
+Prerequisite = Course.prerequisites.through
+
+
+class PrerequisiteService:
+    """
+    Maintains PrerequisitePath, the transitive closure of Course.prerequisites.
+
+    When a course's links change, only that course and the courses that
+    depend on it can gain or lose ancestors, so their paths are recomputed
+    from the direct links and the (unchanged) paths of everything else.
+    Links that would close a cycle are rejected up front, which keeps the
+    graph acyclic and every question about it a single indexed lookup.
+    """
+
+    cycle_message = "A course cannot depend on itself, directly or indirectly."
+
+    def check_links(self, course_ids, prerequisite_ids) -> None:
+        """Raise ValidationError if linking the courses to these prerequisites
+        would create a cycle."""
+        course_ids = {str(course_id) for course_id in course_ids}
+        prerequisite_ids = {str(course_id) for course_id in prerequisite_ids}
+        if course_ids & prerequisite_ids:
+            raise ValidationError(self.cycle_message)
+        # A prerequisite that already depends on the course would close a loop.
+        if PrerequisitePath.objects.filter(
+            ancestor_id__in=course_ids, descendant_id__in=prerequisite_ids
+        ).exists():
+            raise ValidationError(self.cycle_message)
+
+    def dependent_ids(self, course_ids) -> set:
+        """Courses that (transitively) require any of `course_ids`."""
+        return set(
+            PrerequisitePath.objects.filter(ancestor_id__in=course_ids).values_list(
+                "descendant_id", flat=True
+            )
+        )
+
+    @transaction.atomic
+    def refresh(self, course_ids) -> None:
+        """Recompute the paths of `course_ids` and everything depending on them."""
+        course_ids = {course_id for course_id in course_ids if course_id}
+        if not course_ids:
+            return
+        affected = course_ids | self.dependent_ids(course_ids)
+
+        direct = defaultdict(set)
+        for course_id, prerequisite_id in Prerequisite.objects.filter(
+            from_course_id__in=affected
+        ).values_list("from_course_id", "to_course_id"):
+            direct[course_id].add(prerequisite_id)
+
+        # Paths of courses outside the affected set are still correct.
+        known = defaultdict(dict)
+        outside = set().union(*direct.values()) - affected
+        for descendant, ancestor, depth in PrerequisitePath.objects.filter(
+            descendant_id__in=outside
+        ).values_list("descendant_id", "ancestor_id", "depth"):
+            known[descendant][ancestor] = depth
+
+        for course_id in affected:
+            self._ancestors(course_id, direct, known)
+
+        PrerequisitePath.objects.filter(descendant_id__in=affected).delete()
+        self._write({course_id: known[course_id] for course_id in affected})
+
+    @transaction.atomic
+    def rebuild(self) -> int:
+        """Recompute the whole closure from the prerequisite links."""
+        direct = defaultdict(set)
+        for course_id, prerequisite_id in Prerequisite.objects.values_list(
+            "from_course_id", "to_course_id"
+        ):
+            direct[course_id].add(prerequisite_id)
+
+        known = defaultdict(dict)
+        for course_id in list(direct):
+            self._ancestors(course_id, direct, known)
+
+        PrerequisitePath.objects.all().delete()
+        return self._write(known)
+
+    # ==================== Internal ====================
+
+    def _ancestors(self, course_id, direct, known, visiting=frozenset()) -> dict:
+        """Fill `known[course_id]` with {ancestor: shortest depth}."""
+        if course_id in known or course_id in visiting:
+            # Computed already, or a cycle in data written around the checks.
+            return known.get(course_id, {})
+        ancestors = {}
+        for prerequisite_id in direct.get(course_id, ()):
+            ancestors[prerequisite_id] = 1
+            inherited = self._ancestors(
+                prerequisite_id, direct, known, visiting | {course_id}
+            )
+            for ancestor_id, depth in inherited.items():
+                if depth + 1 < ancestors.get(ancestor_id, depth + 2):
+                    ancestors[ancestor_id] = depth + 1
+        ancestors.pop(course_id, None)
+        known[course_id] = ancestors
+        return ancestors
+
+    def _write(self, closure: dict) -> int:
+        paths = PrerequisitePath.objects.bulk_create(
+            (
+                PrerequisitePath(
+                    ancestor_id=ancestor_id, descendant_id=course_id, depth=depth
+                )
+                for course_id, ancestors in closure.items()
+                for ancestor_id, depth in ancestors.items()
+            ),
+            batch_size=1000,
+        )
+        return len(paths)
+
+
+prerequisite_service = PrerequisiteService()
@@ -1,10 +1,53 @@
-from django.db import models
-from django.db.models import Count, Prefetch, QuerySet
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import (
+    Count,
+    Exists,
+    F,
+    OuterRef,
+    Prefetch,
+    Q,
+    QuerySet,
+    Subquery,
+)
 
-from apps.content.models import Course, Module, Lesson, Category, Topic
+from apps.content.models import (
+    Category,
+    Course,
+    CourseCloneJob,
+    Lesson,
+    Module,
+    PrerequisitePath,
+    Topic,
+)
 
 
 class ContentQueryService:
+    # Columns rendered by CourseListSerializer; everything else stays in the DB.
+    CATALOG_FIELDS = [
+        "id",
+        "title",
+        "description",
+        "cover_image",
+        "difficulty_level",
+        "est_duration",
+        "rating",
+        "students_count",
+        "created_at",
+        "category__name",
+        "instructor__fullname",
+        "instructor__username",
+    ]
+
+    # Large lesson columns rendered only by LessonDetailSerializer (the body
+    # itself lives in ContentBlob and is only joined when rendered).
+    HEAVY_LESSON_FIELDS = ("content_data",)
+
+    # Serializer fields that read related columns rather than their own.
+    COURSE_FIELD_COLUMNS = {
+        "category": ["category__name"],
+        "instructor_name": ["instructor__fullname", "instructor__username"],
+    }
+
     def get_all_categories(self) -> QuerySet[Category]:
         return Category.objects.all()
 
@@ -23,9 +66,9 @@ class ContentQueryService:
                     .prefetch_related(
                         Prefetch(
                             "lessons",
-                            queryset=Lesson.objects.order_by("order").prefetch_related(
-                                "topics"
-                            ),
+                            queryset=self.lesson_outline()
+                            .order_by("order")
+                            .prefetch_related("topics"),
                         )
                     ),
                 )
@@ -41,53 +84,183 @@ class ContentQueryService:
             .prefetch_related(
                 Prefetch(
                     "lessons",
-                    queryset=Lesson.objects.order_by("order").prefetch_related(
-                        "topics"
-                    ),
+                    queryset=self.lesson_outline()
+                    .order_by("order")
+                    .prefetch_related("topics"),
                 )
             )
             .order_by("order")
         )
 
-    def get_instructor_lessons_with_topics(self, user) -> QuerySet[Lesson]:
+    def get_instructor_lessons_with_topics(
+        self, user, selection=None, outline=False
+    ) -> QuerySet[Lesson]:
+        """`outline` defers the lesson bodies for list views."""
+        lessons = Lesson.objects.filter(module__course__instructor=user)
+        if outline:
+            lessons = self.lesson_outline(lessons)
+        if selection is None:
+            return (
+                lessons.select_related("module__course")
+                .prefetch_related("topics")
+                .order_by("order")
+            )
+        return self._select_lessons(lessons, selection).order_by("order")
+
+    def get_published_courses_with_content(self, selection=None) -> QuerySet[Course]:
+        """Published course trees, narrowed to `selection` when one is given."""
+        courses = self._select(
+            Course.objects.filter(is_published=True),
+            selection,
+            required=["id"],
+            columns=self.COURSE_FIELD_COLUMNS,
+        )
+        if selection is None or selection.expands("modules"):
+            child = selection.child("modules") if selection else None
+            courses = courses.prefetch_related(
+                Prefetch("modules", queryset=self._published_modules(child))
+            )
+        return courses.annotate(total_lessons=F("published_lesson_count"))
+
+    def get_published_course_catalog(
+        self, filters=None, selection=None
+    ) -> QuerySet[Course]:
+        """Published courses with only the columns needed for catalog listing."""
+        courses = self.filter_catalog(
+            Course.objects.filter(is_published=True), filters or {}
+        )
+        if selection is None or selection.fields is None:
+            courses = courses.select_related("category", "instructor").only(
+                *self.CATALOG_FIELDS
+            )
+        else:
+            courses = self._select(
+                courses,
+                selection,
+                required=["id", "created_at"],
+                columns=self.COURSE_FIELD_COLUMNS,
+            )
+        return courses.annotate(total_lessons=F("published_lesson_count"))
+
+    def get_course_prerequisites(self, course_id) -> QuerySet[Course]:
+        """
+        Every published course required before `course_id`, annotated with
+        its `depth` in the chain and listed furthest first.
+        """
+        depth = PrerequisitePath.objects.filter(
+            descendant_id=course_id, ancestor=OuterRef("pk")
+        ).values("depth")
         return (
-            Lesson.objects.filter(module__course__instructor=user)
-            .select_related("module__course")
-            .prefetch_related("topics")
-            .order_by("order")
+            self.get_published_course_catalog()
+            .annotate(depth=Subquery(depth))
+            .filter(depth__isnull=False)
+            .order_by("-depth", "title", "pk")
         )
 
-    def get_published_courses_with_content(self) -> QuerySet[Course]:
+    def get_clone_job(self, instructor, job_id) -> CourseCloneJob | None:
+        return CourseCloneJob.objects.filter(pk=job_id, instructor=instructor).first()
+
+    def get_stored_file(self, user, storage_type, digest) -> dict | None:
+        """
+        content_data of a lesson holding the stored file `digest` that `user`
+        may read: published all the way up, or owned by them.
+        """
+        visible = Q(
+            is_published=True,
+            module__is_published=True,
+            module__course__is_published=True,
+        )
+        if user.is_authenticated:
+            visible |= Q(module__course__instructor_id=user.pk)
         return (
-            Course.objects.filter(is_published=True)
-            .select_related("category", "instructor")
-            .prefetch_related(
-                Prefetch(
-                    "modules",
-                    queryset=Module.objects.filter(is_published=True)
-                    .order_by("order")
-                    .annotate(
-                        total_lessons=Count(
-                            "lessons", filter=models.Q(lessons__is_published=True)
-                        )
-                    )
-                    .prefetch_related(
-                        Prefetch(
-                            "lessons",
-                            queryset=Lesson.objects.filter(is_published=True)
-                            .order_by("order")
-                            .prefetch_related("topics"),
-                        )
-                    ),
-                )
+            Lesson.objects.filter(
+                visible,
+                content_data__storage_type=storage_type,
+                content_data__digest=digest,
             )
-            .annotate(
-                total_lessons=Count(
-                    "modules__lessons",
-                    filter=models.Q(
-                        modules__is_published=True,
-                        modules__lessons__is_published=True,
-                    ),
-                )
+            .values_list("content_data", flat=True)
+            .first()
+        )
+
+    def lesson_outline(self, lessons=None) -> QuerySet[Lesson]:
+        """Lessons without their heavy body columns, for outlines and lists."""
+        if lessons is None:
+            lessons = Lesson.objects.all()
+        return lessons.defer(*self.HEAVY_LESSON_FIELDS)
+
+    # ==================== Field selection ====================
+
+    def _published_modules(self, selection=None) -> QuerySet[Module]:
+        modules = self._select(
+            Module.objects.filter(is_published=True),
+            selection,
+            required=["id", "course", "order"],
+        )
+        if selection is None or selection.expands("lessons"):
+            child = selection.child("lessons") if selection else None
+            lessons = self._select_lessons(
+                self.lesson_outline(Lesson.objects.filter(is_published=True)), child
             )
+            modules = modules.prefetch_related(
+                Prefetch("lessons", queryset=lessons.order_by("order"))
+            )
+        return modules.order_by("order").annotate(
+            total_lessons=F("published_lesson_count")
         )
+
+    def _select_lessons(self, lessons, selection=None) -> QuerySet[Lesson]:
+        lessons = self._select(lessons, selection, required=["id", "module", "order"])
+        if selection is None or selection.expands("topics"):
+            lessons = lessons.prefetch_related("topics")
+        return lessons
+
+    def _select(self, queryset, selection, required, columns=None) -> QuerySet:
+        """
+        Restrict `queryset` to the columns behind the selected serializer
+        fields, joining only the relations those columns live on.
+        """
+        columns = columns or {}
+        if selection is None or selection.fields is None:
+            related = {c.split("__")[0] for names in columns.values() for c in names}
+            return queryset.select_related(*sorted(related)) if related else queryset
+
+        names = list(required)
+        for name in sorted(selection.fields):
+            if name in columns:
+                names += columns[name]
+                continue
+            try:
+                field = queryset.model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if field.concrete and not field.many_to_many:
+                names.append(name)
+
+        related = sorted({name.split("__")[0] for name in names if "__" in name})
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset.only(*names)
+
+    def filter_catalog(self, courses, filters: dict) -> QuerySet[Course]:
+        """Apply validated catalog filters (see CatalogFilterSerializer)."""
+        if filters.get("category"):
+            courses = courses.filter(category_id__in=filters["category"])
+        if filters.get("difficulty"):
+            courses = courses.filter(difficulty_level__in=filters["difficulty"])
+        if filters.get("min_duration") is not None:
+            courses = courses.filter(est_duration__gte=filters["min_duration"])
+        if filters.get("max_duration") is not None:
+            courses = courses.filter(est_duration__lte=filters["max_duration"])
+        if filters.get("topic"):
+            # EXISTS keeps one row per course without a DISTINCT over the join.
+            courses = courses.filter(
+                Exists(
+                    Lesson.objects.filter(
+                        module__course=OuterRef("pk"),
+                        module__is_published=True,
+                        is_published=True,
+                        topics__slug__in=filters["topic"],
+                    )
+                )
+            )
+        return courses
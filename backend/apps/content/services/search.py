@@ -0,0 +1,348 @@
+import hashlib
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from itertools import islice
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, Count, F, FloatField, Sum, Value, When
+
+from apps.content.compression import unpack_content_data
+from apps.content.models import (
+    Course,
+    Lesson,
+    SearchDocument,
+    SearchPosting,
+    Topic,
+)
+
+TOKEN_RE = re.compile(r"\w+")
+MAX_TERM_LENGTH = 64
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in is it its of on or "
+    "that the this to was we what when which will with you your".split()
+)
+
+
+def tokenize(text: str) -> list:
+    return [
+        token[:MAX_TERM_LENGTH]
+        for token in TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+@dataclass
+class SearchHit:
+    kind: str
+    object_id: str
+    title: str
+    course_id: str | None
+    score: float
+
+
+@dataclass
+class IndexEntry:
+    kind: str
+    object_id: str
+    title: str
+    course_id: str | None
+    is_public: bool
+    weights: dict
+
+
+class SearchIndexService:
+    """
+    Maintains the inverted index (SearchDocument + SearchPosting).
+
+    Posting weights are BM25-style saturated term frequencies with field
+    boosts; inverse document frequency is applied at query time, so indexing
+    one object never requires touching the postings of another.
+    """
+
+    TITLE_BOOST = 3.0
+    TOPIC_BOOST = 2.0
+    K1 = 1.2
+    BATCH_SIZE = 500
+
+    # ==================== Entry builders ====================
+
+    def _weights(self, fields) -> dict:
+        frequencies = Counter()
+        for text, boost in fields:
+            for term in tokenize(text or ""):
+                frequencies[term] += boost
+        return {
+            term: tf * (self.K1 + 1) / (tf + self.K1)
+            for term, tf in frequencies.items()
+        }
+
+    def course_entry(self, course: Course) -> IndexEntry:
+        return IndexEntry(
+            kind=SearchDocument.Kind.COURSE,
+            object_id=str(course.pk),
+            title=course.title,
+            course_id=course.pk,
+            is_public=course.is_published,
+            weights=self._weights(
+                [(course.title, self.TITLE_BOOST), (course.description, 1.0)]
+            ),
+        )
+
+    def lesson_entry(self, lesson: Lesson, topic_names=()) -> IndexEntry:
+        content_data = unpack_content_data(lesson.content_data)
+        if not isinstance(content_data, dict):
+            content_data = {}
+        module = lesson.module
+        return IndexEntry(
+            kind=SearchDocument.Kind.LESSON,
+            object_id=str(lesson.pk),
+            title=lesson.title,
+            course_id=module.course_id,
+            is_public=(
+                lesson.is_published
+                and module.is_published
+                and module.course.is_published
+            ),
+            weights=self._weights(
+                [
+                    (lesson.title, self.TITLE_BOOST),
+                    (" ".join(topic_names), self.TOPIC_BOOST),
+                    (lesson.content, 1.0),
+                    (str(content_data.get("transcript") or ""), 1.0),
+                ]
+            ),
+        )
+
+    def topic_entry(self, topic: Topic) -> IndexEntry:
+        return IndexEntry(
+            kind=SearchDocument.Kind.TOPIC,
+            object_id=str(topic.pk),
+            title=topic.name,
+            course_id=None,
+            is_public=True,
+            weights=self._weights(
+                [(topic.name, self.TITLE_BOOST), (topic.description, 1.0)]
+            ),
+        )
+
+    # ==================== Incremental updates ====================
+
+    def index_course(self, course: Course) -> None:
+        self.write([self.course_entry(course)])
+
+    def index_lesson(self, lesson: Lesson) -> None:
+        lesson = (
+            Lesson.objects.select_related("module__course", "content_blob")
+            .prefetch_related("topics")
+            .get(pk=lesson.pk)
+        )
+        topic_names = [topic.name for topic in lesson.topics.all()]
+        self.write([self.lesson_entry(lesson, topic_names)])
+
+    def index_lessons_with_topic(self, topic: Topic) -> None:
+        self.write(self._lesson_entries(Lesson.objects.filter(topics=topic)))
+
+    def index_topic(self, topic: Topic) -> None:
+        self.write([self.topic_entry(topic)])
+
+    def remove(self, kind: str, object_id) -> None:
+        SearchDocument.objects.filter(kind=kind, object_id=str(object_id)).delete()
+
+    def refresh_course_visibility(self, course_id) -> None:
+        """Re-derive `is_public` for a course and its lessons after publish changes."""
+        is_published = (
+            Course.objects.filter(pk=course_id)
+            .values_list("is_published", flat=True)
+            .first()
+        )
+        documents = SearchDocument.objects.filter(course_id=course_id)
+        documents.filter(kind=SearchDocument.Kind.COURSE).update(
+            is_public=bool(is_published)
+        )
+
+        lesson_documents = documents.filter(kind=SearchDocument.Kind.LESSON)
+        lesson_documents.update(is_public=False)
+        if is_published:
+            public_ids = Lesson.objects.filter(
+                module__course_id=course_id,
+                module__is_published=True,
+                is_published=True,
+            ).values_list("id", flat=True)
+            lesson_documents.filter(
+                object_id__in=[str(lesson_id) for lesson_id in public_ids]
+            ).update(is_public=True)
+
+    # ==================== Bulk writes ====================
+
+    @transaction.atomic
+    def write(self, entries) -> None:
+        """Replace the documents and postings for `entries` in bulk."""
+        entries = iter(entries)
+        while batch := list(islice(entries, self.BATCH_SIZE)):
+            self._write_batch(batch)
+
+    def _write_batch(self, entries) -> None:
+        for kind in {entry.kind for entry in entries}:
+            SearchDocument.objects.filter(
+                kind=kind,
+                object_id__in=[e.object_id for e in entries if e.kind == kind],
+            ).delete()
+
+        documents = SearchDocument.objects.bulk_create(
+            SearchDocument(
+                kind=entry.kind,
+                object_id=entry.object_id,
+                title=entry.title[:255],
+                course_id=entry.course_id,
+                is_public=entry.is_public,
+            )
+            for entry in entries
+        )
+        SearchPosting.objects.bulk_create(
+            (
+                SearchPosting(term=term, document=document, weight=weight)
+                for entry, document in zip(entries, documents)
+                for term, weight in entry.weights.items()
+            ),
+            batch_size=self.BATCH_SIZE * 10,
+        )
+
+    def _lesson_entries(self, lessons):
+        lessons = lessons.select_related(
+            "module__course", "content_blob"
+        ).prefetch_related("topics")
+        for lesson in lessons.iterator(chunk_size=self.BATCH_SIZE):
+            topic_names = [topic.name for topic in lesson.topics.all()]
+            yield self.lesson_entry(lesson, topic_names)
+
+    def index_courses(self, course_ids) -> None:
+        """Index courses and all of their lessons (used after bulk writes)."""
+        courses = Course.objects.filter(pk__in=course_ids)
+        self.write(self.course_entry(course) for course in courses)
+        self.write(
+            self._lesson_entries(Lesson.objects.filter(module__course__in=courses))
+        )
+
+    def rebuild(self) -> int:
+        SearchDocument.objects.all().delete()
+        self.write(
+            self.course_entry(course)
+            for course in Course.objects.iterator(chunk_size=self.BATCH_SIZE)
+        )
+        self.write(self._lesson_entries(Lesson.objects.all()))
+        self.write(
+            self.topic_entry(topic)
+            for topic in Topic.objects.iterator(chunk_size=self.BATCH_SIZE)
+        )
+        return SearchDocument.objects.count()
+
+
+class SearchQueryService:
+    """
+    Ranked retrieval over the inverted index.
+
+    Uses champion lists: each query term contributes only its highest-weighted
+    postings as candidates (an index range scan on term, -weight), and exact
+    scores are computed for those candidates alone. Query cost is therefore
+    bounded by the number of terms, not by how common they are. Document
+    frequencies change slowly and are cached between queries.
+    """
+
+    candidates_per_term = 200
+    max_query_terms = 8
+    cache_prefix = "content:search"
+    statistics_timeout = 300
+
+    def search(self, query: str, kinds=None, limit: int = 20) -> list:
+        terms = sorted(set(tokenize(query)))[: self.max_query_terms]
+        idf = self._idf(terms)
+        if not idf:
+            return []
+
+        postings = SearchPosting.objects.filter(document__is_public=True)
+        if kinds:
+            postings = postings.filter(document__kind__in=kinds)
+
+        per_term = max(self.candidates_per_term, limit)
+        candidates = set()
+        for term in idf:
+            candidates.update(
+                postings.filter(term=term)
+                .order_by("-weight")
+                .values_list("document_id", flat=True)[:per_term]
+            )
+
+        scored = (
+            SearchPosting.objects.filter(document_id__in=candidates, term__in=idf)
+            .values("document_id")
+            .annotate(
+                score=Sum(
+                    Case(
+                        *[
+                            When(term=term, then=F("weight") * Value(weight))
+                            for term, weight in idf.items()
+                        ],
+                        output_field=FloatField(),
+                    )
+                )
+            )
+            .order_by("-score", "document_id")[:limit]
+        )
+        scores = {row["document_id"]: row["score"] for row in scored}
+        documents = SearchDocument.objects.in_bulk(scores.keys())
+        return [
+            SearchHit(
+                kind=documents[document_id].kind,
+                object_id=documents[document_id].object_id,
+                title=documents[document_id].title,
+                course_id=documents[document_id].course_id,
+                score=round(score, 4),
+            )
+            for document_id, score in scores.items()
+        ]
+
+    # ==================== Collection statistics ====================
+
+    def _idf(self, terms) -> dict:
+        frequencies = self._document_frequencies(terms)
+        corpus_size = cache.get_or_set(
+            f"{self.cache_prefix}:corpus_size",
+            SearchDocument.objects.count,
+            self.statistics_timeout,
+        )
+        corpus_size = max([corpus_size, *frequencies.values()])
+        return {
+            term: math.log(1 + (corpus_size - df + 0.5) / (df + 0.5))
+            for term, df in frequencies.items()
+            if df
+        }
+
+    def _document_frequencies(self, terms) -> dict:
+        keys = {
+            term: f"{self.cache_prefix}:df:{hashlib.md5(term.encode()).hexdigest()}"
+            for term in terms
+        }
+        cached = cache.get_many(keys.values())
+        frequencies = {term: cached[key] for term, key in keys.items() if key in cached}
+
+        missing = [term for term in terms if term not in frequencies]
+        if missing:
+            counted = dict(
+                SearchPosting.objects.filter(term__in=missing)
+                .values_list("term")
+                .annotate(df=Count("id"))
+            )
+            # Unknown terms are not cached, so newly indexed words match at once.
+            cache.set_many(
+                {keys[term]: df for term, df in counted.items()},
+                self.statistics_timeout,
+            )
+            frequencies.update(counted)
+        return frequencies
+
+
+search_index_service = SearchIndexService()
+search_query_service = SearchQueryService()
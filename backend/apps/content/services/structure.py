@@ -0,0 +1,130 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+
+from apps.content.models import Lesson, Module
+from apps.content.services.versioning import content_version_service
+
+
+@dataclass(frozen=True)
+class CourseStructure:
+    """
+    The published shape of one course, by ID only.
+
+    `lesson_modules` covers every lesson in the course (published or not),
+    `module_lessons` the published lessons of every module in order, and
+    `published_lesson_count` matches Course.published_lesson_count: lessons
+    that are published inside a published module.
+    """
+
+    course_id: object
+    published_module_ids: tuple = ()
+    module_lessons: dict = field(default_factory=dict)
+    lesson_modules: dict = field(default_factory=dict)
+    published_lesson_count: int = 0
+
+    def has_lesson(self, lesson_id) -> bool:
+        return self._lesson_key(lesson_id) in self.lesson_modules
+
+    def module_for_lesson(self, lesson_id):
+        return self.lesson_modules.get(self._lesson_key(lesson_id))
+
+    def published_lesson_ids(self, module_id) -> tuple:
+        return self.module_lessons.get(module_id, ())
+
+    def _lesson_key(self, lesson_id):
+        try:
+            return Lesson._meta.pk.to_python(lesson_id)
+        except ValidationError:
+            return None
+
+
+class CourseStructureCache:
+    """
+    Per-process LRU of CourseStructure, validated against the course's
+    content version token on every read.
+
+    Any write that bumps the version makes the entry stale, so a hit costs
+    one shared-cache read and no content-table queries; a miss rebuilds the
+    structure with a single query. The version is read before the rows, so
+    a write racing the rebuild leaves an entry that is already stale.
+
+    Entries also expire after COURSE_STRUCTURE_CACHE_TTL seconds, which
+    bounds how stale they get when the version tokens are not shared
+    between processes (e.g. the default LocMemCache with several workers).
+    """
+
+    def __init__(self, version_service=None, max_size=None, ttl=None):
+        self._versions = version_service or content_version_service
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size or settings.COURSE_STRUCTURE_CACHE_SIZE
+
+    @property
+    def ttl(self) -> float:
+        return (
+            self._ttl if self._ttl is not None else settings.COURSE_STRUCTURE_CACHE_TTL
+        )
+
+    def get(self, course_id) -> CourseStructure:
+        key = str(course_id)
+        version = self._versions.get_course_version(course_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version and entry[1] > now:
+                self._entries.move_to_end(key)
+                return entry[2]
+
+        structure = self.build(course_id)
+        with self._lock:
+            self._entries[key] = (version, now + self.ttl, structure)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return structure
+
+    def build(self, course_id) -> CourseStructure:
+        published_module_ids = []
+        module_lessons = {}
+        lesson_modules = {}
+        published_lesson_count = 0
+        rows = (
+            Module.objects.filter(course_id=course_id)
+            .order_by("order", "pk", "lessons__order", "lessons__pk")
+            .values_list("id", "is_published", "lessons__id", "lessons__is_published")
+        )
+        for module_id, module_published, lesson_id, lesson_published in rows:
+            if module_id not in module_lessons:
+                module_lessons[module_id] = []
+                if module_published:
+                    published_module_ids.append(module_id)
+            if lesson_id is None:
+                continue
+            lesson_modules[lesson_id] = module_id
+            if lesson_published:
+                module_lessons[module_id].append(lesson_id)
+                published_lesson_count += module_published
+        return CourseStructure(
+            course_id=course_id,
+            published_module_ids=tuple(published_module_ids),
+            module_lessons={key: tuple(ids) for key, ids in module_lessons.items()},
+            lesson_modules=lesson_modules,
+            published_lesson_count=published_lesson_count,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+course_structure_cache = CourseStructureCache()
@@ -0,0 +1,66 @@
+import uuid
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+
+class ContentVersionService:
+    """
+    Per-course content version tokens.
+
+    A token is a random string rather than a counter, so a token evicted
+    from the cache can never collide with one issued earlier. Any cache
+    entry keyed by a version goes stale the moment the token changes. It is
+    prefixed with the time it was issued, read back by `changed_at`, which
+    also covers changes that leave no row timestamp (deletes, unpublishing).
+    """
+
+    key_prefix = "content:course"
+    catalog_key = "content:catalog:version"
+
+    def _key(self, course_id) -> str:
+        return f"{self.key_prefix}:{course_id}:version"
+
+    def _new_version(self) -> str:
+        micros = int(timezone.now().timestamp() * 1_000_000)
+        return f"{micros:x}.{uuid.uuid4().hex}"
+
+    def _get_or_create(self, key) -> str:
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, self._new_version(), timeout=None)
+            version = cache.get(key)
+        return version
+
+    def changed_at(self, version: str) -> datetime | None:
+        """When `version` was issued (None for a token without a time)."""
+        micros, _, _ = str(version).partition(".")
+        try:
+            return datetime.fromtimestamp(int(micros, 16) / 1_000_000, dt_timezone.utc)
+        except ValueError:
+            return None
+
+    def get_course_version(self, course_id) -> str:
+        return self._get_or_create(self._key(course_id))
+
+    def get_catalog_version(self) -> str:
+        """Token covering every course; moves whenever any course version does."""
+        return self._get_or_create(self.catalog_key)
+
+    def bump_course_versions(self, course_ids) -> None:
+        keys = [self._key(course_id) for course_id in course_ids if course_id]
+        if not keys:
+            return
+        keys.append(self.catalog_key)
+
+        def bump():
+            cache.set_many({key: self._new_version() for key in keys}, timeout=None)
+
+        # After commit only: a token issued earlier could be cached against
+        # the tree as it was before the write by a reader racing it.
+        transaction.on_commit(bump)
+
+
+content_version_service = ContentVersionService()
@@ -0,0 +1,400 @@
+from django.conf import settings
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.db.models import QuerySet
+from django.dispatch import receiver
+
+from apps.content.compression import pack_content_data
+from apps.content.models import (
+    Category,
+    Course,
+    Lesson,
+    Module,
+    SearchDocument,
+    Topic,
+)
+from apps.content.services.blobs import content_blob_service
+from apps.content.services.counters import lesson_counter_service
+from apps.content.services.facets import catalog_facet_service
+from apps.content.services.prerequisites import prerequisite_service
+from apps.content.services.search import search_index_service
+from apps.content.services.versioning import content_version_service
+
+
+def _course_id_for_module(module_id):
+    return (
+        Module.objects.filter(pk=module_id).values_list("course_id", flat=True).first()
+    )
+
+
+def _course_id_for_lesson(lesson: Lesson):
+    if Lesson.module.is_cached(lesson):
+        return lesson.module.course_id
+    return _course_id_for_module(lesson.module_id)
+
+
+def _indexed_columns(lesson) -> list:
+    """
+    Lesson columns its search document is derived from. content_data only
+    counts when it was loaded: a deferred column cannot have been changed.
+    """
+    columns = ["module_id", "is_published", "content_blob_id", "title"]
+    if "content_data" in lesson.__dict__:
+        columns.append("content_data")
+    return columns
+
+
+def _deleted_directly(origin, model) -> bool:
+    """False when the delete cascaded from a parent object."""
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return origin_model is model
+
+
+# ==================== Course structure ====================
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def course_changed(sender, instance, **kwargs):
+    content_version_service.bump_course_versions([instance.pk])
+
+
+@receiver(post_save, sender=Module)
+@receiver(post_delete, sender=Module)
+def module_changed(sender, instance, **kwargs):
+    content_version_service.bump_course_versions([instance.course_id])
+
+
+@receiver(post_save, sender=Lesson)
+@receiver(pre_delete, sender=Lesson)
+def lesson_changed(sender, instance, **kwargs):
+    # pre_delete: the parent module may be gone by post_delete in a cascade.
+    content_version_service.bump_course_versions([_course_id_for_lesson(instance)])
+
+
+@receiver(pre_save, sender=Lesson)
+def lesson_moving(sender, instance, **kwargs):
+    """A lesson moved to another module also changes its previous course."""
+    # The stored state is also read by the lesson counters, the search index
+    # and the blob references below.
+    columns = _indexed_columns(instance)
+    stored = (
+        None
+        if instance._state.adding
+        else Lesson.objects.filter(pk=instance.pk).values_list(*columns).first()
+    )
+    instance._stored_state = stored and stored[:2]
+    instance._stored_blob_id = stored and stored[2]
+    instance._stored_indexed_state = stored and dict(zip(columns, stored))
+    old_module_id = instance._stored_state and instance._stored_state[0]
+    if old_module_id and old_module_id != instance.module_id:
+        content_version_service.bump_course_versions(
+            [_course_id_for_module(old_module_id)]
+        )
+
+
+@receiver(m2m_changed, sender=Lesson.topics.through)
+def lesson_topics_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    # Clears are handled before the rows go away so the lessons can be found.
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        course_ids = [_course_id_for_lesson(instance)]
+    else:
+        # Topic side: `pk_set` holds lesson IDs, or None when clearing.
+        lessons = (
+            instance.lessons.all()
+            if pk_set is None
+            else Lesson.objects.filter(pk__in=pk_set)
+        )
+        course_ids = set(lessons.values_list("module__course_id", flat=True))
+    content_version_service.bump_course_versions(course_ids)
+
+
+# ==================== Data embedded in course detail ====================
+
+
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+def category_changed(sender, instance, **kwargs):
+    content_version_service.bump_course_versions(
+        instance.courses.values_list("id", flat=True)
+    )
+
+
+@receiver(post_save, sender=Topic)
+@receiver(pre_delete, sender=Topic)
+def topic_changed(sender, instance, **kwargs):
+    content_version_service.bump_course_versions(
+        Course.objects.filter(modules__lessons__topics=instance)
+        .values_list("id", flat=True)
+        .distinct()
+    )
+
+
+# User columns rendered in course payloads (instructor_name).
+INSTRUCTOR_FIELDS = frozenset({"fullname", "username"})
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def instructor_changed(sender, instance, created, update_fields=None, **kwargs):
+    if created or not instance.is_instructor():
+        return
+    if update_fields is not None and not INSTRUCTOR_FIELDS & set(update_fields):
+        return  # e.g. the last_login save on every sign-in.
+    content_version_service.bump_course_versions(
+        instance.courses_taught.values_list("id", flat=True)
+    )
+
+
+# ==================== Search index ====================
+
+
+@receiver(post_save, sender=Course)
+def index_course(sender, instance, **kwargs):
+    search_index_service.index_course(instance)
+    search_index_service.refresh_course_visibility(instance.pk)
+
+
+@receiver(post_save, sender=Module)
+def refresh_module_visibility(sender, instance, **kwargs):
+    search_index_service.refresh_course_visibility(instance.course_id)
+
+
+@receiver(post_save, sender=Lesson)
+def index_lesson(sender, instance, **kwargs):
+    stored = getattr(instance, "_stored_indexed_state", None)
+    if stored and all(
+        getattr(instance, name) == value for name, value in stored.items()
+    ):
+        return  # e.g. a reorder or duration change.
+    search_index_service.index_lesson(instance)
+
+
+@receiver(post_delete, sender=Lesson)
+def unindex_lesson(sender, instance, **kwargs):
+    search_index_service.remove(SearchDocument.Kind.LESSON, instance.pk)
+
+
+@receiver(m2m_changed, sender=Lesson.topics.through)
+def reindex_lesson_topics(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == "pre_clear":
+        # Remember the lessons losing this topic; the links are gone afterwards.
+        instance._cleared_lesson_ids = list(
+            instance.lessons.values_list("pk", flat=True)
+        )
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        search_index_service.index_lesson(instance)
+        return
+    if action == "post_clear":
+        pk_set = getattr(instance, "_cleared_lesson_ids", [])
+    for lesson in Lesson.objects.filter(pk__in=pk_set).only("pk"):
+        search_index_service.index_lesson(lesson)
+
+
+@receiver(post_save, sender=Topic)
+def index_topic(sender, instance, created, **kwargs):
+    search_index_service.index_topic(instance)
+    if not created:
+        search_index_service.index_lessons_with_topic(instance)
+
+
+@receiver(post_delete, sender=Topic)
+def unindex_topic(sender, instance, **kwargs):
+    search_index_service.remove(SearchDocument.Kind.TOPIC, instance.pk)
+
+
+# ==================== Lesson counters ====================
+
+
+@receiver(post_save, sender=Lesson)
+def count_lesson(sender, instance, **kwargs):
+    previous = getattr(instance, "_stored_state", None)
+    if previous == (instance.module_id, instance.is_published):
+        return
+    if previous is None and not instance.is_published:
+        return
+    lesson_counter_service.refresh_modules(
+        [instance.module_id, previous and previous[0]]
+    )
+
+
+@receiver(post_delete, sender=Lesson)
+def uncount_lesson(sender, instance, origin=None, **kwargs):
+    # Cascades from a module or course are recounted by their own receivers.
+    if instance.is_published and _deleted_directly(origin, Lesson):
+        lesson_counter_service.refresh_modules([instance.module_id])
+
+
+@receiver(pre_save, sender=Module)
+def remember_module_state(sender, instance, **kwargs):
+    instance._stored_state = (
+        None
+        if instance._state.adding
+        else Module.objects.filter(pk=instance.pk)
+        .values_list("course_id", "is_published")
+        .first()
+    )
+
+
+@receiver(post_save, sender=Module)
+def count_module(sender, instance, created, **kwargs):
+    # A new module has no lessons yet, so no course total changes.
+    previous = getattr(instance, "_stored_state", None)
+    if created or previous == (instance.course_id, instance.is_published):
+        return
+    lesson_counter_service.refresh_courses(
+        {instance.course_id, previous and previous[0]} - {None}
+    )
+
+
+@receiver(post_delete, sender=Module)
+def uncount_module(sender, instance, origin=None, **kwargs):
+    if _deleted_directly(origin, Module):
+        lesson_counter_service.refresh_courses([instance.course_id])
+
+
+# ==================== Content blobs ====================
+
+
+@receiver(pre_save, sender=Lesson)
+def intern_lesson_content(sender, instance, **kwargs):
+    content = instance.__dict__.pop("_pending_content", None)
+    if content is not None:
+        instance.content_blob_id = content_blob_service.intern([content]).get(content)
+
+
+@receiver(pre_save, sender=Lesson)
+def compress_lesson_transcripts(sender, instance, **kwargs):
+    if "content_data" in instance.__dict__:  # Never load a deferred column.
+        instance.content_data = pack_content_data(instance.content_data)
+
+
+@receiver(post_save, sender=Lesson)
+def reference_lesson_content(sender, instance, created, **kwargs):
+    previous = getattr(instance, "_stored_blob_id", None)
+    if created or previous != instance.content_blob_id:
+        content_blob_service.refresh([instance.content_blob_id, previous])
+
+
+@receiver(post_delete, sender=Lesson)
+def dereference_lesson_content(sender, instance, origin=None, **kwargs):
+    # Cascades from a module or course are recounted by their own receivers.
+    if _deleted_directly(origin, Lesson):
+        content_blob_service.refresh([instance.content_blob_id])
+
+
+@receiver(pre_delete, sender=Module)
+@receiver(pre_delete, sender=Course)
+def remember_lesson_content(sender, instance, origin=None, **kwargs):
+    if not _deleted_directly(origin, sender):
+        return
+    lessons = (
+        Lesson.objects.filter(module__course=instance)
+        if sender is Course
+        else Lesson.objects.filter(module=instance)
+    )
+    instance._content_blob_ids = set(
+        lessons.exclude(content_blob=None).values_list("content_blob_id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Module)
+@receiver(post_delete, sender=Course)
+def dereference_cascaded_content(sender, instance, **kwargs):
+    content_blob_service.refresh(getattr(instance, "_content_blob_ids", ()))
+
+
+# ==================== Catalog facets ====================
+
+
+@receiver(pre_save, sender=Course)
+def remember_course_facets(sender, instance, **kwargs):
+    instance._facet_state = (
+        Course.objects.filter(pk=instance.pk)
+        .values_list("is_published", "category_id", "difficulty_level")
+        .first()
+        if not instance._state.adding
+        else None
+    )
+
+
+@receiver(post_save, sender=Course)
+def update_course_facets(sender, instance, **kwargs):
+    previous = getattr(instance, "_facet_state", None)
+    current = (instance.is_published, instance.category_id, instance.difficulty_level)
+    if previous == current or (previous is None and not instance.is_published):
+        return
+    old_category, old_difficulty = previous[1:] if previous else (None, None)
+    catalog_facet_service.refresh(
+        category_ids={old_category, instance.category_id},
+        difficulties={old_difficulty, instance.difficulty_level},
+    )
+
+
+@receiver(post_delete, sender=Course)
+def remove_course_facets(sender, instance, **kwargs):
+    if instance.is_published:
+        catalog_facet_service.refresh(
+            category_ids=[instance.category_id],
+            difficulties=[instance.difficulty_level],
+        )
+
+
+@receiver(post_save, sender=Category)
+def rename_category_facet(sender, instance, created, **kwargs):
+    if not created:
+        catalog_facet_service.rename_category(instance)
+
+
+@receiver(post_delete, sender=Category)
+def remove_category_facet(sender, instance, **kwargs):
+    catalog_facet_service.remove_category(instance.pk)
+
+
+# ==================== Prerequisite closure ====================
+
+
+@receiver(m2m_changed, sender=Course.prerequisites.through)
+def prerequisites_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    # Forward: `instance` gains or loses prerequisites `pk_set`. Reverse:
+    # `instance` becomes or stops being a prerequisite of courses `pk_set`.
+    if action == "pre_add":
+        if reverse:
+            prerequisite_service.check_links(pk_set, [instance.pk])
+        else:
+            prerequisite_service.check_links([instance.pk], pk_set)
+    elif action == "pre_clear" and reverse:
+        instance._cleared_dependent_ids = list(
+            instance.required_by.values_list("pk", flat=True)
+        )
+    elif action in ("post_add", "post_remove", "post_clear"):
+        if not reverse:
+            prerequisite_service.refresh([instance.pk])
+        elif action == "post_clear":
+            prerequisite_service.refresh(
+                getattr(instance, "_cleared_dependent_ids", [])
+            )
+        else:
+            prerequisite_service.refresh(pk_set)
+
+
+@receiver(pre_delete, sender=Course)
+def remember_prerequisite_dependents(sender, instance, **kwargs):
+    # Their paths through this course disappear with its links.
+    instance._prerequisite_dependent_ids = prerequisite_service.dependent_ids(
+        [instance.pk]
+    )
+
+
+@receiver(post_delete, sender=Course)
+def refresh_prerequisite_dependents(sender, instance, **kwargs):
+    prerequisite_service.refresh(getattr(instance, "_prerequisite_dependent_ids", ()))
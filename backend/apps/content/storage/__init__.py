@@ -1,5 +1,13 @@
-from apps.content.storage.base import ContentStorage, StorageRegistry
+from concurrent.futures import ThreadPoolExecutor
+
+from apps.content.storage.base import (
+    ContentStorage,
+    RetrieveResult,
+    StorageMetrics,
+    StorageRegistry,
+)
 from apps.content.storage.external import ExternalUrlStorage
+from apps.content.storage.local import LocalFileStorage
 from apps.content.storage.s3 import S3Storage
 
 
@@ -17,17 +25,56 @@ class ContentStorageService:
         handler = self._get_handler(storage_type)
         if not handler.validate(content_data):
             raise ValueError("Invalid content data")
-        return handler.store(content_data)
+        with handler.metrics.track("store"):
+            return handler.store(content_data)
 
     def retrieve(self, storage_metadata: dict) -> dict:
         storage_type = storage_metadata.get("storage_type", self._default_storage_type)
         handler = self._get_handler(storage_type)
-        return handler.retrieve(storage_metadata)
+        with handler.metrics.track("retrieve"):
+            return handler.retrieve(storage_metadata)
+
+    def retrieve_many(self, metadata_by_key: dict) -> dict:
+        """
+        Retrieve many items at once: {key: storage_metadata} -> {key:
+        RetrieveResult}. Items are grouped by storage type and each backend
+        resolves its group through `retrieve_many`, the groups concurrently.
+        """
+        results, groups = {}, {}
+        for key, metadata in metadata_by_key.items():
+            storage_type = metadata.get("storage_type", self._default_storage_type)
+            groups.setdefault(storage_type, {})[key] = metadata
+
+        handlers = {}
+        for storage_type, items in groups.items():
+            try:
+                handlers[storage_type] = self._get_handler(storage_type)
+            except ValueError as exc:
+                for key in items:
+                    results[key] = RetrieveResult(error=str(exc))
+
+        def retrieve_group(storage_type):
+            handler = handlers[storage_type]
+            with handler.metrics.track("retrieve_many"):
+                return handler.retrieve_many(groups[storage_type])
+
+        if len(handlers) == 1:
+            results.update(retrieve_group(next(iter(handlers))))
+        elif handlers:
+            with ThreadPoolExecutor(max_workers=len(handlers)) as executor:
+                for group in executor.map(retrieve_group, handlers):
+                    results.update(group)
+        return {key: results[key] for key in metadata_by_key}
 
     def delete(self, storage_metadata: dict) -> bool:
         storage_type = storage_metadata.get("storage_type", self._default_storage_type)
         handler = self._get_handler(storage_type)
-        return handler.delete(storage_metadata)
+        with handler.metrics.track("delete"):
+            return handler.delete(storage_metadata)
+
+    def metrics(self) -> dict:
+        """{storage_type: {operation: {"calls", "errors", "seconds"}}}"""
+        return StorageRegistry.metrics()
 
 
 content_storage_service = ContentStorageService()
@@ -35,7 +82,11 @@ content_storage_service = ContentStorageService()
 __all__ = [
     "ContentStorage",
     "ExternalUrlStorage",
+    "LocalFileStorage",
+    "RetrieveResult",
     "S3Storage",
+    "StorageMetrics",
+    "StorageRegistry",
     "ContentStorageService",
     "content_storage_service",
 ]
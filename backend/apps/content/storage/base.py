@@ -1,8 +1,64 @@
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+@dataclass
+class RetrieveResult:
+    content: dict | None = None
+    error: str | None = None
+
+
+class StorageMetrics:
+    """Thread-safe call, error and time totals per storage operation."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations = {}
+
+    @contextmanager
+    def track(self, operation: str):
+        started = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                totals = self._operations.setdefault(
+                    operation, {"calls": 0, "errors": 0, "seconds": 0.0}
+                )
+                totals["calls"] += 1
+                totals["errors"] += failed
+                totals["seconds"] += elapsed
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {name: dict(totals) for name, totals in self._operations.items()}
 
 
 class StorageRegistry:
+    """
+    Storage handler classes by `storage_type`, and one long-lived instance
+    of each, built on first use with its CONTENT_STORAGES options.
+
+    Handlers are shared by every thread, so they must be thread-safe. Call
+    `shutdown` to release what they hold; the next lookup builds fresh ones.
+    """
+
     _handlers: dict = {}
+    _instances: dict = {}
+    _lock = threading.RLock()
 
     @classmethod
     def register(cls, handler_class):
@@ -12,24 +68,89 @@ class StorageRegistry:
 
     @classmethod
     def get_handler(cls, storage_type: str):
+        instance = cls._instances.get(storage_type)
+        if instance is not None:
+            return instance
         handler_class = cls._handlers.get(storage_type)
-        if handler_class:
-            return handler_class()
-        return None
+        if not handler_class:
+            return None
+        with cls._lock:
+            instance = cls._instances.get(storage_type)
+            if instance is None:
+                options = settings.CONTENT_STORAGES.get(storage_type, {})
+                instance = cls._instances[storage_type] = handler_class(**options)
+        return instance
 
     @classmethod
     def get_all_handlers(cls) -> dict:
-        return {k: v() for k, v in cls._handlers.items()}
+        return {
+            storage_type: cls.get_handler(storage_type)
+            for storage_type in cls._handlers
+        }
+
+    @classmethod
+    def warm_up(cls, storage_types=None) -> None:
+        """Build and warm the given handlers (every configured one by default)."""
+        for storage_type in storage_types or settings.CONTENT_STORAGES:
+            handler = cls.get_handler(storage_type)
+            if handler is not None:
+                handler.warm_up()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls._lock:
+            instances, cls._instances = list(cls._instances.values()), {}
+        for instance in instances:
+            instance.shutdown()
+
+    @classmethod
+    def metrics(cls) -> dict:
+        return {
+            storage_type: instance.metrics.snapshot()
+            for storage_type, instance in list(cls._instances.items())
+        }
 
 
 class ContentStorage(ABC):
     storage_type: str = ""
+    # Threads used by retrieve_many; raise it for backends that wait on I/O.
+    max_concurrency: int = 1
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         if cls.storage_type:
             StorageRegistry.register(cls)
 
+    def __init__(self):
+        self.metrics = StorageMetrics()
+
+    def warm_up(self) -> None:
+        """Open connections or prepare resources ahead of the first request."""
+
+    def shutdown(self) -> None:
+        """Release whatever `warm_up` or normal use acquired."""
+
+    def retrieve_many(self, items: dict) -> dict:
+        """
+        {key: storage_metadata} -> {key: RetrieveResult}. A failing item is
+        reported in its result and never fails the rest of the batch.
+        """
+        workers = min(self.max_concurrency, len(items))
+        if workers <= 1:
+            return {key: self._retrieve_result(meta) for key, meta in items.items()}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                key: executor.submit(self._retrieve_result, meta)
+                for key, meta in items.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
+
+    def _retrieve_result(self, storage_metadata: dict) -> RetrieveResult:
+        try:
+            return RetrieveResult(content=self.retrieve(storage_metadata))
+        except Exception as exc:
+            return RetrieveResult(error=str(exc) or type(exc).__name__)
+
     @abstractmethod
     def store(self, content_data: dict) -> dict:
         pass
@@ -45,3 +166,10 @@ class ContentStorage(ABC):
     @abstractmethod
     def validate(self, content_data: dict) -> bool:
         pass
+
+
+@receiver(setting_changed)
+def reset_storage_handlers(setting, **kwargs):
+    """Handlers read their settings once, so rebuild them when those change."""
+    if setting.startswith(("CONTENT_STORAGE", "AWS_", "S3_")):
+        StorageRegistry.shutdown()
@@ -0,0 +1,124 @@
+import hashlib
+import io
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.urls import reverse
+
+from apps.content.storage.base import ContentStorage
+
+DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class LocalFileStorage(ContentStorage):
+    """
+    Lesson files on local disk, addressed by the SHA-256 of their bytes.
+
+    Uploads are hashed while they are copied to a temporary file in chunks,
+    then moved into place atomically; identical uploads share one file.
+    Files are delivered by the content-file endpoint, which serves ranges
+    straight from a memory map.
+    """
+
+    storage_type = "local"
+    chunk_size = 1024 * 1024
+
+    def __init__(self, root=None):
+        super().__init__()
+        self.root = Path(root or settings.CONTENT_STORAGE_ROOT)
+
+    def warm_up(self) -> None:
+        (self.root / "tmp").mkdir(parents=True, exist_ok=True)
+
+    def store(self, content_data: dict) -> dict:
+        body = content_data.get("body")
+        file = io.BytesIO(body) if body is not None else content_data["file"]
+        digest, size = self._write(file)
+        filename = content_data.get("filename") or getattr(file, "name", "") or ""
+        return {
+            "storage_type": self.storage_type,
+            "digest": digest,
+            "size": size,
+            "content_type": content_data.get("content_type")
+            or "application/octet-stream",
+            "filename": str(filename).rsplit("/", 1)[-1],
+            "title": content_data.get("title", ""),
+        }
+
+    def retrieve(self, storage_metadata: dict) -> dict:
+        return {
+            "url": reverse("content-file", args=[storage_metadata["digest"]]),
+            "title": storage_metadata.get("title", ""),
+            "size": storage_metadata.get("size"),
+            "content_type": storage_metadata.get("content_type", ""),
+            "storage_type": self.storage_type,
+        }
+
+    def read_range(self, storage_metadata: dict, start: int = 0, end=None) -> bytes:
+        """Bytes `start`..`end` inclusive (to the end of the file if None)."""
+        path = self.path(storage_metadata["digest"])
+        with open(path, "rb") as file:
+            file.seek(start)
+            length = -1 if end is None else max(end - start + 1, 0)
+            return file.read(length)
+
+    def delete(self, storage_metadata: dict) -> bool:
+        """
+        Remove the file unless a lesson still points at the same bytes.
+
+        The check runs once the current transaction commits, so the caller's
+        own change to the lesson that held the file is already visible.
+        """
+        digest = storage_metadata["digest"]
+        self.path(digest)  # Reject a bad digest now rather than after commit.
+        transaction.on_commit(lambda: self._unlink_unused(digest))
+        return True
+
+    def validate(self, content_data: dict) -> bool:
+        if isinstance(content_data.get("body"), (bytes, bytearray)):
+            return True
+        return callable(getattr(content_data.get("file"), "read", None))
+
+    def path(self, digest: str) -> Path:
+        if not DIGEST_PATTERN.match(digest):
+            raise ValueError(f"Invalid content digest: {digest!r}")
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    # ==================== Internal ====================
+
+    def _unlink_unused(self, digest: str) -> None:
+        from apps.content.models import Lesson
+
+        shared = Lesson.objects.filter(
+            content_data__storage_type=self.storage_type,
+            content_data__digest=digest,
+        ).exists()
+        if not shared:
+            self.path(digest).unlink(missing_ok=True)
+
+    def _write(self, file) -> tuple:
+        staging = self.root / "tmp"
+        staging.mkdir(parents=True, exist_ok=True)
+        sha256, size = hashlib.sha256(), 0
+        with tempfile.NamedTemporaryFile(dir=staging, delete=False) as temp:
+            try:
+                while chunk := file.read(self.chunk_size):
+                    sha256.update(chunk)
+                    temp.write(chunk)
+                    size += len(chunk)
+            except BaseException:
+                os.unlink(temp.name)
+                raise
+
+        digest = sha256.hexdigest()
+        target = self.path(digest)
+        if target.exists():
+            os.unlink(temp.name)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(temp.name, target)
+        return digest, size
@@ -1,21 +1,207 @@
+import io
+import threading
+import uuid
+from itertools import chain
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
 from apps.content.storage.base import ContentStorage
 
+# S3 rejects multipart parts smaller than this, except the last one.
+MIN_PART_SIZE = 5 * 1024 * 1024
+
 
 class S3Storage(ContentStorage):
+    """
+    Lesson files in an S3-compatible bucket.
+
+    `store` takes a readable file object under "file" (or raw bytes under
+    "body") and streams it to the bucket: files that fit in one chunk are
+    sent with a single PUT, larger ones as a multipart upload, one chunk in
+    memory at a time. Clients are shared per endpoint across handler
+    instances, so every request reuses the same connection pool.
+    """
+
     storage_type = "s3"
 
-    def __init__(self, bucket_name: str = "", region: str = ""):
-        self.bucket_name = bucket_name
-        self.region = region
+    _clients: dict = {}
+    _clients_lock = threading.Lock()
+
+    def __init__(
+        self,
+        bucket_name: str = "",
+        region: str = "",
+        endpoint_url: str = "",
+        chunk_size: int = 0,
+    ):
+        super().__init__()
+        self.bucket_name = bucket_name or settings.AWS_STORAGE_BUCKET_NAME
+        self.region = region or settings.AWS_S3_REGION_NAME
+        self.endpoint_url = endpoint_url or settings.AWS_S3_ENDPOINT_URL
+        self.chunk_size = max(
+            chunk_size or settings.S3_MULTIPART_CHUNK_SIZE, MIN_PART_SIZE
+        )
+        self.max_concurrency = settings.S3_MAX_POOL_CONNECTIONS
+
+    @property
+    def client(self):
+        key = (self.region, self.endpoint_url)
+        client = self._clients.get(key)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = self._create_client()
+        return client
+
+    def warm_up(self) -> None:
+        self.client
+
+    def shutdown(self) -> None:
+        with self._clients_lock:
+            client = self._clients.pop((self.region, self.endpoint_url), None)
+        if client is not None:
+            client.close()
+
+    @classmethod
+    def close_clients(cls) -> None:
+        with cls._clients_lock:
+            clients, cls._clients = list(cls._clients.values()), {}
+        for client in clients:
+            client.close()
 
     def store(self, content_data: dict) -> dict:
-        raise NotImplementedError("S3 storage not yet implemented")
+        key = content_data.get("key") or self._new_key(content_data)
+        content_type = content_data.get("content_type") or "application/octet-stream"
+        chunks = self._chunks(content_data)
+        first, second = next(chunks, b""), next(chunks, None)
+        if second is None:
+            response = self.client.put_object(
+                Bucket=self.bucket_name, Key=key, Body=first, ContentType=content_type
+            )
+            size = len(first)
+        else:
+            response, size = self._upload_multipart(
+                key, content_type, chain([first, second], chunks)
+            )
+        return {
+            "storage_type": self.storage_type,
+            "bucket": self.bucket_name,
+            "key": key,
+            "size": size,
+            "etag": response["ETag"].strip('"'),
+            "content_type": content_type,
+            "title": content_data.get("title", ""),
+        }
 
     def retrieve(self, storage_metadata: dict) -> dict:
-        raise NotImplementedError("S3 storage not yet implemented")
+        return {
+            "url": self.client.generate_presigned_url(
+                "get_object",
+                Params={
+                    "Bucket": storage_metadata.get("bucket", self.bucket_name),
+                    "Key": storage_metadata["key"],
+                },
+                ExpiresIn=settings.S3_URL_EXPIRY,
+            ),
+            "title": storage_metadata.get("title", ""),
+            "size": storage_metadata.get("size"),
+            "content_type": storage_metadata.get("content_type", ""),
+            "storage_type": self.storage_type,
+        }
+
+    def read_range(self, storage_metadata: dict, start: int = 0, end=None) -> bytes:
+        """Bytes `start`..`end` inclusive (to the end of the object if None)."""
+        return b"".join(self.iter_range(storage_metadata, start, end))
+
+    def iter_range(self, storage_metadata: dict, start: int = 0, end=None):
+        """Stream bytes `start`..`end` inclusive in chunk-sized pieces."""
+        body = self.client.get_object(
+            Bucket=storage_metadata.get("bucket", self.bucket_name),
+            Key=storage_metadata["key"],
+            Range=f"bytes={start}-{'' if end is None else end}",
+        )["Body"]
+        try:
+            yield from body.iter_chunks(self.chunk_size)
+        finally:
+            body.close()
 
     def delete(self, storage_metadata: dict) -> bool:
-        raise NotImplementedError("S3 storage not yet implemented")
+        self.client.delete_object(
+            Bucket=storage_metadata.get("bucket", self.bucket_name),
+            Key=storage_metadata["key"],
+        )
+        return True
 
     def validate(self, content_data: dict) -> bool:
-        raise NotImplementedError("S3 storage not yet implemented")
+        if not self.bucket_name:
+            return False
+        if isinstance(content_data.get("body"), (bytes, bytearray)):
+            return True
+        return callable(getattr(content_data.get("file"), "read", None))
+
+    # ==================== Internal ====================
+
+    def _create_client(self):
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError as exc:
+            raise ImproperlyConfigured("S3 storage requires boto3") from exc
+
+        return boto3.client(
+            "s3",
+            region_name=self.region or None,
+            endpoint_url=self.endpoint_url or None,
+            config=Config(max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS),
+        )
+
+    def _new_key(self, content_data: dict) -> str:
+        filename = content_data.get("filename") or getattr(
+            content_data.get("file"), "name", ""
+        )
+        name = str(filename).rsplit("/", 1)[-1] or "content"
+        return f"lessons/{uuid.uuid4().hex}/{name}"
+
+    def _chunks(self, content_data: dict):
+        """Full `chunk_size` pieces (the last may be short), however `read` behaves."""
+        body = content_data.get("body")
+        file = io.BytesIO(body) if body is not None else content_data["file"]
+        buffer = bytearray()
+        while data := file.read(self.chunk_size - len(buffer)):
+            buffer += data
+            if len(buffer) >= self.chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    def _upload_multipart(self, key, content_type, chunks):
+        upload_id = self.client.create_multipart_upload(
+            Bucket=self.bucket_name, Key=key, ContentType=content_type
+        )["UploadId"]
+        parts, size = [], 0
+        try:
+            for number, chunk in enumerate(chunks, start=1):
+                part = self.client.upload_part(
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=number,
+                    Body=chunk,
+                )
+                parts.append({"PartNumber": number, "ETag": part["ETag"]})
+                size += len(chunk)
+            response = self.client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=key, UploadId=upload_id
+            )
+            raise
+        return response, size
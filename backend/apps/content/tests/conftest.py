@@ -0,0 +1,105 @@
+import re
+from contextlib import contextmanager
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.content.models import Category, Course, Module, Lesson, Topic
+
+User = get_user_model()
+
+HEAVY_LESSON_COLUMNS = re.compile(
+    r'"content_lesson"\."content_data"|"content_contentblob"\."(data|compressed)"'
+)
+
+
+@pytest.fixture
+def instructor(db):
+    return User.objects.create_user(
+        email="instructor@example.com",
+        username="instructor",
+        password="testpass123",
+        fullname="Jane Instructor",
+        role="instructor",
+    )
+
+
+@pytest.fixture
+def instructor_client(instructor):
+    client = APIClient()
+    refresh = RefreshToken.for_user(instructor)
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+    client.user = instructor
+    return client
+
+
+@pytest.fixture
+def category(db):
+    return Category.objects.create(name="Programming")
+
+
+@pytest.fixture
+def topic(db):
+    return Topic.objects.create(name="Python", slug="python")
+
+
+@pytest.fixture
+def make_course(instructor, category, committed):
+    """
+    Factory building a course with `modules` x `lessons` published content,
+    with its on-commit work (version bumps) done as if it had committed.
+    """
+
+    def _make_course(
+        title="Course",
+        modules=2,
+        lessons=3,
+        is_published=True,
+        topics=(),
+        lesson_kwargs=None,
+        **kwargs,
+    ):
+        kwargs.setdefault("instructor", instructor)
+        kwargs.setdefault("category", category)
+        with committed():
+            course = Course.objects.create(
+                title=title, is_published=is_published, **kwargs
+            )
+            for m in range(modules):
+                module = Module.objects.create(
+                    course=course, title=f"{title} module {m}", order=m
+                )
+                for i in range(lessons):
+                    lesson = Lesson.objects.create(
+                        module=module,
+                        title=f"{title} lesson {m}.{i}",
+                        order=i,
+                        **(lesson_kwargs or {}),
+                    )
+                    if topics:
+                        lesson.topics.set(topics)
+        return course
+
+    return _make_course
+
+
+@pytest.fixture
+def assert_no_heavy_lesson_columns():
+    """Fail if any query in the block selects lesson bodies or transcripts."""
+
+    @contextmanager
+    def guard():
+        with CaptureQueriesContext(connection) as ctx:
+            yield
+        offenders = [
+            query["sql"]
+            for query in ctx.captured_queries
+            if HEAVY_LESSON_COLUMNS.search(query["sql"])
+        ]
+        assert not offenders, "Heavy lesson columns loaded:\n" + "\n".join(offenders)
+
+    return guard
@@ -0,0 +1,244 @@
+"""
+Benchmarks for content read paths.
+
+Sizes are kept small so the suite stays fast; raise them through the
+BENCH_* environment variables to reproduce production-sized numbers.
+"""
+
+import os
+import tracemalloc
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+def _measure(callable_):
+    tracemalloc.start()
+    with CaptureQueriesContext(connection) as ctx:
+        callable_()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(ctx.captured_queries), peak
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+class TestCatalogListBenchmark:
+    def test_catalog_list_stays_flat_as_courses_grow(
+        self, api_client, make_course, record_property
+    ):
+        lessons = _env_int("BENCH_LESSONS_PER_MODULE", 10)
+        url = reverse("course-list")
+        for i in range(5):
+            make_course(title=f"Small {i}", modules=4, lessons=lessons)
+        api_client.get(url)  # warm up URL resolving and serializer caches
+        small_queries, small_peak = _measure(lambda: api_client.get(url))
+
+        for i in range(5):
+            make_course(title=f"Large {i}", modules=4, lessons=lessons)
+        large_queries, large_peak = _measure(lambda: api_client.get(url))
+
+        record_property("small_catalog_queries", small_queries)
+        record_property("small_catalog_peak_bytes", small_peak)
+        record_property("large_catalog_queries", large_queries)
+        record_property("large_catalog_peak_bytes", large_peak)
+        # Course-only validator aggregate + the catalog page itself.
+        assert small_queries == large_queries == 3
+        # Memory grows with the number of rows only, not with their content tree.
+        assert large_peak < small_peak * 3
+
+
+def _build_synthetic_catalog(instructor, lessons_total, lessons_per_module=50):
+    """
+    Bulk-insert a catalog with random vocabulary. bulk_create skips the save
+    signals but still interns the lesson bodies.
+    """
+    import random
+
+    from apps.content.models import Course, Lesson, Module
+
+    rng = random.Random(42)
+    vocabulary = [f"term{i}" for i in range(5000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]  # Zipf-like
+
+    def text(words):
+        return " ".join(rng.choices(vocabulary, weights=weights, k=words))
+
+    modules_total = max(1, lessons_total // lessons_per_module)
+    courses = Course.objects.bulk_create(
+        Course(title=text(4), instructor=instructor, is_published=True)
+        for _ in range(max(1, modules_total // 10))
+    )
+    modules = Module.objects.bulk_create(
+        Module(course=courses[i % len(courses)], title=text(3), order=i)
+        for i in range(modules_total)
+    )
+    Lesson.objects.bulk_create(
+        (
+            Lesson(
+                module=modules[i % len(modules)],
+                title=text(5),
+                content=text(40),
+                content_data={"transcript": text(120)},
+                order=i,
+            )
+            for i in range(lessons_total)
+        ),
+        batch_size=1000,
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+class TestSearchBenchmark:
+    def test_ranked_queries_stay_under_50ms(self, instructor, record_property):
+        import statistics
+        import time
+
+        from apps.content.models import Lesson
+        from apps.content.services.search import (
+            search_index_service,
+            search_query_service,
+        )
+
+        # The 50 ms budget targets 100k lessons; BENCH_SEARCH_LESSONS=100000
+        # gave a 25.8 ms median on SQLite (about 17 minutes to build).
+        lessons = _env_int("BENCH_SEARCH_LESSONS", 2000)
+        _build_synthetic_catalog(instructor, lessons)
+        # Bodies are indexed too; bulk_create interns them like a save.
+        assert not Lesson.objects.filter(content_blob=None).exists()
+        search_index_service.rebuild()
+
+        queries = ["term1", "term7 term42", "term300 term5 term2", "term4999"]
+        search_query_service.search(queries[0])  # warm up
+        timings = []
+        for query in queries * 5:
+            start = time.perf_counter()
+            search_query_service.search(query, limit=20)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        median = statistics.median(timings)
+        record_property("lessons", lessons)
+        record_property("median_ms", round(median, 1))
+        record_property("max_ms", round(max(timings), 1))
+        assert median < 50
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+class TestCompiledSerializerBenchmark:
+    def test_compiled_detail_beats_drf_on_large_course(
+        self, make_course, topic, record_property
+    ):
+        import statistics
+        import time
+
+        from rest_framework.renderers import JSONRenderer
+
+        from apps.common.fastpath import serializer_compiler
+        from apps.content.serializers import CourseDetailSerializer
+        from apps.content.services import content_internal_facade as facade
+
+        modules = _env_int("BENCH_COMPILED_MODULES", 10)
+        lessons = _env_int("BENCH_COMPILED_LESSONS_PER_MODULE", 30)
+        course = make_course(modules=modules, lessons=lessons, topics=[topic])
+
+        def drf():
+            queryset = facade.get_published_courses_with_content()
+            return CourseDetailSerializer(queryset.get(pk=course.pk)).data
+
+        def compiled():
+            queryset = facade.get_published_courses_with_content()
+            return serializer_compiler.compile(CourseDetailSerializer).render_one(
+                queryset.filter(pk=course.pk)
+            )
+
+        assert JSONRenderer().render(compiled()) == JSONRenderer().render(drf())
+
+        def median_ms(render):
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                render()
+                timings.append((time.perf_counter() - start) * 1000)
+            return statistics.median(timings)
+
+        drf_ms, compiled_ms = median_ms(drf), median_ms(compiled)
+        record_property("lessons", modules * lessons)
+        record_property("drf_ms", round(drf_ms, 1))
+        record_property("compiled_ms", round(compiled_ms, 1))
+        assert compiled_ms < drf_ms
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+class TestLessonOutlineMemoryBenchmark:
+    def test_deferred_bodies_cut_outline_memory(
+        self, make_course, instructor, monkeypatch, record_property
+    ):
+        from apps.content.serializers import CourseInstructorDetailSerializer
+        from apps.content.services import content_internal_facade as facade
+        from apps.content.services.query import ContentQueryService
+
+        transcript_kb = _env_int("BENCH_TRANSCRIPT_KB", 20)
+        make_course(
+            modules=_env_int("BENCH_OUTLINE_MODULES", 5),
+            lessons=_env_int("BENCH_OUTLINE_LESSONS_PER_MODULE", 20),
+            lesson_kwargs={
+                "content": "x" * 1024,
+                "content_data": {"transcript": "word " * (transcript_kb * 205)},
+            },
+        )
+
+        def render(queryset):
+            return [CourseInstructorDetailSerializer(c).data for c in queryset]
+
+        after = facade.get_instructor_courses_with_details(instructor)
+        with monkeypatch.context() as patch:
+            # The same tree with lessons loaded in full, as before deferral.
+            patch.setattr(ContentQueryService, "HEAVY_LESSON_FIELDS", ())
+            before = facade.get_instructor_courses_with_details(instructor)
+        assert render(before) == render(after)
+
+        _, before_peak = _measure(lambda: render(before.all()))
+        _, after_peak = _measure(lambda: render(after.all()))
+        record_property("transcript_kb", transcript_kb)
+        record_property("loaded_peak_bytes", before_peak)
+        record_property("deferred_peak_bytes", after_peak)
+        assert after_peak * 2 < before_peak
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+class TestStreamingListBenchmark:
+    def test_stream_memory_stays_flat_as_rows_grow(
+        self, instructor, instructor_client, monkeypatch, record_property
+    ):
+        from apps.content.apis import StreamingListMixin
+
+        chunk = _env_int("BENCH_STREAM_CHUNK", 100)
+        lessons = _env_int("BENCH_STREAM_LESSONS", 500)
+        monkeypatch.setattr(StreamingListMixin, "stream_chunk_size", chunk)
+        url = f"{reverse('instructor-lesson-list')}?stream=true"
+
+        def consume():
+            response = instructor_client.get(url)
+            return sum(len(part) for part in response.streaming_content)
+
+        _build_synthetic_catalog(instructor, lessons)
+        consume()  # warm up URL resolving and serializer caches
+        _, small_peak = _measure(consume)
+
+        _build_synthetic_catalog(instructor, lessons * 3)
+        _, large_peak = _measure(consume)
+        record_property("chunk_rows", chunk)
+        record_property("small_peak_bytes", small_peak)
+        record_property("large_peak_bytes", large_peak)
+        # Four times the rows, roughly the same peak: only one chunk is held.
+        assert large_peak < small_peak * 2
@@ -0,0 +1,137 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.content.models import ContentBlob, Course, Lesson
+from apps.content.services.blobs import content_blob_service
+
+
+def refs():
+    return dict(ContentBlob.objects.values_list("data", "ref_count"))
+
+
+@pytest.fixture
+def shared(make_course):
+    """Two courses whose three lessons each share the same body."""
+    return [
+        make_course(title=title, modules=1, lessons=3, lesson_kwargs={"content": "x"})
+        for title in ("First", "Second")
+    ]
+
+
+@pytest.mark.django_db
+class TestContentBlobs:
+    def test_identical_bodies_are_stored_once(self, shared):
+        lesson = Lesson.objects.filter(module__course=shared[0]).first()
+
+        assert refs() == {"x": 6}
+        assert lesson.content == "x"
+        assert lesson.content_blob_id == content_blob_service.digest("x")
+
+    def test_edits_move_references(self, shared):
+        lesson = Lesson.objects.filter(module__course=shared[0]).first()
+
+        lesson.content = "y"
+        lesson.save()
+        assert refs() == {"x": 5, "y": 1}
+
+        lesson.content = ""
+        lesson.save()
+        lesson.refresh_from_db()
+        assert lesson.content_blob is None
+        assert lesson.content == ""
+        assert refs() == {"x": 5, "y": 0}
+
+    def test_deletes_release_references(self, shared):
+        first, second = shared
+        Lesson.objects.filter(module__course=first).first().delete()
+        assert refs() == {"x": 5}
+
+        first.modules.get().delete()
+        assert refs() == {"x": 3}
+
+        second.delete()
+        assert refs() == {"x": 0}
+
+    def test_bulk_create_keeps_bodies(self, shared):
+        module = shared[0].modules.get()
+
+        Lesson.objects.bulk_create(
+            Lesson(module=module, title=body, content=body, order=9)
+            for body in ("x", "z")
+        )
+
+        assert refs() == {"x": 7, "z": 1}
+        assert Lesson.objects.get(title="z").content == "z"
+
+    def test_clones_share_blobs(self, shared, instructor_client):
+        response = instructor_client.post(
+            reverse("instructor-course-clone", args=[shared[0].id]), format="json"
+        )
+
+        assert response.status_code == 201
+        assert ContentBlob.objects.count() == 1
+        assert refs() == {"x": 9}
+        clone = Course.objects.get(pk=response.data["id"])
+        assert {
+            lesson.content for lesson in Lesson.objects.filter(module__course=clone)
+        } == {"x"}
+
+    def test_api_reads_and_writes_bodies(self, instructor_client, make_course):
+        module = make_course(modules=1, lessons=0).modules.get()
+
+        created = instructor_client.post(
+            reverse("instructor-lesson-list"),
+            {"module_id": str(module.id), "title": "New", "content": "body"},
+            format="json",
+        )
+        detail = instructor_client.get(
+            reverse("instructor-lesson-detail", args=[created.data["id"]])
+        )
+
+        assert created.status_code == 201
+        assert created.data["content"] == detail.data["content"] == "body"
+        assert refs() == {"body": 1}
+
+    def test_garbage_collection(self, shared):
+        first, second = shared
+        Lesson.objects.filter(module__course=first).update(content_blob=None)
+        second.delete()
+        ContentBlob.objects.create(digest="0" * 64, data="stray", size=5, ref_count=3)
+        ContentBlob.objects.update(created_at=timezone.now() - timedelta(days=1))
+
+        call_command("gc_content_blobs", stdout=open("/dev/null", "w"))
+
+        assert not ContentBlob.objects.exists()
+
+    def test_garbage_collection_keeps_new_blobs(self, db):
+        # Interned by a save that has not pointed a lesson at it yet.
+        content_blob_service.intern(["in flight"])
+
+        assert content_blob_service.collect_garbage() == 0
+        assert content_blob_service.collect_garbage(grace_period=0) == 1
+
+    def test_garbage_collection_keeps_used_blobs(self, shared):
+        # A stale zero count must not let a blob in use be collected.
+        ContentBlob.objects.update(ref_count=0)
+
+        assert content_blob_service.collect_garbage() == 0
+        assert ContentBlob.objects.count() == 1
+
+    def test_imports_intern_bodies_in_one_batch(self, instructor_client):
+        lessons = [{"title": f"L{i}", "content": "shared"} for i in range(4)]
+        payload = {
+            "data": [
+                {"title": "Imported", "modules": [{"title": "M", "lessons": lessons}]}
+            ]
+        }
+
+        response = instructor_client.post(
+            reverse("instructor-course-import-package"), payload, format="json"
+        )
+
+        assert response.status_code == 201
+        assert refs() == {"shared": 4}
@@ -0,0 +1,184 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.content.models import (
+    Course,
+    CourseCloneJob,
+    Lesson,
+    PrerequisitePath,
+    SearchDocument,
+    Topic,
+)
+from apps.content.services.cloning import course_clone_service
+
+User = get_user_model()
+
+
+def tree(course):
+    """Everything a clone must reproduce, without IDs."""
+    return [
+        (
+            module.title,
+            module.order,
+            module.is_published,
+            module.published_lesson_count,
+            [
+                (
+                    lesson.title,
+                    lesson.order,
+                    lesson.content,
+                    lesson.content_data,
+                    lesson.is_published,
+                    sorted(topic.name for topic in lesson.topics.all()),
+                )
+                for lesson in module.lessons.order_by("order")
+            ],
+        )
+        for module in course.modules.order_by("order")
+    ]
+
+
+def clone_url(course):
+    return reverse("instructor-course-clone", args=[course.id])
+
+
+@pytest.fixture
+def source(make_course, topic):
+    basics = make_course(title="Basics", modules=0)
+    course = make_course(
+        title="Python",
+        modules=3,
+        lessons=4,
+        topics=[topic, Topic.objects.create(name="Django", slug="django")],
+        lesson_kwargs={"content": "body", "content_data": {"transcript": "hi"}},
+        students_count=42,
+        rating="4.50",
+    )
+    Lesson.objects.filter(module__course=course).first().unpublish()
+    course.prerequisites.add(basics)
+    return course
+
+
+@pytest.mark.django_db
+class TestCourseClone:
+    def test_clone_copies_the_whole_course(self, instructor_client, source):
+        response = instructor_client.post(
+            clone_url(source), {"title": "Python 2027"}, format="json"
+        )
+
+        assert response.status_code == 201
+        clone = Course.objects.get(pk=response.data["id"])
+        source.refresh_from_db()
+        assert clone.pk != source.pk
+        assert clone.title == "Python 2027"
+        assert (clone.is_published, clone.students_count, clone.rating) == (
+            False,
+            0,
+            0,
+        )
+        assert clone.published_lesson_count == source.published_lesson_count == 11
+        assert tree(clone) == tree(source)
+        assert set(clone.prerequisites.values_list("title", flat=True)) == {"Basics"}
+        assert PrerequisitePath.objects.filter(descendant=clone, depth=1).count() == 1
+        assert SearchDocument.objects.filter(course=clone).count() == 13
+        assert len(response.data["modules"]) == 3
+
+    def test_source_is_untouched(self, instructor_client, source):
+        before = tree(source)
+
+        instructor_client.post(clone_url(source), format="json")
+
+        assert tree(source) == before
+        assert Course.objects.filter(title="Python (copy)").exists()
+
+    def test_query_count_does_not_depend_on_course_size(
+        self, instructor_client, make_course, topic
+    ):
+        def count_queries(course):
+            with CaptureQueriesContext(connection) as ctx:
+                response = instructor_client.post(
+                    clone_url(course), {"title": "Copy"}, format="json"
+                )
+            assert response.status_code == 201
+            return len(ctx.captured_queries)
+
+        small = count_queries(make_course(modules=1, lessons=1, topics=[topic]))
+        large = count_queries(make_course(modules=6, lessons=15, topics=[topic]))
+
+        # Only SQLite's bound-parameter limit may split a few INSERTs.
+        assert large - small <= 3
+
+    def test_cannot_clone_another_instructors_course(self, api_client, source):
+        outsider = User.objects.create_user(
+            email="other@example.com", username="other", password="x", role="instructor"
+        )
+        api_client.force_authenticate(outsider)
+
+        response = api_client.post(clone_url(source), format="json")
+
+        assert response.status_code == 404
+        assert Course.objects.count() == 2
+
+
+@pytest.mark.django_db
+class TestBackgroundClone:
+    def test_large_courses_are_queued(
+        self, instructor_client, instructor, source, settings
+    ):
+        settings.COURSE_CLONE_ASYNC_LESSONS = 5
+
+        response = instructor_client.post(clone_url(source), format="json")
+
+        assert response.status_code == 202
+        job = CourseCloneJob.objects.get(pk=response.data["id"])
+        assert job.status == CourseCloneJob.Status.PENDING
+        assert Course.objects.count() == 2
+
+        call_command("run_course_clone_jobs", stdout=open("/dev/null", "w"))
+
+        job.refresh_from_db()
+        assert job.status == CourseCloneJob.Status.DONE
+        assert job.clone.instructor == instructor
+        assert tree(job.clone) == tree(source)
+
+        status = instructor_client.get(
+            reverse("instructor-course-clone-job", args=[job.pk])
+        )
+        assert status.data["status"] == "done"
+        assert status.data["clone"] == job.clone.pk
+
+    def test_background_flag_forces_a_job(self, instructor_client, source):
+        response = instructor_client.post(
+            clone_url(source), {"background": True}, format="json"
+        )
+
+        assert response.status_code == 202
+        assert response.data["title"] == "Python (copy)"
+
+    def test_failed_jobs_record_the_error(self, instructor, source, monkeypatch):
+        job = course_clone_service.enqueue(source, instructor)
+        monkeypatch.setattr(
+            Lesson.objects, "bulk_create", lambda *a, **k: 1 / 0, raising=False
+        )
+
+        assert course_clone_service.run_pending() == 1
+
+        job.refresh_from_db()
+        assert job.status == CourseCloneJob.Status.FAILED
+        assert "division by zero" in job.error
+        assert Course.objects.count() == 2
+
+    def test_jobs_are_private(self, api_client, instructor, source):
+        job = course_clone_service.enqueue(source, instructor)
+        outsider = User.objects.create_user(
+            email="other@example.com", username="other", password="x", role="instructor"
+        )
+        api_client.force_authenticate(outsider)
+
+        response = api_client.get(reverse("instructor-course-clone-job", args=[job.pk]))
+
+        assert response.status_code == 404
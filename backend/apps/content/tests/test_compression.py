@@ -0,0 +1,143 @@
+import io
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+
+from apps.common.fastpath import serializer_compiler
+from apps.content.compression import unpack_content_data
+from apps.content.models import ContentBlob, Lesson
+from apps.content.serializers import LessonDetailSerializer
+from apps.content.services import content_internal_facade as facade
+from apps.content.services.compression import lesson_compression_service
+from apps.content.services.search import search_index_service
+from apps.content.services.versioning import content_version_service
+
+BODY = "A long lesson body that repeats itself. " * 20
+TRANSCRIPT = "and then the speaker says the same thing again " * 20
+
+
+@pytest.fixture
+def lesson(make_course):
+    module = make_course(modules=1, lessons=0).modules.get()
+    return Lesson.objects.create(
+        module=module,
+        title="Talk",
+        content=BODY,
+        content_data={"transcript": TRANSCRIPT, "url": "https://example.com/v"},
+    )
+
+
+@pytest.fixture
+def enabled(settings):
+    settings.LESSON_COMPRESSION_THRESHOLD = 100
+
+
+def stored_transcript(lesson):
+    return Lesson.objects.values_list("content_data", flat=True).get(pk=lesson.pk)[
+        "transcript"
+    ]
+
+
+@pytest.mark.django_db
+class TestLessonCompression:
+    def test_off_by_default(self, lesson):
+        blob = ContentBlob.objects.get()
+
+        assert (blob.data, blob.compressed) == (BODY, None)
+        assert stored_transcript(lesson) == TRANSCRIPT
+
+    def test_long_text_is_stored_compressed(self, enabled, lesson):
+        blob = ContentBlob.objects.get()
+        transcript = stored_transcript(lesson)
+
+        assert blob.data == "" and len(blob.compressed) < blob.size == len(BODY)
+        assert transcript["encoding"] == "zlib+base64"
+        assert len(transcript["data"]) < len(TRANSCRIPT)
+
+    def test_short_text_stays_plain(self, enabled, make_course):
+        module = make_course(modules=1, lessons=0).modules.get()
+        lesson = Lesson.objects.create(
+            module=module,
+            title="Short",
+            content="brief",
+            content_data={"transcript": "hi"},
+        )
+
+        assert ContentBlob.objects.get().compressed is None
+        assert stored_transcript(lesson) == "hi"
+
+    def test_readers_see_plain_text(self, enabled, lesson, instructor_client):
+        lesson = Lesson.objects.get(pk=lesson.pk)
+        queryset = Lesson.objects.filter(pk=lesson.pk)
+
+        detail = instructor_client.get(
+            reverse("instructor-lesson-detail", args=[lesson.pk])
+        ).data
+        compiled = serializer_compiler.compile(LessonDetailSerializer).render(queryset)
+
+        for data in (detail, compiled[0], LessonDetailSerializer(lesson).data):
+            assert data["content"] == BODY
+            assert data["content_data"]["transcript"] == TRANSCRIPT
+        assert lesson.content == BODY
+        assert facade.get_lesson_content(lesson)["url"] == "https://example.com/v"
+        assert "speaker" in search_index_service.lesson_entry(lesson).weights
+
+    def test_api_writes_are_compressed(self, enabled, lesson, instructor_client):
+        response = instructor_client.patch(
+            reverse("instructor-lesson-detail", args=[lesson.pk]),
+            {"content_data": {"transcript": TRANSCRIPT.upper()}},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert response.data["content_data"]["transcript"] == TRANSCRIPT.upper()
+        assert stored_transcript(lesson)["encoding"] == "zlib+base64"
+
+    def test_existing_rows_are_compressed_in_chunks(self, lesson, make_course):
+        make_course(modules=1, lessons=3, lesson_kwargs={"content": BODY + "!"})
+
+        report = lesson_compression_service.compress_existing(100, chunk_size=1)
+
+        assert (report.blobs, report.transcripts) == (2, 1)
+        assert report.bytes_before == 2 * len(BODY) + 1 + len(TRANSCRIPT)
+        assert 0 < report.bytes_after < report.bytes_before
+        assert not ContentBlob.objects.filter(compressed=None).exists()
+        assert Lesson.objects.get(pk=lesson.pk).content == BODY
+        assert lesson_compression_service.compress_existing(100).bytes_before == 0
+
+    def test_backfill_keeps_concurrent_edits(self, lesson, monkeypatch, committed):
+        pages = lesson_compression_service._pages
+
+        def edit_between_pages(queryset, chunk_size):
+            for page in pages(queryset, chunk_size):
+                Lesson.objects.filter(pk=lesson.pk).update(
+                    content_data={"transcript": TRANSCRIPT.upper()}
+                )
+                yield page
+
+        monkeypatch.setattr(lesson_compression_service, "_pages", edit_between_pages)
+        version = content_version_service.get_course_version(lesson.module.course_id)
+
+        with committed():
+            lesson_compression_service.compress_existing(100)
+
+        lesson.refresh_from_db()
+        assert unpack_content_data(lesson.content_data) == {
+            "transcript": TRANSCRIPT.upper()
+        }
+        assert (
+            content_version_service.get_course_version(lesson.module.course_id)
+            != version
+        )
+
+    def test_command_reports_savings(self, lesson):
+        out = io.StringIO()
+        call_command("compress_lesson_content", "--threshold=100", stdout=out)
+
+        assert "Compressed 1 bodies and 1 transcripts" in out.getvalue()
+        assert "saved" in out.getvalue()
+
+    def test_command_needs_a_threshold(self, lesson):
+        with pytest.raises(CommandError):
+            call_command("compress_lesson_content", stdout=io.StringIO())
@@ -0,0 +1,180 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.content.models import Lesson
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controls timezone.now; `clock.tick()` moves it a few seconds on."""
+
+    class Clock:
+        now = timezone.now()
+
+        def tick(self, seconds=5):
+            self.now += timedelta(seconds=seconds)
+
+    clock = Clock()
+    monkeypatch.setattr(timezone, "now", lambda: clock.now)
+    return clock
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    def test_detail_emits_validators(self, api_client, make_course, clock):
+        course = make_course()
+        clock.tick()
+
+        response = api_client.get(reverse("course-detail", args=[course.id]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"].startswith('"')
+        assert "Last-Modified" in response
+
+    def test_detail_if_none_match_returns_304_with_one_query(
+        self, api_client, make_course, django_assert_num_queries
+    ):
+        course = make_course(modules=3, lessons=3)
+        url = reverse("course-detail", args=[course.id])
+        etag = api_client.get(url)["ETag"]
+
+        with django_assert_num_queries(1):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+    def test_detail_if_modified_since(self, api_client, make_course, clock):
+        course = make_course()
+        clock.tick()
+        url = reverse("course-detail", args=[course.id])
+        last_modified = api_client.get(url)["Last-Modified"]
+
+        response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_last_modified_withheld_within_the_second(self, api_client, make_course):
+        course = make_course()
+
+        response = api_client.get(reverse("course-detail", args=[course.id]))
+
+        assert "ETag" in response
+        assert "Last-Modified" not in response
+
+    def test_detail_if_modified_since_after_lesson_delete(
+        self, api_client, make_course, clock, committed
+    ):
+        course = make_course(modules=1, lessons=2)
+        clock.tick()
+        url = reverse("course-detail", args=[course.id])
+        last_modified = api_client.get(url)["Last-Modified"]
+
+        clock.tick()
+        with committed():
+            Lesson.objects.filter(module__course=course).first().delete()
+        clock.tick()
+        response = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Last-Modified"] != last_modified
+
+    def test_catalog_if_modified_since_after_unpublish_and_delete(
+        self, api_client, make_course, clock, committed
+    ):
+        first, second = make_course(title="First"), make_course(title="Second")
+        make_course(title="Third")
+        url = reverse("course-list")
+        clock.tick()
+        last_modified = api_client.get(url)["Last-Modified"]
+
+        clock.tick()
+        with committed():
+            second.unpublish()
+        clock.tick()
+        unpublished = api_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert unpublished.status_code == status.HTTP_200_OK
+        assert len(unpublished.data["results"]) == 2
+
+        clock.tick()
+        with committed():
+            first.delete()
+        clock.tick()
+        deleted = api_client.get(
+            url, HTTP_IF_MODIFIED_SINCE=unpublished["Last-Modified"]
+        )
+        assert deleted.status_code == status.HTTP_200_OK
+        assert len(deleted.data["results"]) == 1
+
+    def test_detail_etag_changes_on_lesson_edit_and_delete(
+        self, api_client, make_course
+    ):
+        course = make_course(modules=1, lessons=2)
+        url = reverse("course-detail", args=[course.id])
+        etag = api_client.get(url)["ETag"]
+
+        lesson = Lesson.objects.filter(module__course=course).first()
+        lesson.title = "Edited"
+        lesson.save()
+        edited = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert edited.status_code == status.HTTP_200_OK
+        assert edited["ETag"] != etag
+
+        lesson.delete()
+        deleted = api_client.get(url, HTTP_IF_NONE_MATCH=edited["ETag"])
+        assert deleted.status_code == status.HTTP_200_OK
+
+    def test_detail_unknown_or_malformed_course_is_404(self, api_client):
+        response = api_client.get("/api/content/courses/not-a-uuid/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_catalog_304_and_change_detection(self, api_client, make_course):
+        make_course(title="First")
+        url = reverse("course-list")
+        etag = api_client.get(url)["ETag"]
+
+        assert (
+            api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code
+            == status.HTTP_304_NOT_MODIFIED
+        )
+
+        make_course(title="Second")
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 2
+
+    def test_catalog_validators_read_course_rows_only(
+        self, api_client, make_course, committed
+    ):
+        course = make_course()
+        url = reverse("course-list")
+        etag = api_client.get(url)["ETag"]
+
+        with CaptureQueriesContext(connection) as ctx:
+            api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert len(ctx.captured_queries) == 1
+        assert "content_lesson" not in ctx.captured_queries[0]["sql"]
+
+        lesson = Lesson.objects.filter(module__course=course).first()
+        lesson.title = "Renamed"
+        with committed():
+            lesson.save()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_catalog_etag_depends_on_page(self, api_client, make_course):
+        for i in range(3):
+            make_course(title=f"Course {i}", modules=0)
+        url = reverse("course-list")
+
+        first = api_client.get(url + "?page_size=1")
+        second = api_client.get(first.data["next"])
+
+        assert first["ETag"] != second["ETag"]
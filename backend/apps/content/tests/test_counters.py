@@ -0,0 +1,77 @@
+import pytest
+from django.core.management import call_command
+
+from apps.content.models import Course, Lesson, Module
+from apps.content.services import content_facade
+
+
+def counts(course):
+    course.refresh_from_db()
+    modules = dict(course.modules.values_list("order", "published_lesson_count"))
+    return course.published_lesson_count, modules
+
+
+@pytest.mark.django_db
+class TestPublishedLessonCounters:
+    def test_creating_lessons_counts_published_ones(self, make_course):
+        course = make_course(modules=2, lessons=3)
+        Lesson.objects.create(
+            module=course.modules.get(order=0), title="Draft", is_published=False
+        )
+
+        assert counts(course) == (6, {0: 3, 1: 3})
+
+    def test_publish_state_changes(self, make_course):
+        course = make_course(modules=2, lessons=2)
+        module = course.modules.get(order=1)
+
+        Lesson.objects.filter(module=module).first().unpublish()
+        assert counts(course) == (3, {0: 2, 1: 1})
+
+        module.unpublish()
+        assert counts(course) == (2, {0: 2, 1: 1})
+
+        module.publish()
+        assert counts(course) == (3, {0: 2, 1: 1})
+
+    def test_moving_a_lesson_recounts_both_courses(self, make_course):
+        source = make_course(title="Source", modules=1, lessons=2)
+        target = make_course(title="Target", modules=1, lessons=1)
+        lesson = Lesson.objects.filter(module__course=source).first()
+
+        lesson.module = target.modules.get()
+        lesson.save()
+
+        assert counts(source) == (1, {0: 1})
+        assert counts(target) == (2, {0: 2})
+
+    def test_deletes(self, make_course):
+        course = make_course(modules=2, lessons=2)
+
+        Lesson.objects.filter(module__course=course).first().delete()
+        assert counts(course)[0] == 3
+
+        course.modules.get(order=1).delete()
+        assert counts(course) == (
+            Lesson.objects.filter(module__course=course).count(),
+            {0: Lesson.objects.filter(module__course=course).count()},
+        )
+
+    def test_rebuild_command_repairs_drift(self, make_course):
+        course = make_course(modules=2, lessons=2)
+        Course.objects.update(published_lesson_count=99)
+        Module.objects.update(published_lesson_count=99)
+
+        call_command("rebuild_lesson_counters", stdout=None)
+
+        assert counts(course) == (4, {0: 2, 1: 2})
+
+    def test_external_facade_reads_counters(
+        self, make_course, django_assert_num_queries
+    ):
+        course = make_course(modules=2, lessons=3)
+        module = course.modules.get(order=0)
+
+        with django_assert_num_queries(2):
+            assert content_facade.count_published_lessons_in_course(course.id) == 6
+            assert content_facade.count_published_lessons_in_module(module.id) == 3
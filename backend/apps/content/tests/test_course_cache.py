@@ -0,0 +1,137 @@
+import pytest
+from django.contrib.auth.models import update_last_login
+from django.urls import reverse
+from rest_framework import status
+
+from apps.content.models import Lesson, Module, Topic
+from apps.content.services.versioning import content_version_service
+
+
+@pytest.mark.django_db
+class TestCourseDetailCache:
+    def _get(self, client, course):
+        return client.get(reverse("course-detail", args=[course.id]))
+
+    def test_second_request_is_served_from_cache(
+        self, api_client, make_course, django_assert_num_queries
+    ):
+        course = make_course(modules=2, lessons=3)
+        first = self._get(api_client, course)
+
+        # Only the conditional-GET validator aggregate touches the database.
+        with django_assert_num_queries(1):
+            second = self._get(api_client, course)
+
+        assert second.data == first.data
+
+    def test_lesson_edit_invalidates(self, api_client, make_course, committed):
+        course = make_course(modules=1, lessons=1)
+        self._get(api_client, course)
+
+        lesson = Lesson.objects.get(module__course=course)
+        lesson.title = "Renamed"
+        with committed():
+            lesson.save()
+
+        response = self._get(api_client, course)
+        assert response.data["modules"][0]["lessons"][0]["title"] == "Renamed"
+
+    def test_unpublish_invalidates(self, api_client, make_course, committed):
+        course = make_course()
+        self._get(api_client, course)
+
+        with committed():
+            course.unpublish()
+
+        assert self._get(api_client, course).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_module_publish_state_invalidates(self, api_client, make_course, committed):
+        course = make_course(modules=2, lessons=1)
+        self._get(api_client, course)
+
+        with committed():
+            Module.objects.filter(course=course).first().unpublish()
+
+        assert len(self._get(api_client, course).data["modules"]) == 1
+
+    def test_module_delete_invalidates(self, api_client, make_course, committed):
+        course = make_course(modules=2, lessons=1)
+        self._get(api_client, course)
+
+        with committed():
+            Module.objects.filter(course=course).first().delete()
+
+        assert len(self._get(api_client, course).data["modules"]) == 1
+
+    def test_topic_links_invalidate(self, api_client, make_course, committed):
+        course = make_course(modules=1, lessons=1)
+        self._get(api_client, course)
+
+        with committed():
+            topic = Topic.objects.create(name="Django", slug="django")
+            Lesson.objects.get(module__course=course).topics.add(topic)
+
+        response = self._get(api_client, course)
+        assert (
+            response.data["modules"][0]["lessons"][0]["topics"][0]["slug"] == "django"
+        )
+
+        topic.name = "Django REST"
+        with committed():
+            topic.save()
+
+        response = self._get(api_client, course)
+        assert response.data["modules"][0]["lessons"][0]["topics"][0]["name"] == (
+            "Django REST"
+        )
+
+    def test_lesson_moved_to_other_course_invalidates_both(
+        self, api_client, make_course, committed
+    ):
+        source = make_course(title="Source", modules=1, lessons=2)
+        target = make_course(title="Target", modules=1, lessons=1)
+        self._get(api_client, source)
+        self._get(api_client, target)
+
+        lesson = Lesson.objects.filter(module__course=source).first()
+        lesson.module = Module.objects.get(course=target)
+        with committed():
+            lesson.save()
+
+        assert len(self._get(api_client, source).data["modules"][0]["lessons"]) == 1
+        assert len(self._get(api_client, target).data["modules"][0]["lessons"]) == 2
+
+    def test_category_rename_invalidates(
+        self, api_client, make_course, category, committed
+    ):
+        course = make_course()
+        self._get(api_client, course)
+
+        category.name = "Software"
+        with committed():
+            category.save()
+
+        assert self._get(api_client, course).data["category"] == "Software"
+
+    def test_instructor_rename_invalidates(
+        self, api_client, make_course, instructor, committed
+    ):
+        course = make_course()
+        self._get(api_client, course)
+
+        instructor.fullname = "Renamed Instructor"
+        with committed():
+            instructor.save(update_fields=["fullname"])
+
+        assert self._get(api_client, course).data["instructor_name"] == (
+            "Renamed Instructor"
+        )
+
+    def test_instructor_login_keeps_cache(self, make_course, instructor, committed):
+        course = make_course()
+        version = content_version_service.get_course_version(course.id)
+
+        with committed():
+            update_last_login(None, instructor)
+
+        assert content_version_service.get_course_version(course.id) == version
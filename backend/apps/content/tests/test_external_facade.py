@@ -0,0 +1,86 @@
+import uuid
+
+import pytest
+
+from apps.content.models import Lesson
+from apps.content.services import content_facade
+
+
+@pytest.fixture
+def courses(make_course):
+    python = make_course(title="Python", modules=2, lessons=3)
+    django = make_course(title="Django", modules=1, lessons=2)
+    Lesson.objects.filter(module__course=django).first().unpublish()
+    return python, django
+
+
+def lesson_ids(course):
+    return list(
+        Lesson.objects.filter(module__course=course)
+        .order_by("module__order", "order")
+        .values_list("id", flat=True)
+    )
+
+
+@pytest.mark.django_db
+class TestBatchLookups:
+    def test_each_lookup_is_one_query(self, courses, django_assert_num_queries):
+        python, django = courses
+        lessons = lesson_ids(python) + lesson_ids(django)
+        modules = list(python.modules.values_list("id", flat=True))
+
+        with django_assert_num_queries(5):
+            content_facade.get_module_ids_for_lessons(lessons)
+            content_facade.lessons_exist_in_course(lessons, python.id)
+            content_facade.count_published_lessons_in_courses([python.id, django.id])
+            content_facade.count_published_lessons_in_modules(modules)
+            content_facade.get_published_lesson_ids_in_modules(modules)
+
+    def test_module_ids_for_lessons(self, courses):
+        python, _ = courses
+        missing = uuid.uuid4()
+        lessons = lesson_ids(python)
+
+        mapping = content_facade.get_module_ids_for_lessons(
+            [str(pk) for pk in lessons] + [missing]
+        )
+
+        assert set(mapping) == set(lessons)
+        assert mapping == dict(
+            Lesson.objects.filter(id__in=lessons).values_list("id", "module_id")
+        )
+
+    def test_lessons_exist_in_course(self, courses):
+        python, django = courses
+        outsider = lesson_ids(django)[0]
+
+        result = content_facade.lessons_exist_in_course(
+            [*lesson_ids(python)[:2], str(outsider)], python.id
+        )
+
+        assert list(result.values()) == [True, True, False]
+        assert outsider in result
+
+    def test_published_lesson_counts(self, courses):
+        python, django = courses
+        missing = uuid.uuid4()
+        module = python.modules.first()
+
+        assert content_facade.count_published_lessons_in_courses(
+            [python.id, str(django.id), missing]
+        ) == {python.id: 6, django.id: 1, missing: 0}
+        assert content_facade.count_published_lessons_in_modules(
+            [module.id, missing]
+        ) == {module.id: 3, missing: 0}
+
+    def test_published_lesson_ids_in_modules(self, courses):
+        _, django = courses
+        module = django.modules.get()
+        published = list(
+            module.lessons.filter(is_published=True).values_list("id", flat=True)
+        )
+
+        result = content_facade.get_published_lesson_ids_in_modules([module.id])
+
+        assert result == {module.id: published}
+        assert content_facade.get_published_lesson_ids_in_modules([]) == {}
@@ -0,0 +1,141 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from apps.content.models import CatalogFacet, Category, Course, Topic
+
+
+def facet_counts(facet):
+    return dict(
+        CatalogFacet.objects.filter(facet=facet, count__gt=0).values_list(
+            "label", "count"
+        )
+    )
+
+
+@pytest.mark.django_db
+class TestCatalogFilters:
+    def test_filter_by_category(self, api_client, make_course):
+        design = Category.objects.create(name="Design")
+        make_course(title="Python", modules=0)
+        make_course(title="Figma", modules=0, category=design)
+
+        response = api_client.get(reverse("course-list"), {"category": design.id})
+
+        assert [c["title"] for c in response.data["results"]] == ["Figma"]
+
+    def test_filter_by_difficulty_accepts_several_values(self, api_client, make_course):
+        make_course(title="Intro", modules=0)
+        make_course(title="Deep dive", modules=0, difficulty_level="advanced")
+        make_course(title="Mastery", modules=0, difficulty_level="expert")
+
+        response = api_client.get(
+            reverse("course-list") + "?difficulty=advanced&difficulty=expert"
+        )
+
+        titles = {c["title"] for c in response.data["results"]}
+        assert titles == {"Deep dive", "Mastery"}
+
+    def test_filter_by_topic_matches_published_lessons_once(
+        self, api_client, make_course, topic
+    ):
+        make_course(title="Python", modules=2, lessons=2, topics=[topic])
+        make_course(title="Other", modules=1, lessons=1)
+
+        response = api_client.get(reverse("course-list"), {"topic": "python"})
+
+        assert [c["title"] for c in response.data["results"]] == ["Python"]
+
+    def test_filter_by_duration_range(self, api_client, make_course):
+        make_course(title="Short", modules=0, est_duration=30)
+        make_course(title="Medium", modules=0, est_duration=120)
+        make_course(title="Long", modules=0, est_duration=600)
+
+        response = api_client.get(
+            reverse("course-list"), {"min_duration": 60, "max_duration": 300}
+        )
+
+        assert [c["title"] for c in response.data["results"]] == ["Medium"]
+
+    def test_rejects_inverted_duration_range(self, api_client):
+        response = api_client.get(
+            reverse("course-list"), {"min_duration": 300, "max_duration": 60}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "max_duration" in response.data
+
+    def test_rejects_unknown_difficulty(self, api_client):
+        response = api_client.get(reverse("course-list"), {"difficulty": "easy"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestCatalogFacetSummary:
+    def test_publish_and_unpublish_update_counts(self, make_course):
+        course = make_course(modules=0, is_published=False)
+        assert facet_counts("category") == {}
+
+        course.publish()
+        assert facet_counts("category") == {"Programming": 1}
+        assert facet_counts("difficulty") == {"Beginner": 1}
+
+        course.unpublish()
+        assert facet_counts("category") == {}
+        assert facet_counts("difficulty") == {}
+
+    def test_recategorising_moves_the_course(self, make_course):
+        design = Category.objects.create(name="Design")
+        course = make_course(modules=0)
+        make_course(title="Second", modules=0)
+
+        course.category = design
+        course.difficulty_level = Course.DifficultyLevel.ADVANCED
+        course.save()
+
+        assert facet_counts("category") == {"Programming": 1, "Design": 1}
+        assert facet_counts("difficulty") == {"Beginner": 1, "Advanced": 1}
+
+    def test_delete_and_category_changes(self, make_course, category):
+        course = make_course(modules=0)
+        category.name = "Software"
+        category.save()
+        assert facet_counts("category") == {"Software": 1}
+
+        course.delete()
+        assert facet_counts("category") == {}
+
+        make_course(modules=0)
+        category.delete()
+        assert not CatalogFacet.objects.filter(facet="category").exists()
+
+    def test_rebuild_matches_incremental_counts(self, make_course):
+        make_course(title="A", modules=0)
+        make_course(title="B", modules=0, difficulty_level="expert")
+        make_course(title="C", modules=0, is_published=False)
+        expected = (facet_counts("category"), facet_counts("difficulty"))
+        CatalogFacet.objects.all().delete()
+
+        call_command("rebuild_catalog_facets", stdout=None)
+
+        assert (facet_counts("category"), facet_counts("difficulty")) == expected
+
+    def test_list_returns_facets_without_grouping_courses(
+        self, api_client, make_course, category
+    ):
+        Topic.objects.create(name="Unused", slug="unused")
+        make_course(title="A", modules=0)
+        make_course(title="B", modules=0, difficulty_level="expert")
+
+        response = api_client.get(reverse("course-list"))
+
+        facets = response.data["facets"]
+        assert facets["category"] == [
+            {"value": str(category.id), "label": "Programming", "count": 2}
+        ]
+        assert {row["label"]: row["count"] for row in facets["difficulty"]} == {
+            "Beginner": 1,
+            "Expert": 1,
+        }
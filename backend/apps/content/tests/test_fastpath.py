@@ -0,0 +1,181 @@
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from apps.common.fastpath import (
+    NotCompilable,
+    SerializerCompiler,
+    serializer_compiler,
+)
+from apps.content.models import Course, Lesson, Module, Topic
+from apps.content.serializers import (
+    CourseDetailSerializer,
+    CourseInstructorDetailSerializer,
+    CourseInstructorListSerializer,
+    CourseListSerializer,
+    LessonDetailSerializer,
+    LessonListSerializer,
+    ModuleInstructorSerializer,
+)
+from apps.content.services import content_internal_facade as facade
+from apps.content.services.fieldsets import FieldSelection
+
+User = get_user_model()
+
+
+def assert_identical(serializer_class, queryset, context=None):
+    """Compiled output must render to the very same JSON bytes as DRF's."""
+    context = context or {}
+    expected = serializer_class(queryset, many=True, context=context).data
+    compiled = serializer_compiler.compile(serializer_class, context)
+    actual = compiled.render(queryset)
+
+    assert expected
+    assert JSONRenderer().render(actual) == JSONRenderer().render(expected)
+
+
+@pytest.fixture
+def catalog(make_course, instructor, topic):
+    """Courses covering NULL relations, drafts, empty modules and m2m topics."""
+    other = Topic.objects.create(name="Django", slug="django")
+    full = make_course(
+        title="Full", modules=3, lessons=4, topics=[topic, other], rating="4.25"
+    )
+    Lesson.objects.filter(module__course=full).first().unpublish()
+    full.modules.last().unpublish()
+    Module.objects.create(course=full, title="Empty", order=9)
+    Lesson.objects.create(
+        module=full.modules.first(),
+        title="Rich",
+        content="body",
+        content_data={"transcript": "hello", "nested": [1, {"a": None}]},
+    )
+
+    nameless = User.objects.create_user(
+        email="nameless@example.com",
+        username="nameless",
+        password="x",
+        role="instructor",
+    )
+    make_course(title="No category", modules=1, lessons=1, category=None)
+    make_course(title="Nameless", modules=0, instructor=nameless)
+    return full
+
+
+@pytest.mark.django_db
+class TestCompiledSerializers:
+    def test_public_detail_matches(self, catalog):
+        assert_identical(
+            CourseDetailSerializer, facade.get_published_courses_with_content()
+        )
+
+    def test_public_catalog_matches(self, catalog):
+        assert_identical(CourseListSerializer, facade.get_published_course_catalog())
+
+    def test_instructor_paths_match(self, catalog, instructor):
+        assert_identical(
+            CourseInstructorDetailSerializer,
+            facade.get_instructor_courses_with_details(instructor),
+        )
+        assert_identical(
+            CourseInstructorListSerializer,
+            facade.get_instructor_courses_with_details(instructor),
+        )
+        assert_identical(
+            ModuleInstructorSerializer,
+            facade.get_instructor_modules_with_lessons(instructor),
+        )
+        assert_identical(
+            LessonListSerializer, facade.get_instructor_lessons_with_topics(instructor)
+        )
+        assert_identical(
+            LessonDetailSerializer,
+            facade.get_instructor_lessons_with_topics(instructor),
+        )
+
+    def test_sparse_selection_matches(self, catalog):
+        selection = FieldSelection.parse(
+            "id,category,instructor_name,modules.title,modules.lessons.topics"
+        )
+        assert_identical(
+            CourseDetailSerializer,
+            facade.get_published_courses_with_content(selection),
+            {"field_selection": selection},
+        )
+
+    def test_unknown_field_names_share_one_plan(self, api_client, catalog):
+        compiler = SerializerCompiler()
+        url = reverse("course-list")
+
+        with patch("apps.content.apis.serializer_compiler", compiler):
+            responses = [
+                api_client.get(url, {"fields": f"title,x{i}"}) for i in range(30)
+            ]
+
+        assert len(compiler._plans) == 1
+        assert all(
+            set(row) == {"title"} for r in responses for row in r.data["results"]
+        )
+
+    def test_plan_cache_is_bounded(self):
+        compiler = SerializerCompiler(max_plans=2)
+        for fields in ("id", "title", "id,title"):
+            context = {"field_selection": FieldSelection.parse(fields)}
+            compiler.compile(CourseListSerializer, context)
+
+        assert len(compiler._plans) == 2
+
+    def test_serializer_needing_instances_is_not_compiled(self):
+        class WithMethod(serializers.ModelSerializer):
+            label = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Course
+                fields = ["id", "label"]
+
+            def get_label(self, obj):
+                return obj.title
+
+        with pytest.raises(NotCompilable):
+            serializer_compiler.compile(WithMethod)
+
+
+@pytest.mark.django_db
+class TestCompiledEndpoints:
+    def test_public_detail_is_rendered_without_instances(
+        self, api_client, catalog, django_assert_max_num_queries
+    ):
+        # Validators, object lookup, course, modules, lessons, topics.
+        with django_assert_max_num_queries(6):
+            response = api_client.get(reverse("course-detail", args=[catalog.id]))
+
+        expected = CourseDetailSerializer(
+            facade.get_published_courses_with_content().get(pk=catalog.id)
+        ).data
+        assert response.content == JSONRenderer().render(expected)
+
+    def test_unknown_course_is_404(self, api_client, db):
+        response = api_client.get(
+            reverse("course-detail", args=["00000000-0000-0000-0000-000000000000"])
+        )
+
+        assert response.status_code == 404
+
+    def test_instructor_cannot_read_others_course(self, api_client, catalog):
+        outsider = User.objects.create_user(
+            email="other@example.com",
+            username="other",
+            password="x",
+            role="instructor",
+        )
+        api_client.force_authenticate(outsider)
+
+        response = api_client.get(
+            reverse("instructor-course-detail", args=[catalog.id])
+        )
+
+        assert response.status_code == 404
@@ -0,0 +1,150 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.content.services.fieldsets import FieldSelection
+
+
+def detail(client, course, **params):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(reverse("course-detail", args=[course.id]), params)
+    return response, [q["sql"] for q in ctx.captured_queries]
+
+
+class TestFieldSelection:
+    def test_absent_params_select_everything(self):
+        selection = FieldSelection.parse()
+
+        assert selection.is_default
+        assert selection.includes("anything")
+        assert selection.expands("modules")
+
+    def test_empty_fields_select_everything(self):
+        for fields in ("", " ", ","):
+            assert FieldSelection.parse(fields).is_default
+
+    def test_dotted_fields_build_nested_selections(self):
+        selection = FieldSelection.parse("id,modules.title,modules.lessons.id")
+
+        assert selection.fields == {"id", "modules"}
+        modules = selection.child("modules")
+        assert modules.fields == {"title", "lessons"}
+        assert modules.child("lessons").fields == {"id"}
+
+    def test_expand_limits_nested_relations(self):
+        selection = FieldSelection.parse(expand="modules")
+
+        assert selection.expands("modules")
+        assert selection.includes("title")
+        assert not selection.child("modules").expands("lessons")
+
+    def test_shape_key_ignores_spelling(self):
+        shape = {"id": None, "title": None, "modules": {"title": None}}
+        first = FieldSelection.parse("title,id", "modules")
+        second = FieldSelection.parse("id, title,id,bogus", "modules")
+
+        assert first.shape_key(shape) == second.shape_key(shape)
+        assert first.shape_key(shape) != FieldSelection.parse("id,title").shape_key(
+            shape
+        )
+
+
+@pytest.mark.django_db
+class TestSparseCourseDetail:
+    def test_empty_fields_param_renders_full_objects(self, api_client, make_course):
+        make_course()
+
+        response = api_client.get(reverse("course-list"), {"fields": ""})
+
+        assert response.data["results"][0]["title"] == "Course"
+
+    def test_fields_trim_every_level(self, api_client, make_course, topic):
+        course = make_course(modules=2, lessons=2, topics=[topic])
+
+        response, _ = detail(
+            api_client, course, fields="id,title,modules.title,modules.lessons.id"
+        )
+
+        assert set(response.data) == {"id", "title", "modules"}
+        module = response.data["modules"][0]
+        assert set(module) == {"title", "lessons"}
+        assert set(module["lessons"][0]) == {"id"}
+
+    def test_sidebar_selection_skips_columns_and_prefetches(
+        self, api_client, make_course, topic
+    ):
+        course = make_course(
+            modules=2, lessons=2, topics=[topic], description="long text"
+        )
+
+        _, full = detail(api_client, course)
+        _, sparse = detail(
+            api_client, course, fields="id,title,modules.title,modules.lessons.title"
+        )
+
+        assert len(sparse) < len(full)
+        assert not any("content_topic" in sql for sql in sparse)
+        course_sql = next(
+            sql for sql in sparse if sql.startswith('SELECT "content_course"."id"')
+        )
+        assert "description" not in course_sql
+        assert "content_category" not in course_sql
+
+    def test_expand_omits_unexpanded_relations(self, api_client, make_course):
+        course = make_course(modules=2, lessons=2)
+
+        response, queries = detail(api_client, course, expand="modules")
+
+        assert "modules" in response.data
+        assert "lessons" not in response.data["modules"][0]
+        assert not any('FROM "content_lesson"' in sql for sql in queries)
+
+    def test_sparse_and_full_payloads_are_cached_separately(
+        self, api_client, make_course
+    ):
+        course = make_course(modules=1, lessons=1)
+
+        sparse, _ = detail(api_client, course, fields="id")
+        full, _ = detail(api_client, course)
+        sparse_again, _ = detail(api_client, course, fields="id")
+
+        assert set(sparse.data) == {"id"}
+        assert "modules" in full.data
+        assert sparse_again.data == sparse.data
+
+    def test_equivalent_selections_share_a_cache_entry(self, api_client, make_course):
+        course = make_course(modules=1, lessons=1)
+
+        first, _ = detail(api_client, course, fields="id,title")
+        second, queries = detail(api_client, course, fields="title,id,title,bogus")
+
+        assert second.data == first.data
+        assert not any('"content_course"."title"' in sql for sql in queries)
+
+
+@pytest.mark.django_db
+class TestSparseLists:
+    def test_catalog_list_fields(self, api_client, make_course):
+        make_course(title="Python", modules=0)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(reverse("course-list"), {"fields": "id,title"})
+
+        assert set(response.data["results"][0]) == {"id", "title"}
+        page_sql = next(q["sql"] for q in ctx.captured_queries if "LIMIT" in q["sql"])
+        assert "content_category" not in page_sql
+        assert '"users"' not in page_sql
+
+    def test_instructor_lesson_list_without_topics(
+        self, instructor_client, make_course, topic
+    ):
+        make_course(modules=1, lessons=2, topics=[topic])
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = instructor_client.get(
+                reverse("instructor-lesson-list"), {"fields": "id,title"}
+            )
+
+        assert set(response.data["results"][0]) == {"id", "title"}
+        assert not any("content_topic" in q["sql"] for q in ctx.captured_queries)
@@ -0,0 +1,137 @@
+import json
+from pathlib import Path
+
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.content.models import CatalogFacet, Category, Course, Lesson, Topic
+from apps.content.services import content_internal_facade as facade
+
+FIXTURES = Path(settings.BASE_DIR) / "data" / "fixtures"
+
+
+def load_fixture(name):
+    return json.loads((FIXTURES / f"{name}.json").read_text())
+
+
+def package(courses=1, modules=2, lessons=3, **course):
+    return {
+        "data": [
+            {
+                "title": f"Imported {c}",
+                "is_published": True,
+                **course,
+                "modules": [
+                    {
+                        "title": f"Module {m}",
+                        "is_published": True,
+                        "lessons": [
+                            {
+                                "title": f"Lesson {m}.{i}",
+                                "is_published": True,
+                                "topic_names": ["Python"],
+                            }
+                            for i in range(lessons)
+                        ],
+                    }
+                    for m in range(modules)
+                ],
+            }
+            for c in range(courses)
+        ]
+    }
+
+
+def post(client, payload):
+    return client.post(
+        reverse("instructor-course-import-package"), payload, format="json"
+    )
+
+
+@pytest.mark.django_db
+class TestCoursePackageImport:
+    def test_imports_the_seed_fixture(self, instructor_client, instructor):
+        for item in load_fixture("categories")["data"]:
+            Category.objects.create(name=item["name"])
+        for item in load_fixture("topics")["data"]:
+            Topic.objects.create(name=item["name"], slug=item["slug"])
+        courses = load_fixture("courses")
+
+        response = post(instructor_client, courses)
+
+        assert response.status_code == 201, response.data
+        assert response.data["errors"] == []
+        assert response.data["created"] == {
+            "courses": len(courses["data"]),
+            "modules": sum(len(c["modules"]) for c in courses["data"]),
+            "lessons": sum(
+                len(m["lessons"]) for c in courses["data"] for m in c["modules"]
+            ),
+        }
+        first = Course.objects.get(title=courses["data"][0]["title"])
+        assert first.instructor == instructor
+        assert first.category.name == courses["data"][0]["category_name"]
+        lesson_data = courses["data"][0]["modules"][0]["lessons"][0]
+        lesson = Lesson.objects.get(module__course=first, title=lesson_data["title"])
+        assert lesson.content_data == lesson_data["content_data"]
+        assert sorted(lesson.topics.values_list("name", flat=True)) == sorted(
+            lesson_data["topic_names"]
+        )
+
+    def test_derived_data_is_current(self, instructor_client, topic, category):
+        response = post(instructor_client, package(category_name=category.name))
+        course = Course.objects.get(pk=response.data["course_ids"][0])
+
+        assert course.published_lesson_count == 6
+        assert list(course.modules.values_list("order", flat=True)) == [0, 1]
+        assert CatalogFacet.objects.get(value=str(category.pk)).count == 1
+        hits = facade.search("Lesson")
+        assert {hit.course_id for hit in hits} == {course.pk}
+
+    def test_query_count_does_not_grow_with_the_package(self, instructor_client, topic):
+        def count_queries(payload):
+            with CaptureQueriesContext(connection) as ctx:
+                assert post(instructor_client, payload).status_code == 201
+            return len(ctx.captured_queries)
+
+        small = count_queries(package(courses=1, modules=1, lessons=2))
+        large = count_queries(package(courses=5, modules=4, lessons=10))
+
+        # 100x the lessons; only SQLite's bound-parameter limit splits a few
+        # INSERTs into extra batches.
+        assert large - small <= 5
+
+    def test_invalid_courses_are_reported_and_the_rest_imported(
+        self, instructor_client, topic
+    ):
+        payload = package(courses=3)
+        payload["data"][0]["difficulty_level"] = "impossible"
+        payload["data"][2]["category_name"] = "Nowhere"
+        payload["data"][2]["modules"][0]["lessons"][0]["topic_names"] = ["Cobol"]
+
+        response = post(instructor_client, payload)
+
+        assert response.status_code == 201
+        assert response.data["created"]["courses"] == 1
+        assert [error["index"] for error in response.data["errors"]] == [0, 2]
+        assert "difficulty_level" in response.data["errors"][0]["errors"]
+        assert set(response.data["errors"][1]["errors"]) == {
+            "category_name",
+            "topic_names",
+        }
+        assert list(Course.objects.values_list("title", flat=True)) == ["Imported 1"]
+
+    def test_nothing_valid_is_a_400(self, instructor_client):
+        response = post(instructor_client, package(category_name="Nowhere"))
+
+        assert response.status_code == 400
+        assert response.data["created"]["courses"] == 0
+        assert not Course.objects.exists()
+
+    def test_requires_instructor(self, authenticated_client):
+        response = post(authenticated_client, package())
+
+        assert response.status_code == 403
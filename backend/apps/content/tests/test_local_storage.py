@@ -0,0 +1,193 @@
+import hashlib
+import io
+import os
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from django.urls import reverse
+
+from apps.common.ranges import ranged_file_response
+from apps.content.models import Lesson
+from apps.content.storage import LocalFileStorage, content_storage_service
+
+User = get_user_model()
+
+DATA = bytes(range(256)) * 4096  # 1 MiB
+
+
+@pytest.fixture
+def storage(settings, tmp_path):
+    settings.CONTENT_STORAGE_ROOT = str(tmp_path)
+    return LocalFileStorage()
+
+
+@pytest.fixture
+def lesson_file(storage, make_course):
+    metadata = storage.store(
+        {"body": DATA, "content_type": "video/mp4", "filename": "intro.mp4"}
+    )
+    lesson = Lesson.objects.filter(module__course=make_course(modules=1)).first()
+    lesson.content_data = metadata
+    lesson.save()
+    return lesson
+
+
+def file_url(metadata):
+    return reverse("content-file", args=[metadata["digest"]])
+
+
+def body(response):
+    return b"".join(response.streaming_content)
+
+
+class TestLocalFileStorage:
+    def test_files_are_content_addressed(self, storage):
+        first = storage.store({"file": io.BytesIO(DATA), "title": "Intro"})
+        second = storage.store({"body": DATA})
+
+        assert first["digest"] == second["digest"] == hashlib.sha256(DATA).hexdigest()
+        assert first["size"] == len(DATA)
+        assert storage.path(first["digest"]).read_bytes() == DATA
+        assert not any((storage.root / "tmp").iterdir())
+
+    def test_read_range(self, storage):
+        metadata = storage.store({"body": b"0123456789"})
+
+        assert storage.read_range(metadata, 2, 5) == b"2345"
+        assert storage.read_range(metadata, 7) == b"789"
+
+    def test_paths_must_be_digests(self, storage):
+        with pytest.raises(ValueError):
+            storage.path("../../etc/passwd")
+
+    @pytest.mark.django_db
+    def test_shared_files_survive_delete(
+        self, storage, lesson_file, django_capture_on_commit_callbacks
+    ):
+        metadata = lesson_file.content_data
+        other = Lesson.objects.exclude(pk=lesson_file.pk).first()
+        other.content_data = metadata
+        other.save()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            storage.delete(metadata)
+            lesson_file.delete()
+        assert storage.path(metadata["digest"]).exists()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            storage.delete(metadata)
+            other.delete()
+        assert not storage.path(metadata["digest"]).exists()
+
+    @pytest.mark.django_db
+    def test_retrieve_points_at_the_delivery_endpoint(self, storage):
+        metadata = content_storage_service.store({"body": b"pdf"}, "local")
+
+        content = content_storage_service.retrieve(metadata)
+
+        assert content["url"] == file_url(metadata)
+        assert content["storage_type"] == "local"
+
+
+@pytest.mark.django_db
+class TestContentFileDelivery:
+    def test_whole_file(self, api_client, lesson_file):
+        response = api_client.get(file_url(lesson_file.content_data))
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "video/mp4"
+        assert response["Accept-Ranges"] == "bytes"
+        assert response["Content-Length"] == str(len(DATA))
+        assert 'filename="intro.mp4"' in response["Content-Disposition"]
+        assert body(response) == DATA
+
+    def test_filenames_are_escaped(self, api_client, lesson_file):
+        lesson_file.content_data = {
+            **lesson_file.content_data,
+            "filename": 'bài "1"\r\n.mp4',
+        }
+        lesson_file.save()
+
+        response = api_client.get(file_url(lesson_file.content_data))
+
+        assert response["Content-Disposition"] == (
+            "inline; filename*=utf-8''b%C3%A0i%20%221%22%0D%0A.mp4"
+        )
+
+    @pytest.mark.parametrize(
+        "header, start, end",
+        [
+            ("bytes=0-99", 0, 99),
+            ("bytes=1000-", 1000, len(DATA) - 1),
+            ("bytes=-10", len(DATA) - 10, len(DATA) - 1),
+            ("bytes=500000-9999999", 500000, len(DATA) - 1),
+        ],
+    )
+    def test_ranges(self, api_client, lesson_file, header, start, end):
+        response = api_client.get(file_url(lesson_file.content_data), HTTP_RANGE=header)
+
+        assert response.status_code == 206
+        assert response["Content-Range"] == f"bytes {start}-{end}/{len(DATA)}"
+        assert response["Content-Length"] == str(end - start + 1)
+        assert body(response) == DATA[start : end + 1]
+
+    def test_ranges_can_be_sent_with_sendfile(self, storage):
+        path = storage.path(storage.store({"body": DATA})["digest"])
+        request = RequestFactory().get("/", HTTP_RANGE="bytes=1000-1999")
+
+        response = ranged_file_response(request, path, "video/mp4")
+        # What a WSGI file_wrapper hands to sendfile: the descriptor at the
+        # range start, bounded by Content-Length.
+        fd = response.file_to_stream.fileno()
+
+        assert os.lseek(fd, 0, os.SEEK_CUR) == 1000
+        assert os.pread(fd, int(response["Content-Length"]), 1000) == DATA[1000:2000]
+        assert b"".join(response) == DATA[1000:2000]
+        response.close()
+
+    def test_unsatisfiable_range(self, api_client, lesson_file):
+        response = api_client.get(
+            file_url(lesson_file.content_data), HTTP_RANGE=f"bytes={len(DATA)}-"
+        )
+
+        assert response.status_code == 416
+        assert response["Content-Range"] == f"bytes */{len(DATA)}"
+
+    def test_stale_if_range_sends_the_whole_file(self, api_client, lesson_file):
+        response = api_client.get(
+            file_url(lesson_file.content_data),
+            HTTP_RANGE="bytes=0-9",
+            HTTP_IF_RANGE='"stale"',
+        )
+
+        assert response.status_code == 200
+
+    def test_etag_revalidation(self, api_client, lesson_file):
+        url = file_url(lesson_file.content_data)
+        etag = api_client.get(url)["ETag"]
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_any_accept_header_is_served(self, api_client, lesson_file):
+        response = api_client.get(
+            file_url(lesson_file.content_data), HTTP_ACCEPT="video/*"
+        )
+
+        assert response.status_code == 200
+
+    def test_drafts_are_only_visible_to_their_instructor(
+        self, api_client, instructor_client, lesson_file
+    ):
+        lesson_file.unpublish()
+        url = file_url(lesson_file.content_data)
+
+        assert api_client.get(url).status_code == 404
+        assert instructor_client.get(url).status_code == 200
+
+    def test_unreferenced_files_are_404(self, api_client, storage):
+        metadata = storage.store({"body": b"orphan"})
+
+        assert api_client.get(file_url(metadata)).status_code == 404
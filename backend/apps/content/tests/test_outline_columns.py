@@ -0,0 +1,77 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.content.models import Lesson, Module
+
+
+@pytest.fixture
+def transcript_course(make_course, topic):
+    return make_course(
+        modules=2,
+        lessons=3,
+        topics=[topic],
+        lesson_kwargs={
+            "content": "body " * 200,
+            "content_data": {"transcript": "word " * 2000},
+        },
+    )
+
+
+@pytest.mark.django_db
+class TestOutlineQueriesDeferLessonBodies:
+    def test_public_list_and_detail(
+        self, api_client, transcript_course, assert_no_heavy_lesson_columns
+    ):
+        with assert_no_heavy_lesson_columns():
+            listing = api_client.get(reverse("course-list"))
+            detail = api_client.get(
+                reverse("course-detail", args=[transcript_course.id])
+            )
+
+        assert listing.status_code == detail.status_code == status.HTTP_200_OK
+        assert len(detail.data["modules"][0]["lessons"]) == 3
+
+    @pytest.mark.parametrize(
+        "url_name",
+        ["instructor-course-list", "instructor-module-list", "instructor-lesson-list"],
+    )
+    def test_instructor_lists(
+        self,
+        instructor_client,
+        transcript_course,
+        assert_no_heavy_lesson_columns,
+        url_name,
+    ):
+        with assert_no_heavy_lesson_columns():
+            response = instructor_client.get(reverse(url_name))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"]
+
+    def test_instructor_outlines_on_detail_and_publish(
+        self, instructor_client, transcript_course, assert_no_heavy_lesson_columns
+    ):
+        module = Module.objects.filter(course=transcript_course).first()
+
+        with assert_no_heavy_lesson_columns():
+            instructor_client.get(
+                reverse("instructor-course-detail", args=[transcript_course.id])
+            )
+            instructor_client.get(reverse("instructor-module-detail", args=[module.id]))
+            # Publish actions render through DRF instances, not the fast path.
+            instructor_client.post(
+                reverse("instructor-course-publish", args=[transcript_course.id])
+            )
+
+    def test_lesson_detail_still_returns_the_body(
+        self, instructor_client, transcript_course
+    ):
+        lesson = Lesson.objects.filter(module__course=transcript_course).first()
+
+        response = instructor_client.get(
+            reverse("instructor-lesson-detail", args=[lesson.id])
+        )
+
+        assert response.data["content_data"]["transcript"].startswith("word")
+        assert response.data["content"].startswith("body")
@@ -0,0 +1,113 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.content.models import Course, Lesson, Module
+from apps.content.permissions import IsOwner
+from apps.content.services.authority import OwnershipResolver
+
+User = get_user_model()
+
+
+@pytest.fixture
+def outsider():
+    return User.objects.create_user(
+        email="other@example.com", username="other", password="x", role="instructor"
+    )
+
+
+@pytest.mark.django_db
+class TestOwnershipResolver:
+    def test_answers_by_id_and_memoizes(
+        self, instructor, make_course, django_assert_num_queries
+    ):
+        course = make_course(modules=1, lessons=1)
+        lesson = Lesson.objects.get(module__course=course)
+        resolver = OwnershipResolver(instructor)
+
+        with django_assert_num_queries(1):
+            assert resolver.owns_id(Lesson, lesson.pk)
+            assert resolver.owns_id(Lesson, str(lesson.pk))
+            assert resolver.owns(lesson)
+
+    def test_loaded_relations_cost_no_queries(
+        self, instructor, make_course, django_assert_num_queries
+    ):
+        course = make_course(modules=1, lessons=1)
+        module = Module.objects.select_related("course").get(course=course)
+        lesson = Lesson.objects.select_related("module__course").get(module=module)
+        resolver = OwnershipResolver(instructor)
+
+        with django_assert_num_queries(0):
+            assert resolver.owns(course)
+            assert resolver.owns(module)
+            assert resolver.owns(lesson)
+
+    def test_other_users_and_missing_rows(self, outsider, make_course):
+        course = make_course(modules=1, lessons=0)
+        resolver = OwnershipResolver(outsider)
+
+        assert not resolver.owns(course)
+        assert not resolver.owns_id(Module, course.modules.get().pk)
+        assert not resolver.owns_id(Course, "00000000-0000-0000-0000-000000000000")
+
+    def test_is_shared_for_one_request(self, rf, instructor, outsider):
+        request = rf.get("/")
+        request.user = instructor
+
+        resolver = OwnershipResolver.for_request(request)
+
+        assert OwnershipResolver.for_request(request) is resolver
+        request.user = outsider
+        assert OwnershipResolver.for_request(request) is not resolver
+
+    def test_is_owner_permission(self, rf, instructor, outsider, make_course):
+        course = make_course(modules=0)
+        request = rf.get("/")
+
+        request.user = instructor
+        assert IsOwner().has_object_permission(request, None, course)
+        request.user = outsider
+        assert not IsOwner().has_object_permission(request, None, course)
+
+
+@pytest.mark.django_db
+class TestOwnerActions:
+    def test_lesson_update_never_loads_the_instructor(
+        self, instructor_client, make_course
+    ):
+        lesson = Lesson.objects.get(module__course=make_course(modules=1, lessons=1))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = instructor_client.patch(
+                reverse("instructor-lesson-detail", args=[lesson.pk]),
+                {"title": "Renamed"},
+                format="json",
+            )
+
+        assert response.status_code == 200
+        user_table = User._meta.db_table
+        # Only the authentication lookup touches the user table.
+        assert sum(user_table in q["sql"] for q in ctx.captured_queries) <= 1
+
+    def test_create_checks_the_parent(self, api_client, outsider, make_course):
+        course = make_course(modules=1, lessons=0)
+        api_client.force_authenticate(outsider)
+
+        module_response = api_client.post(
+            reverse("instructor-module-list"),
+            {"course_id": str(course.pk), "title": "Intruder"},
+            format="json",
+        )
+        lesson_response = api_client.post(
+            reverse("instructor-lesson-list"),
+            {"module_id": str(course.modules.get().pk), "title": "Intruder"},
+            format="json",
+        )
+
+        assert module_response.status_code == 403
+        assert lesson_response.status_code == 403
+        assert not Module.objects.filter(title="Intruder").exists()
+        assert not Lesson.objects.filter(title="Intruder").exists()
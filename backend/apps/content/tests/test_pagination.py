@@ -0,0 +1,87 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.content.models import Course, Lesson, Module
+
+
+def _collect(client, url):
+    items, pages = [], 0
+    while url:
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        items.extend(response.data["results"])
+        url = response.data["next"]
+        pages += 1
+    return items, pages
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    def test_walks_every_course_exactly_once(self, api_client, make_course):
+        for i in range(7):
+            make_course(title=f"Course {i}", modules=0)
+
+        items, pages = _collect(api_client, reverse("course-list") + "?page_size=3")
+
+        assert pages == 3
+        assert len({item["id"] for item in items}) == 7
+        expected = list(
+            Course.objects.order_by("-created_at", "-id").values_list(
+                "title", flat=True
+            )
+        )
+        assert [item["title"] for item in items] == expected
+
+    def test_ties_are_broken_by_primary_key(self, api_client, make_course):
+        for i in range(5):
+            make_course(title=f"Course {i}", modules=0)
+        # Identical timestamps would make OFFSET-free paging skip rows
+        # without a tie-breaker.
+        Course.objects.update(created_at=Course.objects.first().created_at)
+
+        items, _ = _collect(api_client, reverse("course-list") + "?page_size=2")
+
+        assert len({item["id"] for item in items}) == 5
+
+    def test_instructor_lessons_follow_display_order(
+        self, instructor_client, make_course
+    ):
+        make_course(modules=1, lessons=5)
+        Lesson.objects.update(order=1)
+
+        items, _ = _collect(
+            instructor_client, reverse("instructor-lesson-list") + "?page_size=2"
+        )
+
+        assert len({item["id"] for item in items}) == 5
+
+    def test_next_page_filters_instead_of_offsetting(
+        self, api_client, make_course, django_assert_num_queries
+    ):
+        for i in range(4):
+            make_course(title=f"Course {i}", modules=0)
+        first = api_client.get(reverse("course-list") + "?page_size=2")
+
+        with django_assert_num_queries(3) as ctx:
+            api_client.get(first.data["next"])
+
+        page_sql = [q["sql"] for q in ctx.captured_queries if "LIMIT" in q["sql"]]
+        assert page_sql
+        assert all("OFFSET" not in sql.upper() for sql in page_sql)
+
+    def test_invalid_cursor_returns_404(self, api_client):
+        response = api_client.get(reverse("course-list") + "?cursor=not-a-cursor")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_module_list_paginates(self, instructor_client, make_course):
+        make_course(modules=3, lessons=0)
+
+        response = instructor_client.get(
+            reverse("instructor-module-list") + "?page_size=2"
+        )
+
+        assert len(response.data["results"]) == 2
+        assert response.data["next"] is not None
+        assert Module.objects.count() == 3
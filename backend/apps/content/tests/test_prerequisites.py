@@ -0,0 +1,208 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import transaction
+from django.urls import reverse
+
+from apps.content.models import Course, PrerequisitePath
+
+
+def paths():
+    """The closure as {(ancestor title, descendant title): depth}."""
+    return {
+        (path.ancestor.title, path.descendant.title): path.depth
+        for path in PrerequisitePath.objects.select_related("ancestor", "descendant")
+    }
+
+
+@pytest.fixture
+def chain(make_course):
+    """Basics -> Intermediate -> Advanced, each requiring the previous one."""
+    basics = make_course(title="Basics", modules=0)
+    intermediate = make_course(title="Intermediate", modules=0)
+    advanced = make_course(title="Advanced", modules=0)
+    intermediate.prerequisites.add(basics)
+    advanced.prerequisites.add(intermediate)
+    return basics, intermediate, advanced
+
+
+@pytest.mark.django_db
+class TestPrerequisiteClosure:
+    def test_chain_is_closed_transitively(self, chain):
+        assert paths() == {
+            ("Basics", "Intermediate"): 1,
+            ("Intermediate", "Advanced"): 1,
+            ("Basics", "Advanced"): 2,
+        }
+
+    def test_new_link_reaches_existing_dependents(self, chain, make_course):
+        basics, _, _ = chain
+        primer = make_course(title="Primer", modules=0)
+
+        basics.prerequisites.add(primer)
+
+        assert paths()[("Primer", "Advanced")] == 3
+        assert paths()[("Primer", "Intermediate")] == 2
+
+    def test_shortest_depth_wins_and_survives_removal(self, chain):
+        basics, intermediate, advanced = chain
+
+        advanced.prerequisites.add(basics)
+        assert paths()[("Basics", "Advanced")] == 1
+
+        advanced.prerequisites.remove(basics)
+        assert paths()[("Basics", "Advanced")] == 2
+
+    def test_removing_a_link_drops_inherited_paths(self, chain):
+        _, intermediate, _ = chain
+
+        intermediate.prerequisites.clear()
+
+        assert paths() == {("Intermediate", "Advanced"): 1}
+
+    def test_reverse_side_updates(self, chain, make_course):
+        basics, intermediate, advanced = chain
+        extra = make_course(title="Extra", modules=0)
+
+        basics.required_by.add(extra)
+        assert paths()[("Basics", "Extra")] == 1
+
+        basics.required_by.clear()
+        assert paths() == {("Intermediate", "Advanced"): 1}
+
+    def test_deleting_a_course_breaks_chains_through_it(self, chain):
+        _, intermediate, _ = chain
+
+        intermediate.delete()
+
+        assert paths() == {}
+
+    @pytest.mark.parametrize(
+        "course, prerequisite",
+        [("Basics", "Basics"), ("Basics", "Intermediate"), ("Basics", "Advanced")],
+    )
+    def test_cycles_are_rejected(self, chain, course, prerequisite):
+        course = Course.objects.get(title=course)
+
+        prerequisite = Course.objects.get(title=prerequisite)
+
+        # add() has no savepoint of its own; keep the test transaction usable.
+        with pytest.raises(ValidationError), transaction.atomic():
+            course.prerequisites.add(prerequisite)
+
+        assert len(paths()) == 3
+
+    def test_cycles_are_rejected_from_the_reverse_side(self, chain):
+        basics, _, advanced = chain
+
+        with pytest.raises(ValidationError):
+            advanced.required_by.add(basics)
+
+    def test_rebuild_command_repairs_drift(self, chain):
+        expected = paths()
+        PrerequisitePath.objects.all().delete()
+        PrerequisitePath.objects.create(ancestor=chain[2], descendant=chain[0], depth=7)
+
+        call_command("rebuild_prerequisite_paths", stdout=open("/dev/null", "w"))
+
+        assert paths() == expected
+
+
+@pytest.mark.django_db
+class TestPrerequisiteEndpoints:
+    def test_chain_lists_published_prerequisites_furthest_first(
+        self, api_client, chain, make_course
+    ):
+        basics, intermediate, advanced = chain
+        hidden = make_course(title="Hidden", modules=0, is_published=False)
+        advanced.prerequisites.add(hidden)
+
+        response = api_client.get(reverse("course-prerequisites", args=[advanced.id]))
+
+        assert response.status_code == 200
+        assert [(c["title"], c["depth"]) for c in response.data] == [
+            ("Basics", 2),
+            ("Intermediate", 1),
+        ]
+
+    def test_unpublished_course_is_404(self, api_client, make_course):
+        draft = make_course(modules=0, is_published=False)
+
+        response = api_client.get(reverse("course-prerequisites", args=[draft.id]))
+
+        assert response.status_code == 404
+
+    def test_instructor_sets_prerequisites(self, instructor_client, chain):
+        basics, _, advanced = chain
+
+        response = instructor_client.patch(
+            reverse("instructor-course-detail", args=[advanced.id]),
+            {"prerequisite_ids": [str(basics.id)]},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert set(advanced.prerequisites.all()) == {basics}
+        assert paths() == {
+            ("Basics", "Intermediate"): 1,
+            ("Basics", "Advanced"): 1,
+        }
+
+    def test_cyclic_prerequisites_are_a_validation_error(
+        self, instructor_client, chain
+    ):
+        basics, _, advanced = chain
+
+        response = instructor_client.patch(
+            reverse("instructor-course-detail", args=[basics.id]),
+            {"prerequisite_ids": [str(advanced.id)]},
+            format="json",
+        )
+
+        assert response.status_code == 400
+        assert "prerequisite_ids" in response.data
+        assert not basics.prerequisites.exists()
+
+    def test_only_published_or_own_courses_can_be_required(
+        self, instructor_client, make_course, django_user_model
+    ):
+        other = django_user_model.objects.create_user(
+            email="other@example.com", username="other", password="x", role="instructor"
+        )
+        foreign_draft = make_course(
+            title="Foreign", instructor=other, is_published=False
+        )
+        own_draft = make_course(title="Own", modules=0, is_published=False)
+        course = make_course(title="Target", modules=0)
+        url = reverse("instructor-course-detail", args=[course.id])
+
+        foreign = instructor_client.patch(
+            url, {"prerequisite_ids": [str(foreign_draft.id)]}, format="json"
+        )
+        missing = instructor_client.patch(
+            url,
+            {"prerequisite_ids": ["00000000-0000-0000-0000-000000000000"]},
+            format="json",
+        )
+        own = instructor_client.patch(
+            url, {"prerequisite_ids": [str(own_draft.id)]}, format="json"
+        )
+
+        assert foreign.status_code == missing.status_code == 400
+        assert str(foreign.data["prerequisite_ids"][0]).replace(
+            str(foreign_draft.id), "<pk>"
+        ) == str(missing.data["prerequisite_ids"][0]).replace(
+            "00000000-0000-0000-0000-000000000000", "<pk>"
+        )
+        assert own.status_code == 200
+        assert set(course.prerequisites.all()) == {own_draft}
+
+    def test_create_with_prerequisites(self, instructor_client, chain):
+        response = instructor_client.post(
+            reverse("instructor-course-list"),
+            {"title": "Capstone", "prerequisite_ids": [str(chain[2].id)]},
+            format="json",
+        )
+
+        assert response.status_code == 201
+        assert paths()[("Basics", "Capstone")] == 3
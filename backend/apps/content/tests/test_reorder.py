@@ -0,0 +1,109 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from apps.content.services.versioning import content_version_service
+
+User = get_user_model()
+
+
+def ordered_ids(queryset):
+    return [str(pk) for pk in queryset.order_by("order").values_list("id", flat=True)]
+
+
+@pytest.mark.django_db
+class TestReorder:
+    def test_reorders_modules_in_one_update(
+        self, instructor_client, make_course, django_assert_max_num_queries, committed
+    ):
+        course = make_course(modules=4, lessons=0)
+        ids = ordered_ids(course.modules.all())[::-1]
+        version = content_version_service.get_course_version(course.id)
+
+        # Auth + the locked read + the bulk update (and its savepoint).
+        with committed(), django_assert_max_num_queries(5):
+            response = instructor_client.post(
+                reverse("instructor-module-reorder"),
+                {"course_id": str(course.id), "ids": ids},
+                format="json",
+            )
+
+        assert response.status_code == 200
+        assert response.data == {"updated": 4}
+        assert ordered_ids(course.modules.all()) == ids
+        assert content_version_service.get_course_version(course.id) != version
+
+    def test_reorders_lessons_and_skips_unchanged_rows(
+        self, instructor_client, make_course
+    ):
+        course = make_course(modules=1, lessons=3)
+        module = course.modules.get()
+        first, second, third = ordered_ids(module.lessons.all())
+
+        response = instructor_client.post(
+            reverse("instructor-lesson-reorder"),
+            {"module_id": str(module.id), "ids": [first, third, second]},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert response.data == {"updated": 2}
+        assert ordered_ids(module.lessons.all()) == [first, third, second]
+
+    def test_rejects_other_instructors_content(self, make_course, api_client):
+        course = make_course(modules=2, lessons=0)
+        outsider = User.objects.create_user(
+            email="other@example.com",
+            username="other",
+            password="x",
+            role="instructor",
+        )
+        api_client.force_authenticate(outsider)
+        ids = ordered_ids(course.modules.all())
+
+        response = api_client.post(
+            reverse("instructor-module-reorder"),
+            {"course_id": str(course.id), "ids": ids[::-1]},
+            format="json",
+        )
+
+        assert response.status_code == 403
+        assert ordered_ids(course.modules.all()) == ids
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda ids: ids[:-1],
+            lambda ids: ids + ["00000000-0000-0000-0000-000000000000"],
+            lambda ids: ids[:-1] + ids[:1],
+        ],
+        ids=["missing", "foreign", "repeated"],
+    )
+    def test_ids_must_be_exactly_the_siblings(
+        self, instructor_client, make_course, change
+    ):
+        course = make_course(modules=1, lessons=3)
+        module = course.modules.get()
+        ids = ordered_ids(module.lessons.all())
+
+        response = instructor_client.post(
+            reverse("instructor-lesson-reorder"),
+            {"module_id": str(module.id), "ids": change(ids)},
+            format="json",
+        )
+
+        assert response.status_code == 400
+        assert ordered_ids(module.lessons.all()) == ids
+
+    def test_requires_instructor(self, authenticated_client, make_course):
+        course = make_course(modules=2, lessons=0)
+        ids = ordered_ids(course.modules.all())
+
+        response = authenticated_client.post(
+            reverse("instructor-module-reorder"),
+            {"course_id": str(course.id), "ids": ids[::-1]},
+            format="json",
+        )
+
+        assert response.status_code == 403
+        assert ordered_ids(course.modules.all()) == ids
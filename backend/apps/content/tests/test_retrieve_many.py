@@ -0,0 +1,162 @@
+import threading
+import time
+
+import pytest
+from django.urls import reverse
+
+from apps.content.models import Lesson
+from apps.content.services import content_internal_facade as facade
+from apps.content.storage import (
+    ContentStorage,
+    RetrieveResult,
+    StorageRegistry,
+    content_storage_service,
+)
+
+
+def url(name):
+    return {"storage_type": "external_url", "url": f"https://cdn.example.com/{name}"}
+
+
+@pytest.fixture
+def local(settings, tmp_path):
+    settings.CONTENT_STORAGE_ROOT = str(tmp_path)
+    return StorageRegistry.get_handler("local")
+
+
+@pytest.fixture
+def slow_storage():
+    class SlowStorage(ContentStorage):
+        storage_type = "slow"
+        max_concurrency = 4
+        threads = set()
+
+        def retrieve(self, storage_metadata):
+            self.threads.add(threading.get_ident())
+            time.sleep(0.2)
+            return {"name": storage_metadata["name"]}
+
+        def store(self, content_data):
+            return content_data
+
+        def delete(self, storage_metadata):
+            return True
+
+        def validate(self, content_data):
+            return True
+
+    yield SlowStorage
+    StorageRegistry._handlers.pop("slow")
+    StorageRegistry.shutdown()
+
+
+class TestRetrieveMany:
+    def test_mixed_backends_keyed_by_caller_key(self, local):
+        stored = local.store({"body": b"pdf", "title": "Notes"})
+
+        results = content_storage_service.retrieve_many(
+            {"a": url("a.mp4"), "b": stored, "c": url("c.mp4")}
+        )
+
+        assert list(results) == ["a", "b", "c"]
+        assert results["a"].content["url"] == "https://cdn.example.com/a.mp4"
+        assert results["b"].content["url"].endswith(f"/{stored['digest']}/")
+        assert all(result.error is None for result in results.values())
+
+    def test_errors_are_per_item(self, local):
+        results = content_storage_service.retrieve_many(
+            {
+                "ok": url("ok.mp4"),
+                "broken": {"storage_type": "local"},
+                "unknown": {"storage_type": "ftp"},
+            }
+        )
+
+        assert results["ok"].error is None
+        assert results["broken"] == RetrieveResult(error="'digest'")
+        assert results["unknown"].error == "Unknown storage type: ftp"
+
+    def test_io_bound_backends_fetch_concurrently(self, slow_storage):
+        items = {n: {"storage_type": "slow", "name": n} for n in range(4)}
+
+        started = time.perf_counter()
+        results = content_storage_service.retrieve_many(items)
+        elapsed = time.perf_counter() - started
+
+        assert [results[n].content["name"] for n in range(4)] == [0, 1, 2, 3]
+        assert len(slow_storage.threads) > 1
+        assert elapsed < 0.6
+
+    def test_empty_batch(self):
+        assert content_storage_service.retrieve_many({}) == {}
+
+
+@pytest.mark.django_db
+class TestLessonsContent:
+    def test_keyed_by_lesson(self, make_course):
+        first, second, third = Lesson.objects.filter(
+            module__course=make_course(modules=1, lessons=3)
+        ).order_by("order")
+        first.content_data = url("intro.mp4")
+        second.content = "Plain text"
+        for lesson in (first, second):
+            lesson.save()
+
+        results = facade.get_lessons_content([first, second, third])
+
+        assert results[first.pk].content["url"].endswith("intro.mp4")
+        assert results[second.pk].content == {"main_content": "Plain text"}
+        assert results[third.pk] == RetrieveResult({})
+
+    def test_bodies_are_read_in_one_query(self, make_course, django_assert_num_queries):
+        make_course(modules=2, lessons=3, lesson_kwargs={"content": "Body"})
+        lessons = list(Lesson.objects.all())
+
+        with django_assert_num_queries(1):
+            results = facade.get_lessons_content(lessons)
+
+        assert len(results) == 6
+        assert {result.content["main_content"] for result in results.values()} == {
+            "Body"
+        }
+
+    def test_outline_lessons_load_content_data_once(
+        self, make_course, django_assert_num_queries
+    ):
+        make_course(modules=1, lessons=3, lesson_kwargs={"content_data": url("v")})
+        lessons = list(Lesson.objects.defer("content_data"))
+
+        with django_assert_num_queries(1):
+            results = facade.get_lessons_content(lessons)
+
+        assert all(result.content["url"].endswith("/v") for result in results.values())
+
+    def test_module_content_endpoint(self, instructor_client, make_course):
+        module = make_course(modules=1, lessons=2).modules.get()
+        first, second = module.lessons.order_by("order")
+        first.content = "Plain text"
+        first.save()
+        second.content_data = {"storage_type": "ftp"}
+        second.save()
+
+        response = instructor_client.get(
+            reverse("instructor-module-content", args=[module.pk])
+        )
+
+        assert response.status_code == 200
+        assert response.data == [
+            {"id": first.pk, "content": {"main_content": "Plain text"}, "error": None},
+            {"id": second.pk, "content": None, "error": "Unknown storage type: ftp"},
+        ]
+
+    def test_module_content_is_fetched_in_bulk(
+        self, instructor_client, make_course, django_assert_max_num_queries
+    ):
+        module = make_course(modules=1, lessons=20).modules.get()
+
+        with django_assert_max_num_queries(8):
+            response = instructor_client.get(
+                reverse("instructor-module-content", args=[module.pk])
+            )
+
+        assert len(response.data) == 20
@@ -0,0 +1,112 @@
+import io
+
+import pytest
+from moto import mock_aws
+
+from apps.content.storage import S3Storage, content_storage_service
+from apps.content.storage.base import StorageRegistry
+from apps.content.storage.s3 import MIN_PART_SIZE
+
+
+class TrickleFile(io.BytesIO):
+    """A file that returns short reads and records the largest one asked for."""
+
+    def __init__(self, data, step=MIN_PART_SIZE // 3):
+        super().__init__(data)
+        self.step = step
+        self.largest_read = 0
+
+    def read(self, size=-1):
+        self.largest_read = max(self.largest_read, size)
+        return super().read(min(size, self.step))
+
+
+@pytest.fixture
+def s3(settings):
+    settings.AWS_STORAGE_BUCKET_NAME = "lessons"
+    settings.AWS_S3_REGION_NAME = "us-east-1"
+    settings.AWS_S3_ENDPOINT_URL = ""
+    with mock_aws():
+        S3Storage.close_clients()
+        storage = S3Storage(chunk_size=MIN_PART_SIZE)
+        storage.client.create_bucket(Bucket="lessons")
+        yield storage
+        S3Storage.close_clients()
+
+
+def stored_bytes(storage, metadata):
+    return storage.client.get_object(Bucket=metadata["bucket"], Key=metadata["key"])[
+        "Body"
+    ].read()
+
+
+class TestS3Storage:
+    def test_small_files_are_a_single_put(self, s3):
+        metadata = s3.store(
+            {"body": b"hello world", "filename": "notes.txt", "title": "Notes"}
+        )
+
+        assert metadata["size"] == 11
+        assert metadata["key"].endswith("/notes.txt")
+        assert stored_bytes(s3, metadata) == b"hello world"
+        assert not s3.client.list_multipart_uploads(Bucket="lessons").get("Uploads")
+
+    def test_large_files_stream_in_parts(self, s3):
+        data = bytes(range(256)) * (MIN_PART_SIZE * 5 // 2 // 256)
+        file = TrickleFile(data)
+
+        metadata = s3.store({"file": file, "content_type": "video/mp4"})
+
+        assert metadata["size"] == len(data)
+        assert metadata["etag"].endswith("-3")
+        assert file.largest_read <= MIN_PART_SIZE
+        assert stored_bytes(s3, metadata) == data
+
+    def test_failed_uploads_are_aborted(self, s3, monkeypatch):
+        def fail(**kwargs):
+            raise ConnectionError("network down")
+
+        monkeypatch.setattr(s3.client, "upload_part", fail)
+
+        with pytest.raises(ConnectionError):
+            s3.store({"body": b"x" * (MIN_PART_SIZE + 1)})
+
+        assert not s3.client.list_multipart_uploads(Bucket="lessons").get("Uploads")
+
+    def test_ranged_reads(self, s3):
+        metadata = s3.store({"body": b"0123456789"})
+
+        assert s3.read_range(metadata, 2, 5) == b"2345"
+        assert s3.read_range(metadata, 7) == b"789"
+
+    def test_retrieve_returns_a_presigned_url(self, s3):
+        metadata = s3.store({"body": b"data", "title": "Slides"})
+
+        content = s3.retrieve(metadata)
+
+        assert metadata["key"] in content["url"]
+        assert "Signature" in content["url"] or "X-Amz-Signature" in content["url"]
+        assert content["title"] == "Slides"
+
+    def test_delete(self, s3):
+        metadata = s3.store({"body": b"data"})
+
+        assert s3.delete(metadata)
+        assert not s3.client.list_objects_v2(Bucket="lessons").get("Contents")
+
+    def test_clients_are_shared_between_handlers(self, s3):
+        assert StorageRegistry.get_handler("s3").client is s3.client
+
+    def test_validate(self, s3, settings):
+        assert s3.validate({"file": io.BytesIO(b"x")})
+        assert s3.validate({"body": b"x"})
+        assert not s3.validate({"url": "https://example.com/a.mp4"})
+
+        settings.AWS_STORAGE_BUCKET_NAME = ""
+        assert not S3Storage().validate({"body": b"x"})
+
+    def test_through_the_storage_service(self, s3):
+        metadata = content_storage_service.store({"body": b"lesson"}, "s3")
+
+        assert content_storage_service.retrieve(metadata)["storage_type"] == "s3"
+        assert content_storage_service.delete(metadata)
@@ -0,0 +1,140 @@
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from apps.content.models import Lesson, Module, SearchDocument, Topic
+from apps.content.services.search import search_query_service, tokenize
+
+
+def _titles(query, **kwargs):
+    return [hit.title for hit in search_query_service.search(query, **kwargs)]
+
+
+class TestTokenize:
+    def test_lowercases_and_drops_stopwords(self):
+        assert tokenize("The Basics of Python, and Django!") == [
+            "basics",
+            "python",
+            "django",
+        ]
+
+
+@pytest.mark.django_db
+class TestSearchIndex:
+    def test_course_and_lesson_are_indexed_on_save(self, make_course):
+        make_course(title="Machine Learning", modules=1, lessons=1)
+
+        assert "Machine Learning" in _titles("machine")
+        assert "Machine Learning lesson 0.0" in _titles("machine", kinds=["lesson"])
+
+    def test_transcripts_and_content_are_searchable(self, make_course):
+        course = make_course(modules=1, lessons=0)
+        module = Module.objects.get(course=course)
+        Lesson.objects.create(
+            module=module,
+            title="Intro video",
+            content_type="video",
+            content_data={"transcript": "today we discuss gradient descent"},
+        )
+        Lesson.objects.create(
+            module=module, title="Reading", content="a note about backpropagation"
+        )
+
+        assert _titles("gradient") == ["Intro video"]
+        assert _titles("backpropagation") == ["Reading"]
+
+    def test_only_indexed_changes_reindex(self, make_course, monkeypatch):
+        course = make_course(modules=1, lessons=1)
+        lesson = Lesson.objects.get(module__course=course)
+        indexed = []
+        monkeypatch.setattr(
+            "apps.content.services.search.search_index_service.index_lesson",
+            indexed.append,
+        )
+
+        lesson.order, lesson.estimated_duration = 5, 10
+        lesson.save()
+        Lesson.objects.defer("content_data").get(pk=lesson.pk).save()
+        assert indexed == []
+
+        lesson.content_data = {"transcript": "now with a transcript"}
+        lesson.save()
+        lesson.content = "and a body"
+        lesson.save()
+        lesson.title = "Renamed"
+        lesson.save()
+        assert indexed == [lesson] * 3
+
+    def test_title_matches_rank_above_body_matches(self, make_course):
+        course = make_course(modules=1, lessons=0)
+        module = Module.objects.get(course=course)
+        Lesson.objects.create(module=module, title="Other", content="recursion")
+        Lesson.objects.create(module=module, title="Recursion explained")
+
+        assert _titles("recursion") == ["Recursion explained", "Other"]
+
+    def test_unpublished_content_is_hidden_until_published(self, make_course):
+        course = make_course(title="Secret Course", is_published=False, lessons=1)
+
+        assert _titles("secret") == []
+
+        course.publish()
+        assert "Secret Course" in _titles("secret")
+
+        Module.objects.get(course=course, order=0).unpublish()
+        assert _titles("secret", kinds=["lesson"]) == ["Secret Course lesson 1.0"]
+
+    def test_deleted_lesson_leaves_index(self, make_course):
+        course = make_course(modules=1, lessons=1)
+        lesson = Lesson.objects.get(module__course=course)
+        lesson.title = "Unique Word Zebra"
+        lesson.save()
+        assert _titles("zebra") == ["Unique Word Zebra"]
+
+        lesson.delete()
+
+        assert _titles("zebra") == []
+
+    def test_topic_names_and_links(self, make_course):
+        topic = Topic.objects.create(name="Concurrency", slug="concurrency")
+        course = make_course(modules=1, lessons=1)
+        lesson = Lesson.objects.get(module__course=course)
+
+        assert _titles("concurrency") == ["Concurrency"]
+
+        lesson.topics.add(topic)
+        assert set(_titles("concurrency")) == {"Concurrency", lesson.title}
+
+        topic.lessons.clear()
+        assert _titles("concurrency") == ["Concurrency"]
+
+    def test_rebuild_command(self, make_course):
+        make_course(title="Rebuilt", modules=1, lessons=2)
+        SearchDocument.objects.all().delete()
+
+        call_command("rebuild_search_index", stdout=open("/dev/null", "w"))
+
+        assert "Rebuilt" in _titles("rebuilt")
+        assert SearchDocument.objects.filter(kind="lesson").count() == 2
+
+
+@pytest.mark.django_db
+class TestContentSearchView:
+    def test_returns_ranked_results(self, api_client, make_course):
+        course = make_course(title="Data Structures", modules=1, lessons=1)
+
+        response = api_client.get(
+            reverse("content-search"), {"q": "data structures", "type": "course"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"][0]["id"] == str(course.id)
+        assert response.data["results"][0]["type"] == "course"
+        assert response.data["results"][0]["score"] > 0
+
+    def test_requires_query(self, api_client):
+        response = api_client.get(reverse("content-search"))
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "q" in response.data
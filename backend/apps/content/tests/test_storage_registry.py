@@ -0,0 +1,112 @@
+import threading
+
+import pytest
+
+from apps.content.storage import (
+    ContentStorage,
+    ExternalUrlStorage,
+    LocalFileStorage,
+    StorageRegistry,
+    content_storage_service,
+)
+
+URL = {"url": "https://example.com/slides.pdf", "title": "Slides"}
+
+
+@pytest.fixture(autouse=True)
+def fresh_handlers():
+    StorageRegistry.shutdown()
+    yield
+    StorageRegistry.shutdown()
+
+
+class TestStorageRegistry:
+    def test_handlers_are_built_once(self):
+        first = StorageRegistry.get_handler("external_url")
+
+        assert isinstance(first, ExternalUrlStorage)
+        assert StorageRegistry.get_handler("external_url") is first
+        assert StorageRegistry.get_all_handlers()["external_url"] is first
+        assert StorageRegistry.get_handler("unknown") is None
+
+    def test_concurrent_lookups_share_one_instance(self):
+        seen = []
+        barrier = threading.Barrier(8)
+
+        def lookup():
+            barrier.wait()
+            seen.append(StorageRegistry.get_handler("local"))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(handler) for handler in seen}) == 1
+
+    def test_options_come_from_settings(self, settings, tmp_path):
+        settings.CONTENT_STORAGES = {"local": {"root": str(tmp_path / "files")}}
+
+        handler = StorageRegistry.get_handler("local")
+
+        assert handler.root == tmp_path / "files"
+
+    def test_setting_changes_rebuild_handlers(self, settings, tmp_path):
+        before = StorageRegistry.get_handler("local")
+
+        settings.CONTENT_STORAGE_ROOT = str(tmp_path)
+
+        after = StorageRegistry.get_handler("local")
+        assert after is not before
+        assert after.root == tmp_path
+
+    def test_warm_up_and_shutdown_hooks(self, settings, tmp_path):
+        calls = []
+
+        class Recording(ContentStorage):
+            storage_type = "recording"
+
+            def warm_up(self):
+                calls.append("warm_up")
+
+            def shutdown(self):
+                calls.append("shutdown")
+
+            store = retrieve = delete = validate = lambda self, data: data
+
+        settings.CONTENT_STORAGES = {"recording": {}, "local": {"root": tmp_path}}
+        try:
+            StorageRegistry.warm_up()
+            assert (tmp_path / "tmp").is_dir()
+            StorageRegistry.shutdown()
+        finally:
+            StorageRegistry._handlers.pop("recording")
+
+        assert calls == ["warm_up", "shutdown"]
+
+
+class TestStorageMetrics:
+    def test_operations_are_counted_per_handler(self):
+        content_storage_service.store(URL)
+        metadata = content_storage_service.store(URL)
+        content_storage_service.retrieve(metadata)
+
+        metrics = content_storage_service.metrics()["external_url"]
+        assert metrics["store"]["calls"] == 2
+        assert metrics["retrieve"]["calls"] == 1
+        assert metrics["store"]["errors"] == 0
+        assert metrics["store"]["seconds"] >= 0
+
+    def test_failures_are_counted(self, settings, tmp_path):
+        settings.CONTENT_STORAGE_ROOT = str(tmp_path)
+
+        with pytest.raises(KeyError):
+            content_storage_service.retrieve({"storage_type": "local"})
+
+        assert content_storage_service.metrics()["local"]["retrieve"] == {
+            "calls": 1,
+            "errors": 1,
+            "seconds": pytest.approx(0, abs=1),
+        }
+        assert isinstance(StorageRegistry.get_handler("local"), LocalFileStorage)
@@ -0,0 +1,115 @@
+import json
+
+import pytest
+from django.urls import reverse
+
+from apps.content.apis import CourseInstructorViewSet, StreamingListMixin
+from apps.content.models import Module
+
+
+def read_pages(client, url):
+    """Follow `next` links and concatenate every page's results."""
+    results = []
+    while url:
+        body = client.get(url).json()
+        results.extend(body["results"])
+        url = body["next"]
+    return results
+
+
+def read_stream(client, url):
+    separator = "&" if "?" in url else "?"
+    response = client.get(f"{url}{separator}stream=true")
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"] == "application/json"
+    return json.loads(b"".join(response.streaming_content))
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # Small enough that parents and their children span several chunks.
+    monkeypatch.setattr(StreamingListMixin, "stream_chunk_size", 2)
+
+
+@pytest.mark.django_db
+class TestStreamingInstructorLists:
+    @pytest.mark.parametrize(
+        "name", ["instructor-course-list", "instructor-module-list"]
+    )
+    def test_stream_matches_paginated_results(
+        self, instructor_client, make_course, small_chunks, name
+    ):
+        for index in range(5):
+            make_course(title=f"Course {index}", modules=2, lessons=2)
+        url = reverse(name)
+
+        body = read_stream(instructor_client, url)
+
+        assert body["next"] is None
+        assert body["results"] == read_pages(instructor_client, f"{url}?page_size=3")
+
+    def test_lessons_stream_with_field_selection(
+        self, instructor_client, make_course, small_chunks
+    ):
+        make_course(modules=2, lessons=3)
+        url = reverse("instructor-lesson-list")
+
+        body = read_stream(instructor_client, f"{url}?fields=id,title")
+
+        assert len(body["results"]) == 6
+        assert all(set(item) == {"id", "title"} for item in body["results"])
+
+    def test_nested_children_follow_their_parent(
+        self, instructor_client, make_course, small_chunks
+    ):
+        make_course(modules=3, lessons=3)
+        make_course(modules=2, lessons=1)
+
+        results = read_stream(instructor_client, reverse("instructor-module-list"))[
+            "results"
+        ]
+
+        expected = {
+            str(module.id): sorted(str(lesson.id) for lesson in module.lessons.all())
+            for module in Module.objects.all()
+        }
+        streamed = {
+            item["id"]: sorted(lesson["id"] for lesson in item["lessons"])
+            for item in results
+        }
+        assert streamed == expected
+
+    def test_empty_stream_is_valid_json(self, instructor_client):
+        body = read_stream(instructor_client, reverse("instructor-course-list"))
+
+        assert body == {"next": None, "results": []}
+
+    def test_falls_back_to_drf_serializer(
+        self, instructor_client, make_course, small_chunks, monkeypatch
+    ):
+        make_course(modules=1, lessons=1)
+        make_course(modules=1, lessons=1)
+        url = reverse("instructor-course-list")
+        expected = read_stream(instructor_client, url)
+
+        monkeypatch.setattr(
+            CourseInstructorViewSet, "get_compiled_serializer", lambda self: None
+        )
+
+        assert read_stream(instructor_client, url) == expected
+
+    def test_without_stream_param_is_paginated(self, instructor_client, make_course):
+        make_course()
+
+        response = instructor_client.get(
+            reverse("instructor-course-list"), {"stream": "no"}
+        )
+
+        assert not response.streaming
+        assert len(response.data["results"]) == 1
+
+    def test_requires_authentication(self, api_client):
+        response = api_client.get(reverse("instructor-course-list"), {"stream": "1"})
+
+        assert response.status_code in (401, 403)
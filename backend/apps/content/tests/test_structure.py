@@ -0,0 +1,88 @@
+import time
+
+import pytest
+
+from apps.content.models import Lesson, Module
+from apps.content.services.structure import CourseStructureCache
+
+
+@pytest.fixture
+def structures():
+    return CourseStructureCache(max_size=2)
+
+
+def lesson_ids(module, **filters):
+    return tuple(
+        module.lessons.filter(**filters).order_by("order").values_list("id", flat=True)
+    )
+
+
+@pytest.mark.django_db
+class TestCourseStructureCache:
+    def test_build_matches_the_counters(self, structures, make_course):
+        course = make_course(modules=3, lessons=2)
+        first, second, hidden = course.modules.order_by("order")
+        Lesson.objects.filter(module=first).first().unpublish()
+        hidden.unpublish()
+        Module.objects.create(course=course, title="Empty", order=3)
+        course.refresh_from_db()
+
+        structure = structures.get(course.id)
+
+        assert structure.published_module_ids[:2] == (first.id, second.id)
+        assert hidden.id not in structure.published_module_ids
+        assert structure.published_lesson_ids(first.id) == lesson_ids(
+            first, is_published=True
+        )
+        assert structure.published_lesson_ids(hidden.id) == lesson_ids(hidden)
+        assert structure.published_lesson_count == course.published_lesson_count == 3
+        draft = first.lessons.get(is_published=False)
+        assert structure.has_lesson(str(draft.id))
+        assert structure.module_for_lesson(draft.id) == first.id
+        assert not structure.has_lesson("not-a-uuid")
+
+    def test_hits_run_no_queries(
+        self, structures, make_course, django_assert_num_queries
+    ):
+        course = make_course()
+        with django_assert_num_queries(1):
+            structures.get(course.id)
+
+        with django_assert_num_queries(0):
+            assert structures.get(str(course.id)) is structures.get(course.id)
+
+    def test_entries_expire(self, structures, make_course, monkeypatch):
+        course = make_course(modules=1, lessons=1)
+        before = structures.get(course.id)
+        now = time.monotonic()
+
+        monkeypatch.setattr(time, "monotonic", lambda: now + structures.ttl - 1)
+        assert structures.get(course.id) is before
+        monkeypatch.setattr(time, "monotonic", lambda: now + structures.ttl + 1)
+        assert structures.get(course.id) is not before
+
+    def test_content_writes_invalidate(self, structures, make_course, committed):
+        course = make_course(modules=1, lessons=2)
+        module = course.modules.get()
+        before = structures.get(course.id)
+
+        with committed():
+            Lesson.objects.create(module=module, title="New", order=2)
+
+        after = structures.get(course.id)
+        assert after is not before
+        assert len(after.published_lesson_ids(module.id)) == 3
+
+    def test_least_recently_used_entries_are_evicted(
+        self, structures, make_course, django_assert_num_queries
+    ):
+        first, second, third = (make_course(title=t) for t in "abc")
+        structures.get(first.id)
+        structures.get(second.id)
+        structures.get(first.id)
+        structures.get(third.id)
+
+        with django_assert_num_queries(0):
+            structures.get(first.id)
+        with django_assert_num_queries(1):
+            structures.get(second.id)
@@ -0,0 +1,58 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.content.models import Lesson
+
+
+@pytest.mark.django_db
+class TestCoursePublicList:
+    def test_list_renders_catalog_fields(self, api_client, make_course):
+        make_course(title="Python", modules=2, lessons=3)
+
+        response = api_client.get(reverse("course-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        course = response.data["results"][0]
+        assert course["title"] == "Python"
+        assert course["category"] == "Programming"
+        assert course["instructor_name"] == "Jane Instructor"
+        assert course["total_lessons"] == 6
+        assert "modules" not in course
+
+    def test_list_counts_only_published_lessons(self, api_client, make_course):
+        course = make_course(modules=1, lessons=3)
+        Lesson.objects.filter(module__course=course).first().unpublish()
+
+        response = api_client.get(reverse("course-list"))
+
+        assert response.data["results"][0]["total_lessons"] == 2
+
+    def test_list_hides_unpublished_courses(self, api_client, make_course):
+        make_course(title="Draft", is_published=False)
+
+        response = api_client.get(reverse("course-list"))
+
+        assert response.data["results"] == []
+
+    def test_list_query_count_is_flat(
+        self, api_client, make_course, django_assert_num_queries
+    ):
+        for i in range(5):
+            make_course(title=f"Course {i}", modules=3, lessons=4)
+
+        # Validator aggregate + catalog page + facet summary, independent of
+        # tree size.
+        with django_assert_num_queries(3):
+            response = api_client.get(reverse("course-list"))
+
+        assert len(response.data["results"]) == 5
+
+    def test_retrieve_still_returns_full_tree(self, api_client, make_course):
+        course = make_course(modules=2, lessons=2)
+
+        response = api_client.get(reverse("course-detail", args=[course.id]))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["modules"]) == 2
+        assert len(response.data["modules"][0]["lessons"]) == 2
@@ -1,4 +1,4 @@
-from django.urls import path, include
+from django.urls import path, include, re_path
 from rest_framework.routers import DefaultRouter
 
 from apps.content.apis import (
@@ -8,6 +8,8 @@ from apps.content.apis import (
     LessonInstructorViewSet,
     CategoryViewSet,
     TopicViewSet,
+    ContentSearchView,
+    ContentFileView,
 )
 
 router = DefaultRouter()
@@ -29,5 +31,11 @@ router.register(
 )
 
 urlpatterns = [
+    path("search/", ContentSearchView.as_view(), name="content-search"),
+    re_path(
+        r"^files/(?P<digest>[0-9a-f]{64})/$",
+        ContentFileView.as_view(),
+        name="content-file",
+    ),
     path("", include(router.urls)),
 ]
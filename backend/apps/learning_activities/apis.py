@@ -3,6 +3,10 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
+from apps.learning_activities.pagination import (
+    EnrollmentPagination,
+    RecentlyAccessedEnrollmentPagination,
+)
 from apps.learning_activities.services import (
     enrollment_facade,
     learning_progress_facade,
@@ -25,7 +29,12 @@ class EnrollView(APIView):
         result = enrollment_facade.enroll(request.user, course_id)
 
         if not result.success:
-            return Response({"error": result.error}, status=status.HTTP_404_NOT_FOUND)
+            error_status = (
+                status.HTTP_404_NOT_FOUND
+                if result.error == "Course not found"
+                else status.HTTP_400_BAD_REQUEST
+            )
+            return Response({"error": result.error}, status=error_status)
 
         serializer = EnrollmentSerializer(result.enrollment)
         return Response(serializer.data, status=status.HTTP_200_OK)
@@ -81,8 +90,15 @@ class MyEnrollmentsView(APIView):
         enrollments = enrollment_facade.get_user_enrollments(
             request.user, status_filter=status_filter
         )
-        serializer = EnrollmentWithCourseRefSerializer(enrollments, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+
+        # Ongoing courses are listed by recent activity, the rest by enrollment date
+        if status_filter == "ongoing":
+            paginator = RecentlyAccessedEnrollmentPagination()
+        else:
+            paginator = EnrollmentPagination()
+        page = paginator.paginate_queryset(enrollments, request, view=self)
+        serializer = EnrollmentWithCourseRefSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 # ==================== Learning Progress Views ====================
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from apps.learning_activities.services.enrollment_counts import (
+    enrollment_count_service,
+)
+
+
+class Command(BaseCommand):
+    help = "Apply pending enrollment deltas to Course.students_count"
+
+    def handle(self, *args, **options):
+        consumed = enrollment_count_service.flush()
+        self.stdout.write(self.style.SUCCESS(f"Done! Applied {consumed} deltas."))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.learning_activities.services.enrollment_counts import (
+    enrollment_count_service,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuild Course.students_count from active enrollments"
+
+    def handle(self, *args, **options):
+        self.stdout.write("Reconciling course student counts...")
+        corrected = enrollment_count_service.reconcile()
+        self.stdout.write(self.style.SUCCESS(f"Done! Corrected {corrected} courses."))
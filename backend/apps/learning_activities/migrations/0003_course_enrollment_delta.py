@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-17 04:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("content", "0005_lesson_counters"),
+        ("learning_activities", "0002_alter_enrollment_progress_percent_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CourseEnrollmentDelta",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("delta", models.SmallIntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "course",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="content.course",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Course Enrollment Delta",
+                "verbose_name_plural": "Course Enrollment Deltas",
+                "ordering": ["id"],
+            },
+        ),
+    ]
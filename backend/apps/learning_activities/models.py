@@ -105,3 +105,29 @@ class LessonProgress(TimestampMixin):
     def __str__(self):
         status = "completed" if self.is_completed else "in progress"
         return f"{self.enrollment.student.email} - {self.lesson.title} ({status})"
+
+
+class CourseEnrollmentDelta(models.Model):
+    """
+    Pending +1/-1 change to a course's students_count.
+
+    Enrollment writes only append here; EnrollmentCountService folds the
+    rows into Course.students_count in batches, so concurrent enrollments
+    never contend on the course row.
+    """
+
+    course = models.ForeignKey(
+        "content.Course",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    delta = models.SmallIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+        verbose_name = "Course Enrollment Delta"
+        verbose_name_plural = "Course Enrollment Deltas"
+
+    def __str__(self):
+        return f"{self.course_id}: {self.delta:+d}"
@@ -0,0 +1,9 @@
+from apps.common.pagination import KeysetPagination
+
+
+class EnrollmentPagination(KeysetPagination):
+    ordering = ("-enrolled_at",)
+
+
+class RecentlyAccessedEnrollmentPagination(KeysetPagination):
+    ordering = ("-last_accessed_at",)
@@ -1,7 +1,11 @@
 from dataclasses import dataclass
+from django.db import transaction
 from django.utils import timezone
 
 from apps.learning_activities.models import Enrollment
+from apps.learning_activities.services.enrollment_counts import (
+    enrollment_count_service,
+)
 
 
 @dataclass
@@ -14,8 +18,9 @@ class EnrollmentResult:
 class EnrollmentFacade:
     """Facade for all enrollment operations (queries and mutations)."""
 
-    def __init__(self, content_facade=None):
+    def __init__(self, content_facade=None, count_service=None):
         self._content_facade = content_facade
+        self._counts = count_service or enrollment_count_service
 
     @property
     def content_facade(self):
@@ -51,14 +56,31 @@ class EnrollmentFacade:
 
         return queryset
 
+    def completed_course_ids(self, user):
+        """Values queryset of the user's completed course IDs (a subquery)."""
+        return Enrollment.objects.filter(
+            student_id=user.id,
+            status=Enrollment.Status.COMPLETED,
+            course__isnull=False,
+        ).values("course_id")
+
     # ==================== Mutations ====================
 
     def enroll(self, user, course_id) -> EnrollmentResult:
         """Enroll user in a course with validation."""
         if not self.content_facade.published_course_exists(course_id):
             return EnrollmentResult(success=False, error="Course not found")
-
-        enrollment = self._create_or_reactivate_enrollment(user, course_id)
+        if self.content_facade.has_unmet_prerequisites(
+            course_id, self.completed_course_ids(user)
+        ):
+            return EnrollmentResult(success=False, error="Prerequisites not met")
+
+        with transaction.atomic():
+            enrollment, activated = self._create_or_reactivate_enrollment(
+                user, course_id
+            )
+            if activated:
+                self._counts.record(course_id, +1)
         return EnrollmentResult(success=True, enrollment=enrollment)
 
     def unenroll(self, user, course_id) -> EnrollmentResult:
@@ -66,9 +88,12 @@ class EnrollmentFacade:
         if not self.content_facade.course_exists(course_id):
             return EnrollmentResult(success=False, error="Course not found")
 
-        updated = Enrollment.objects.filter(
-            student_id=user.id, course_id=course_id, is_active=True
-        ).update(is_active=False, updated_at=timezone.now())
+        with transaction.atomic():
+            updated = Enrollment.objects.filter(
+                student_id=user.id, course_id=course_id, is_active=True
+            ).update(is_active=False, updated_at=timezone.now())
+            if updated:
+                self._counts.record(course_id, -1)
 
         if not updated:
             return EnrollmentResult(success=False, error="Not enrolled in this course")
@@ -81,7 +106,8 @@ class EnrollmentFacade:
 
     # ==================== Internal ====================
 
-    def _create_or_reactivate_enrollment(self, user, course_id) -> Enrollment:
+    def _create_or_reactivate_enrollment(self, user, course_id) -> tuple:
+        """Return (enrollment, activated) where `activated` means newly active."""
         enrollment, created = Enrollment.objects.get_or_create(
             student_id=user.id,
             course_id=course_id,
@@ -92,5 +118,6 @@ class EnrollmentFacade:
             enrollment.is_active = True
             enrollment.status = Enrollment.Status.STARTED
             enrollment.save(update_fields=["is_active", "status", "updated_at"])
+            return enrollment, True
 
-        return enrollment
+        return enrollment, created
@@ -0,0 +1,89 @@
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+
+from apps.learning_activities.models import CourseEnrollmentDelta, Enrollment
+
+
+class EnrollmentCountService:
+    """
+    Keeps Course.students_count in step with active enrollments.
+
+    Enrollment changes append a delta row in the same transaction; `flush`
+    later coalesces pending rows into one F() increment per course. At most
+    one flush per FLUSH_INTERVAL is triggered from requests, and the
+    `flush_enrollment_counts` command can drain the queue on a schedule.
+    """
+
+    flush_lock_key = "learning:enrollment_counts:flush"
+    batch_size = 5000
+
+    def __init__(self, content_facade=None):
+        self._content_facade = content_facade
+
+    @property
+    def content_facade(self):
+        if self._content_facade is None:
+            from apps.content.services import content_facade
+
+            self._content_facade = content_facade
+        return self._content_facade
+
+    # ==================== Recording ====================
+
+    def record(self, course_id, delta: int) -> None:
+        CourseEnrollmentDelta.objects.create(course_id=course_id, delta=delta)
+        transaction.on_commit(self.schedule_flush)
+
+    def schedule_flush(self) -> None:
+        # cache.add is atomic: only the first caller per interval flushes.
+        if cache.add(
+            self.flush_lock_key, True, settings.ENROLLMENT_COUNT_FLUSH_INTERVAL
+        ):
+            self.flush()
+
+    # ==================== Applying ====================
+
+    def flush(self) -> int:
+        """Apply all pending deltas; returns the number of delta rows consumed."""
+        consumed = 0
+        while applied := self._flush_batch():
+            consumed += applied
+        return consumed
+
+    @transaction.atomic
+    def _flush_batch(self) -> int:
+        pending = list(
+            CourseEnrollmentDelta.objects.select_for_update(skip_locked=True)
+            .order_by("id")
+            .values_list("id", "course_id", "delta")[: self.batch_size]
+        )
+        if not pending:
+            return 0
+
+        deltas = Counter()
+        for _, course_id, delta in pending:
+            deltas[course_id] += delta
+        CourseEnrollmentDelta.objects.filter(
+            id__in=[row_id for row_id, _, _ in pending]
+        ).delete()
+        self.content_facade.apply_students_count_deltas(deltas)
+        return len(pending)
+
+    @transaction.atomic
+    def reconcile(self) -> int:
+        """Rebuild every count from Enrollment; returns courses corrected."""
+        CourseEnrollmentDelta.objects.all().delete()
+        counts = dict(
+            Enrollment.objects.filter(is_active=True, course__isnull=False)
+            .order_by()
+            .values_list("course_id")
+            .annotate(total=Count("id"))
+        )
+        return self.content_facade.set_students_counts(counts)
+
+
+enrollment_count_service = EnrollmentCountService()
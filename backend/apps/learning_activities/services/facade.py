@@ -61,15 +61,14 @@ class LearningProgressFacade:
 
     def complete_lesson(self, enrollment: Enrollment, lesson_id) -> ProgressResult:
         """Complete a lesson for an enrollment."""
-        if not self.content_facade.lesson_exists_in_course(
-            lesson_id, enrollment.course_id
-        ):
+        structure = self.content_facade.get_course_structure(enrollment.course_id)
+        if not structure.has_lesson(lesson_id):
             return ProgressResult(
                 success=False, error="Lesson not found in this course"
             )
 
         self._lesson_progress.complete_lesson(enrollment, lesson_id)
-        self._recalculate_progress(enrollment, lesson_id)
+        self._recalculate_progress(enrollment, lesson_id, structure)
 
         progress = self.get_course_progress(enrollment)
         return ProgressResult(success=True, progress=progress)
@@ -82,37 +81,40 @@ class LearningProgressFacade:
                 success=False, error="Lesson was not marked as completed"
             )
 
-        self._recalculate_progress(enrollment, lesson_id)
+        structure = self.content_facade.get_course_structure(enrollment.course_id)
+        self._recalculate_progress(enrollment, lesson_id, structure)
 
         progress = self.get_course_progress(enrollment)
         return ProgressResult(success=True, progress=progress)
 
     # ==================== Internal ====================
 
-    def _recalculate_progress(self, enrollment: Enrollment, lesson_id) -> None:
-        module_id = self.content_facade.get_module_id_for_lesson(lesson_id)
+    def _recalculate_progress(
+        self, enrollment: Enrollment, lesson_id, structure
+    ) -> None:
+        module_id = structure.module_for_lesson(lesson_id)
         if module_id:
-            self._recalculate_module_progress(enrollment, module_id)
+            self._recalculate_module_progress(enrollment, module_id, structure)
 
-        self._recalculate_enrollment_progress(enrollment)
+        self._recalculate_enrollment_progress(enrollment, structure)
 
-    def _recalculate_module_progress(self, enrollment: Enrollment, module_id) -> None:
-        total_lessons = self.content_facade.count_published_lessons_in_module(module_id)
-        lesson_ids = self.content_facade.get_published_lesson_ids_in_module(module_id)
+    def _recalculate_module_progress(
+        self, enrollment: Enrollment, module_id, structure
+    ) -> None:
+        lesson_ids = structure.published_lesson_ids(module_id)
         completed_count = self._lesson_progress.count_completed_lessons_in_module(
             enrollment, lesson_ids
         )
 
         self._module_progress.update_module_progress(
-            enrollment, module_id, total_lessons, completed_count
+            enrollment, module_id, len(lesson_ids), completed_count
         )
 
-    def _recalculate_enrollment_progress(self, enrollment: Enrollment) -> None:
-        total_lessons = self.content_facade.count_published_lessons_in_course(
-            enrollment.course_id
-        )
+    def _recalculate_enrollment_progress(
+        self, enrollment: Enrollment, structure
+    ) -> None:
         completed_count = self._lesson_progress.count_completed_lessons(enrollment)
 
         self._enrollment_progress.update_enrollment_progress(
-            enrollment, total_lessons, completed_count
+            enrollment, structure.published_lesson_count, completed_count
         )
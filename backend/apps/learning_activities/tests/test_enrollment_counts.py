@@ -0,0 +1,97 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.content.models import Course
+from apps.learning_activities.models import CourseEnrollmentDelta, Enrollment
+from apps.learning_activities.services import enrollment_facade
+from apps.learning_activities.services.enrollment_counts import (
+    enrollment_count_service,
+)
+
+User = get_user_model()
+
+
+@pytest.fixture
+def course(db, create_user):
+    return Course.objects.create(
+        title="Course", instructor=create_user, is_published=True
+    )
+
+
+@pytest.fixture
+def students(db):
+    return [
+        User.objects.create_user(
+            email=f"student{i}@example.com", username=f"student{i}", password="x"
+        )
+        for i in range(3)
+    ]
+
+
+def students_count(course):
+    course.refresh_from_db()
+    return course.students_count
+
+
+@pytest.mark.django_db
+class TestEnrollmentCounts:
+    def test_enroll_and_unenroll_queue_deltas(self, course, students):
+        for student in students:
+            enrollment_facade.enroll(student, course.id)
+        enrollment_facade.enroll(students[0], course.id)  # already active
+        enrollment_facade.unenroll(students[1], course.id)
+
+        deltas = list(CourseEnrollmentDelta.objects.values_list("delta", flat=True))
+        assert deltas == [1, 1, 1, -1]
+        assert students_count(course) == 0
+
+    def test_flush_coalesces_into_one_update_per_course(
+        self, course, students, create_user
+    ):
+        other = Course.objects.create(title="Other", instructor=create_user)
+        for student in students:
+            enrollment_facade.enroll(student, course.id)
+        CourseEnrollmentDelta.objects.create(course=other, delta=1)
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert enrollment_count_service._flush_batch() == 4
+
+        # One UPDATE per course, however many deltas it had.
+        updates = [q for q in ctx.captured_queries if "UPDATE" in q["sql"]]
+        assert len(updates) == 2
+
+        assert students_count(course) == 3
+        assert students_count(other) == 1
+        assert not CourseEnrollmentDelta.objects.exists()
+
+    def test_reactivation_counts_again(self, course, students):
+        enrollment_facade.enroll(students[0], course.id)
+        enrollment_facade.unenroll(students[0], course.id)
+        enrollment_facade.enroll(students[0], course.id)
+
+        enrollment_count_service.flush()
+
+        assert students_count(course) == 1
+
+    def test_request_flush_runs_on_commit(
+        self, course, students, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            enrollment_facade.enroll(students[0], course.id)
+
+        assert students_count(course) == 1
+
+    def test_reconcile_rebuilds_from_enrollments(self, course, students):
+        Course.objects.filter(pk=course.pk).update(students_count=42)
+        Enrollment.objects.create(student=students[0], course=course)
+        Enrollment.objects.create(student=students[1], course=course)
+        Enrollment.objects.create(student=students[2], course=course, is_active=False)
+        CourseEnrollmentDelta.objects.create(course=course, delta=1)
+
+        call_command("reconcile_students_count", stdout=None)
+
+        assert students_count(course) == 2
+        assert not CourseEnrollmentDelta.objects.exists()
@@ -0,0 +1,60 @@
+import pytest
+from django.urls import reverse
+
+from apps.content.models import Course
+from apps.learning_activities.models import Enrollment
+from apps.learning_activities.services import enrollment_facade
+
+
+@pytest.fixture
+def chain(db, create_user):
+    basics, intermediate, advanced = (
+        Course.objects.create(title=title, instructor=create_user, is_published=True)
+        for title in ("Basics", "Intermediate", "Advanced")
+    )
+    intermediate.prerequisites.add(basics)
+    advanced.prerequisites.add(intermediate)
+    return basics, intermediate, advanced
+
+
+def complete(user, course):
+    Enrollment.objects.create(
+        student=user, course=course, status=Enrollment.Status.COMPLETED
+    )
+
+
+@pytest.mark.django_db
+class TestEnrollmentPrerequisites:
+    def test_every_ancestor_must_be_completed(self, chain, create_user):
+        basics, intermediate, advanced = chain
+        complete(create_user, intermediate)
+
+        result = enrollment_facade.enroll(create_user, advanced.id)
+        assert not result.success
+        assert result.error == "Prerequisites not met"
+
+        complete(create_user, basics)
+        assert enrollment_facade.enroll(create_user, advanced.id).success
+
+    def test_unpublished_prerequisites_are_not_enforced(self, chain, create_user):
+        basics, _, _ = chain
+        basics.unpublish()
+        complete(create_user, chain[1])
+
+        assert enrollment_facade.enroll(create_user, chain[2].id).success
+
+    def test_eligibility_is_one_query(
+        self, chain, create_user, django_assert_num_queries
+    ):
+        with django_assert_num_queries(1):
+            enrollment_facade.content_facade.has_unmet_prerequisites(
+                chain[2].id, enrollment_facade.completed_course_ids(create_user)
+            )
+
+    def test_enroll_endpoint_returns_400(self, chain, authenticated_client):
+        response = authenticated_client.post(
+            reverse("course-enroll", args=[chain[2].id])
+        )
+
+        assert response.status_code == 400
+        assert response.data == {"error": "Prerequisites not met"}
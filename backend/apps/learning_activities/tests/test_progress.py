@@ -0,0 +1,91 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from apps.content.models import Course, Lesson, Module
+from apps.learning_activities.models import Enrollment
+
+CONTENT_TABLES = [model._meta.db_table for model in (Course, Module, Lesson)]
+
+
+@pytest.fixture
+def course(db, create_user):
+    course = Course.objects.create(
+        title="Python", instructor=create_user, is_published=True
+    )
+    for m in range(2):
+        module = Module.objects.create(course=course, title=f"Module {m}", order=m)
+        for i in range(2):
+            Lesson.objects.create(module=module, title=f"Lesson {m}.{i}", order=i)
+    return course
+
+
+@pytest.fixture
+def enrollment(course, create_user):
+    return Enrollment.objects.create(student=create_user, course=course)
+
+
+def complete_url(course, lesson):
+    return reverse("lesson-complete", args=[course.id, lesson.id])
+
+
+def lessons(course):
+    return list(Lesson.objects.filter(module__course=course).order_by("title"))
+
+
+@pytest.mark.django_db
+class TestLessonCompletion:
+    def test_progress_is_tracked(self, authenticated_client, course, enrollment):
+        first, second, *_ = lessons(course)
+
+        authenticated_client.post(complete_url(course, first))
+        response = authenticated_client.post(complete_url(course, second))
+
+        assert response.status_code == 200
+        assert response.data["progress"] == 50.0
+        assert response.data["completedModules"] == [str(first.module_id)]
+
+        response = authenticated_client.delete(complete_url(course, second))
+        assert response.data["progress"] == 25.0
+        assert response.data["completedModules"] == []
+
+    def test_steady_state_reads_no_content_tables(
+        self, authenticated_client, course, enrollment
+    ):
+        first, second, *_ = lessons(course)
+        authenticated_client.post(complete_url(course, first))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.post(complete_url(course, second))
+
+        assert response.status_code == 200
+        assert not [
+            query["sql"]
+            for query in ctx.captured_queries
+            if any(f'"{table}"' in query["sql"] for table in CONTENT_TABLES)
+        ]
+
+    def test_publishing_a_lesson_updates_the_totals(
+        self, authenticated_client, course, enrollment, committed
+    ):
+        first, *_ = lessons(course)
+        authenticated_client.post(complete_url(course, first))
+
+        with committed():
+            Lesson.objects.create(module=first.module, title="Lesson 0.2", order=2)
+        response = authenticated_client.post(complete_url(course, first))
+
+        assert response.data["progress"] == 20.0
+
+    def test_lessons_of_other_courses_are_rejected(
+        self, authenticated_client, course, enrollment, create_user
+    ):
+        other = Course.objects.create(title="Other", instructor=create_user)
+        module = Module.objects.create(course=other, title="Module", order=0)
+        stranger = Lesson.objects.create(module=module, title="Stranger", order=0)
+
+        response = authenticated_client.post(complete_url(course, stranger))
+
+        assert response.status_code == 400
+        assert response.data["error"] == "Lesson not found in this course"
@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.content.models import Course
+from apps.learning_activities.models import Enrollment
+
+
+@pytest.fixture
+def courses(db, create_user):
+    return [
+        Course.objects.create(title=f"Course {i}", instructor=create_user)
+        for i in range(5)
+    ]
+
+
+@pytest.mark.django_db
+class TestMyEnrollmentsView:
+    def test_paginates_by_enrollment_date(self, authenticated_client, courses):
+        for course in courses:
+            Enrollment.objects.create(student=authenticated_client.user, course=course)
+
+        url = reverse("my-enrollments") + "?page_size=2"
+        titles = []
+        while url:
+            response = authenticated_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            titles.extend(item["course_title"] for item in response.data["results"])
+            url = response.data["next"]
+
+        expected = list(
+            Enrollment.objects.order_by("-enrolled_at", "-id").values_list(
+                "course__title", flat=True
+            )
+        )
+        assert titles == expected
+
+    def test_ongoing_orders_by_last_access_with_nulls_last(
+        self, authenticated_client, courses
+    ):
+        now = timezone.now()
+        for i, course in enumerate(courses):
+            Enrollment.objects.create(
+                student=authenticated_client.user,
+                course=course,
+                last_accessed_at=now - timedelta(hours=i) if i < 3 else None,
+            )
+
+        url = reverse("my-enrollments") + "?status=ongoing&page_size=2"
+        titles = []
+        while url:
+            response = authenticated_client.get(url)
+            titles.extend(item["course_title"] for item in response.data["results"])
+            url = response.data["next"]
+
+        assert titles[:3] == ["Course 0", "Course 1", "Course 2"]
+        assert sorted(titles[3:]) == ["Course 3", "Course 4"]
@@ -102,6 +102,74 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Use a shared backend (e.g. Redis/Memcached) in production so content
+# version bumps are seen by every worker process.
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("CACHE_LOCATION", "sa-its"),
+    }
+}
+
+# Seconds a serialized public course detail stays cached (per content version)
+COURSE_DETAIL_CACHE_TIMEOUT = int(os.environ.get("COURSE_DETAIL_CACHE_TIMEOUT", 3600))
+
+# Course structures (module -> published lesson IDs) kept in memory per process
+COURSE_STRUCTURE_CACHE_SIZE = int(os.environ.get("COURSE_STRUCTURE_CACHE_SIZE", 1000))
+# Seconds before a cached structure is rebuilt even if its version still
+# matches; bounds staleness when the cache above is not shared by workers
+COURSE_STRUCTURE_CACHE_TTL = int(os.environ.get("COURSE_STRUCTURE_CACHE_TTL", 30))
+
+# Minimum seconds between request-triggered flushes of enrollment count deltas
+ENROLLMENT_COUNT_FLUSH_INTERVAL = int(
+    os.environ.get("ENROLLMENT_COUNT_FLUSH_INTERVAL", 10)
+)
+
+# Directory for lesson files kept by the "local" content storage
+CONTENT_STORAGE_ROOT = os.environ.get("CONTENT_STORAGE_ROOT") or str(
+    BASE_DIR / "media" / "content"
+)
+
+# S3-compatible storage for lesson files (credentials come from the AWS
+# environment variables or instance profile)
+AWS_STORAGE_BUCKET_NAME = os.environ.get("AWS_STORAGE_BUCKET_NAME", "")
+AWS_S3_REGION_NAME = os.environ.get("AWS_S3_REGION_NAME", "")
+AWS_S3_ENDPOINT_URL = os.environ.get("AWS_S3_ENDPOINT_URL", "")
+# Bytes held in memory per multipart upload part (S3 minimum is 5 MiB)
+S3_MULTIPART_CHUNK_SIZE = int(
+    os.environ.get("S3_MULTIPART_CHUNK_SIZE", 8 * 1024 * 1024)
+)
+S3_MAX_POOL_CONNECTIONS = int(os.environ.get("S3_MAX_POOL_CONNECTIONS", 20))
+# Seconds a presigned lesson file URL stays valid
+S3_URL_EXPIRY = int(os.environ.get("S3_URL_EXPIRY", 3600))
+
+# Constructor options per content storage type, overriding the settings above,
+# e.g. {"s3": {"bucket_name": "lessons", "chunk_size": 16 * 1024 * 1024}}.
+# One handler per type is built on first use and shared by every request.
+CONTENT_STORAGES = {"external_url": {}, "local": {}, "s3": {}}
+# Build the handlers (and their client pools) at startup instead of lazily
+CONTENT_STORAGE_WARM_UP = os.environ.get(
+    "CONTENT_STORAGE_WARM_UP", "False"
+).lower() in ("true", "1", "yes")
+
+# Seconds an unreferenced content blob is kept before gc_content_blobs may
+# delete it (covers saves that interned a blob but have not committed yet)
+CONTENT_BLOB_GC_GRACE_PERIOD = int(os.environ.get("CONTENT_BLOB_GC_GRACE_PERIOD", 3600))
+
+# Lesson bodies and transcripts of at least this many bytes are stored
+# zlib-compressed (0 keeps everything as plain text); see compress_lesson_content
+LESSON_COMPRESSION_THRESHOLD = int(os.environ.get("LESSON_COMPRESSION_THRESHOLD", 0))
+LESSON_COMPRESSION_LEVEL = int(os.environ.get("LESSON_COMPRESSION_LEVEL", 6))
+
+# Courses with more lessons than this are cloned by run_course_clone_jobs
+COURSE_CLONE_ASYNC_LESSONS = int(os.environ.get("COURSE_CLONE_ASYNC_LESSONS", 500))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -155,6 +223,8 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    "DEFAULT_PAGINATION_CLASS": "apps.common.pagination.KeysetPagination",
+    "PAGE_SIZE": 20,
 }
 
 # drf-spectacular settings
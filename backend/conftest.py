@@ -1,11 +1,30 @@
+from functools import partial
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def committed(django_capture_on_commit_callbacks):
+    """
+    `with committed():` runs the on-commit callbacks of the writes inside it,
+    as if their transaction had committed (a test's never does).
+    """
+    return partial(django_capture_on_commit_callbacks, execute=True)
+
+
 @pytest.fixture
 def user_data():
     return {
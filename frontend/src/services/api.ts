@@ -1,6 +1,31 @@
-import type { User, Course, EnrollmentProgress, EnrolledCourse, Enrollment } from '../types';
+import type {
+  User,
+  Course,
+  EnrollmentProgress,
+  EnrolledCourse,
+  Enrollment,
+  PaginatedResponse,
+} from '../types';
 import { apiClient, type ApiError } from './apiClient';
 
+// `next` links are absolute; strip everything up to the API root so the
+// client can prepend its own base URL.
+function toEndpoint(nextUrl: string): string {
+  const url = new URL(nextUrl);
+  return url.pathname.replace(/^.*?\/api(?=\/)/, '') + url.search;
+}
+
+async function getAllPages<T>(endpoint: string): Promise<T[]> {
+  const items: T[] = [];
+  let next: string | null = endpoint;
+  while (next) {
+    const page: PaginatedResponse<T> = await apiClient.get<PaginatedResponse<T>>(next);
+    items.push(...page.results);
+    next = page.next ? toEndpoint(page.next) : null;
+  }
+  return items;
+}
+
 interface EnrollmentStatusResponse {
   is_enrolled: boolean;
   enrollment?: Enrollment;
@@ -137,7 +162,7 @@ export const authApi = {
 
 export const courseApi = {
   getAllCourses: async (): Promise<Course[]> => {
-    return apiClient.get<Course[]>('/content/courses/');
+    return getAllPages<Course>('/content/courses/');
   },
 
   getCourseById: async (id: string): Promise<Course | null> => {
@@ -149,15 +174,15 @@ export const courseApi = {
   },
 
   searchCourses: async (query: string): Promise<Course[]> => {
-    return apiClient.get<Course[]>(`/content/courses/?search=${encodeURIComponent(query)}`);
+    return getAllPages<Course>(`/content/courses/?search=${encodeURIComponent(query)}`);
   },
 
   getCoursesByCategory: async (category: string): Promise<Course[]> => {
-    return apiClient.get<Course[]>(`/content/courses/?category=${encodeURIComponent(category)}`);
+    return getAllPages<Course>(`/content/courses/?category=${encodeURIComponent(category)}`);
   },
 
   getCategories: async (): Promise<string[]> => {
-    const categories = await apiClient.get<Array<{ id: number; name: string }>>('/content/categories/');
+    const categories = await getAllPages<{ id: number; name: string }>('/content/categories/');
     return categories.map(c => c.name);
   },
 };
@@ -223,7 +248,7 @@ export const enrollmentApi = {
   getEnrollments: async (status?: 'ongoing' | 'completed'): Promise<Enrollment[]> => {
     try {
       const query = status ? `?status=${status}` : '';
-      return await apiClient.get<Enrollment[]>(`/learning/enrollments/${query}`);
+      return await getAllPages<Enrollment>(`/learning/enrollments/${query}`);
     } catch {
       return [];
     }
@@ -312,7 +337,7 @@ import type { Topic, Category, ModuleFormData, LessonFormData, Module, Lesson }
 export const topicsApi = {
   getAll: async (search?: string): Promise<Topic[]> => {
     const query = search ? `?search=${encodeURIComponent(search)}` : '';
-    return apiClient.get<Topic[]>(`/content/topics/${query}`);
+    return getAllPages<Topic>(`/content/topics/${query}`);
   },
 
   getById: async (id: string): Promise<Topic> => {
@@ -322,7 +347,7 @@ export const topicsApi = {
 
 export const categoriesApi = {
   getAll: async (): Promise<Category[]> => {
-    return apiClient.get<Category[]>('/content/categories/');
+    return getAllPages<Category>('/content/categories/');
   },
 };
 
@@ -340,7 +365,7 @@ export const instructorCoursesApi = {
     if (filters?.topics) params.append('topics', filters.topics);
 
     const query = params.toString() ? `?${params.toString()}` : '';
-    return apiClient.get<Course[]>(`/content/instructor/courses/${query}`);
+    return getAllPages<Course>(`/content/instructor/courses/${query}`);
   },
 
   getById: async (id: string): Promise<Course> => {
@@ -213,9 +213,8 @@ export interface ApiError {
   errors?: Record<string, string[]>;
 }
 
+// Keyset-paginated list: follow `next` until it is null
 export interface PaginatedResponse<T> {
-  count: number;
   next: string | null;
-  previous: string | null;
   results: T[];
 }